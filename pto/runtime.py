@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
 import tempfile
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -148,6 +150,196 @@ def _write_pto_text(*, pto_text: str, out_pto: Path) -> Path:
     return out_pto
 
 
+# Kernel cache: set to a directory, or to "off" to always recompile.
+KERNEL_CACHE_ENV = "PTO_KERNEL_CACHE_DIR"
+_KERNEL_CACHE_FORMAT = 3
+_FILE_DIGESTS: dict[tuple[str, int, int], str] = {}
+_TREE_DIGESTS: dict[str, str] = {}
+_KERNEL_COMPILER: Any = None
+_KERNEL_COMPILER_LOCK = threading.Lock()
+
+
+def _ref_runtime_module(name: str) -> Any:
+    """Module from ref_runtime/python (object_cache, pto_compiler, elf_parser)."""
+    import importlib
+
+    p = os.fspath(repo_root() / "ref_runtime" / "python")
+    if p not in sys.path:
+        sys.path.insert(0, p)
+    return importlib.import_module(name)
+
+
+def kernel_cache_dir() -> Path | None:
+    return _ref_runtime_module("object_cache").cache_dir_from_env(
+        KERNEL_CACHE_ENV, Path.home() / ".cache" / "pto" / "kernels"
+    )
+
+
+def _file_digest(path: Path) -> str:
+    """Content hash of a file (memoized per path, size and mtime)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return "missing"
+    key = (os.fspath(path), st.st_size, st.st_mtime_ns)
+    if key not in _FILE_DIGESTS:
+        import hashlib
+
+        _FILE_DIGESTS[key] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return _FILE_DIGESTS[key]
+
+
+def _tree_digest(root: Path) -> str:
+    """Hash of the paths and contents of all headers under `root` (once per process)."""
+    key = os.fspath(root)
+    if key not in _TREE_DIGESTS:
+        import hashlib
+
+        h = hashlib.sha256()
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for fname in sorted(filenames):
+                fpath = Path(dirpath) / fname
+                h.update(os.fsencode(os.fspath(fpath.relative_to(root))))
+                h.update(_file_digest(fpath).encode())
+        _TREE_DIGESTS[key] = h.hexdigest()
+    return _TREE_DIGESTS[key]
+
+
+def _device_compiler_digest() -> str:
+    home = os.environ.get("ASCEND_HOME_PATH", "").strip()
+    return _file_digest(Path(home) / "bin" / "ccec") if home else "no-ccec"
+
+
+def _kernel_compiler() -> Any:
+    """
+    Shared PTOCompiler for kernel device objects. Its own object cache is
+    off: the kernel cache already keeps the extracted binaries.
+    """
+    global _KERNEL_COMPILER
+    with _KERNEL_COMPILER_LOCK:
+        if _KERNEL_COMPILER is None:
+            compiler = _ref_runtime_module("pto_compiler").PTOCompiler(platform="a2a3")
+            compiler.object_cache = None
+            _KERNEL_COMPILER = compiler
+        return _KERNEL_COMPILER
+
+
+def kernel_cache_key(*, pto_text: str, cfg: PtoasConfig, pto_isa_root: Path) -> str:
+    """
+    Key of a generated kernel `.cpp`: PTO-AS text, the `PtoasConfig` fields
+    that affect the generated C++, the `ptoas` binary and the PTO-ISA headers.
+    """
+    import hashlib
+
+    h = hashlib.sha256()
+    h.update(f"format={_KERNEL_CACHE_FORMAT}".encode())
+    h.update(
+        f"memory_model={cfg.memory_model};insert_sync={cfg.enable_insert_sync};"
+        f"unified_abi={cfg.rewrite_unified_abi}".encode()
+    )
+    ptoas = Path(cfg.ptoas)
+    if not ptoas.is_file():
+        import shutil
+
+        ptoas = Path(shutil.which(os.fspath(ptoas)) or ptoas)
+    h.update(_file_digest(ptoas).encode())
+    h.update(_file_digest(Path(__file__)).encode())  # C++ post-processing
+    h.update(_tree_digest(Path(pto_isa_root) / "include").encode())
+    h.update(pto_text.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _resolve_pto(pto: Path | str | Any) -> tuple[Path | None, str]:
+    """(path of an existing .pto file or None, PTO-AS text)."""
+    if isinstance(pto, Path):
+        return pto, pto.read_text(encoding="utf-8")
+    if isinstance(pto, str):
+        maybe_path = Path(pto)
+        if maybe_path.exists():
+            return maybe_path, maybe_path.read_text(encoding="utf-8")
+        return None, pto
+    pto_text = getattr(pto, "pto", None)
+    if not isinstance(pto_text, str):
+        raise TypeError("pto must be a Path, PTO-AS text, or an object with a .pto string")
+    return None, pto_text
+
+
+def _loads_binaries(runner: Any) -> bool:
+    return bool(getattr(runner, "supports_kernel_binaries", lambda: False)())
+
+
+def _build_kernel(
+    *,
+    func_id: int,
+    pto: Path | str | Any,
+    out_dir: Path | None,
+    pto_isa_root: Path,
+    ptoas_cfg: PtoasConfig,
+    use_cache: bool,
+    core_type: int | None = None,
+) -> tuple[Path, bytes | None]:
+    """
+    Produce the kernel's CCE C++ and, given a `core_type`, its device binary
+    (the `.text` section of the compiled object), from the cache if possible.
+    Does not touch the runner, so several kernels can be built concurrently.
+
+    Returns (cpp path, binary or None).
+    """
+    pto_path, pto_text = _resolve_pto(pto)
+
+    cache_dir = kernel_cache_dir() if use_cache else None
+    entry: Path | None = None
+    if cache_dir is not None:
+        key = kernel_cache_key(pto_text=pto_text, cfg=ptoas_cfg, pto_isa_root=pto_isa_root)
+        entry = cache_dir / key[:2] / key
+
+    cached_cpp = entry / "kernel.cpp" if entry is not None else None
+    if cached_cpp is not None and cached_cpp.is_file():
+        if out_dir is None:
+            out_cpp = cached_cpp
+        else:
+            out_cpp = out_dir / f"kernel_{func_id}.cpp"
+            out_dir.mkdir(parents=True, exist_ok=True)
+            out_cpp.write_bytes(cached_cpp.read_bytes())
+    else:
+        if out_dir is None:
+            out_dir = Path(tempfile.mkdtemp(prefix="pto_runtime_"))
+        if pto_path is None:
+            pto_path = _write_pto_text(pto_text=pto_text, out_pto=out_dir / f"kernel_{func_id}.pto")
+        out_cpp = out_dir / f"kernel_{func_id}.cpp"
+        compile_pto_to_cce_cpp(pto_path=pto_path, out_cpp=out_cpp, cfg=ptoas_cfg)
+        if cached_cpp is not None:
+            _ref_runtime_module("object_cache").write_atomic(cached_cpp, out_cpp.read_bytes())
+
+    if core_type is None:
+        return out_cpp, None
+
+    # The binary also depends on the device compiler and the core type.
+    core = "aic" if int(core_type) == 0 else "aiv"
+    cached_bin = entry / f"kernel.{core}.{_device_compiler_digest()[:16]}.bin" if entry is not None else None
+    if cached_bin is not None and cached_bin.is_file():
+        return out_cpp, cached_bin.read_bytes()
+    obj = _kernel_compiler().compile_incore(os.fspath(out_cpp), core_type=core, pto_isa_root=os.fspath(pto_isa_root))
+    binary = _ref_runtime_module("elf_parser").extract_text_section(obj)
+    if cached_bin is not None:
+        _ref_runtime_module("object_cache").write_atomic(cached_bin, binary)
+    return out_cpp, binary
+
+
+def _load_kernel(
+    *, runner: Any, func_id: int, cpp_path: Path, binary: bytes | None, pto_isa_root: Path, core_type: int
+) -> None:
+    if binary is None:
+        rc = int(runner.compile_and_load_kernel(int(func_id), os.fspath(cpp_path), os.fspath(pto_isa_root), int(core_type)))
+        if rc != 0:
+            raise RuntimeError(f"runtime compile_and_load_kernel failed (func_id={func_id}, rc={rc})")
+        return
+    rc = int(runner.load_kernel_binary(int(func_id), binary))
+    if rc != 0:
+        raise RuntimeError(f"runtime load_kernel_binary failed (func_id={func_id}, rc={rc})")
+
+
 def compile_and_load_kernel_from_pto(
     *,
     runner: Any,
@@ -156,6 +348,8 @@ def compile_and_load_kernel_from_pto(
     out_dir: Path | None = None,
     pto_isa_root: Path | None = None,
     ptoas_cfg: PtoasConfig | None = None,
+    core_type: int = 0,
+    use_cache: bool = True,
 ) -> Path:
     """
     Compile a PTO-AS program to CCE C++ via `ptoas`, then `compile_and_load_kernel(...)` via runtime.
@@ -164,34 +358,103 @@ def compile_and_load_kernel_from_pto(
     - a `.pto` file path
     - PTO-AS text
     - a `KernelSpec`-like object with `.pto` (string) attribute
+
+    If the runner can load prebuilt binaries (`supports_kernel_binaries`),
+    the kernel is compiled here with the device compiler and loaded with
+    `load_kernel_binary`; otherwise the runtime compiles it on load.
+
+    With `use_cache`, the generated `.cpp` and the device binary are kept
+    under $PTO_KERNEL_CACHE_DIR (default ~/.cache/pto/kernels; "off"
+    disables), keyed by `kernel_cache_key` plus the device compiler and core
+    type for the binary. A warm call then runs neither `ptoas` nor the device
+    compiler. Without `out_dir`, the cached `.cpp` is returned in place.
     """
-    if out_dir is None:
-        out_dir = Path(tempfile.mkdtemp(prefix="pto_runtime_"))
     if pto_isa_root is None:
         pto_isa_root = repo_root()
     if ptoas_cfg is None:
         ptoas_cfg = PtoasConfig()
 
-    # Resolve PTO input.
-    pto_path: Path
-    if isinstance(pto, Path):
-        pto_path = pto
-    elif isinstance(pto, str):
-        maybe_path = Path(pto)
-        if maybe_path.exists():
-            pto_path = maybe_path
-        else:
-            pto_path = _write_pto_text(pto_text=pto, out_pto=out_dir / f"kernel_{func_id}.pto")
-    else:
-        pto_text = getattr(pto, "pto", None)
-        if not isinstance(pto_text, str):
-            raise TypeError("pto must be a Path, PTO-AS text, or an object with a .pto string")
-        pto_path = _write_pto_text(pto_text=pto_text, out_pto=out_dir / f"kernel_{func_id}.pto")
+    out_cpp, binary = _build_kernel(
+        func_id=func_id,
+        pto=pto,
+        out_dir=out_dir,
+        pto_isa_root=pto_isa_root,
+        ptoas_cfg=ptoas_cfg,
+        use_cache=use_cache,
+        core_type=core_type if _loads_binaries(runner) else None,
+    )
+    _load_kernel(
+        runner=runner,
+        func_id=func_id,
+        cpp_path=out_cpp,
+        binary=binary,
+        pto_isa_root=pto_isa_root,
+        core_type=core_type,
+    )
+    return out_cpp
 
-    out_cpp = out_dir / f"kernel_{func_id}.cpp"
-    compile_pto_to_cce_cpp(pto_path=pto_path, out_cpp=out_cpp, cfg=ptoas_cfg)
 
-    rc = int(runner.compile_and_load_kernel(int(func_id), os.fspath(out_cpp), os.fspath(pto_isa_root)))
-    if rc != 0:
-        raise RuntimeError(f"runtime compile_and_load_kernel failed (func_id={func_id}, rc={rc})")
-    return out_cpp
+def compile_and_load_kernels_from_pto(
+    *,
+    runner: Any,
+    kernels: list[tuple[int, Path | str | Any, int]],
+    out_dir: Path | None = None,
+    pto_isa_root: Path | None = None,
+    ptoas_cfg: PtoasConfig | None = None,
+    use_cache: bool = True,
+    max_workers: int | None = None,
+) -> dict[int, Path]:
+    """
+    Batch form of `compile_and_load_kernel_from_pto` for `(func_id, pto, core_type)` entries.
+
+    `ptoas` and (when the runner loads binaries) the device compiler run
+    concurrently, at most `max_workers` (default: CPU count) at a time. Kernels are then loaded one by one in ascending func_id order,
+    so registration does not depend on which compile finished first. If any
+    kernel fails to build, nothing is loaded and the error of the lowest
+    failing func_id is raised.
+
+    Returns {func_id: cpp path}.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if pto_isa_root is None:
+        pto_isa_root = repo_root()
+    if ptoas_cfg is None:
+        ptoas_cfg = PtoasConfig()
+    ordered = sorted(((int(fid), pto, int(ct)) for fid, pto, ct in kernels), key=lambda k: k[0])
+    func_ids = [fid for fid, _, _ in ordered]
+    if len(set(func_ids)) != len(func_ids):
+        raise ValueError(f"duplicate func_ids in kernel batch: {func_ids}")
+    if not ordered:
+        return {}
+
+    binaries = _loads_binaries(runner)
+    workers = max(1, min(len(ordered), max_workers or os.cpu_count() or 1))
+    # Each job mostly waits on a ptoas / compiler child process, so threads suffice.
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pto-kernel-build") as pool:
+        futures = [
+            pool.submit(
+                _build_kernel,
+                func_id=fid,
+                pto=pto,
+                out_dir=out_dir,
+                pto_isa_root=pto_isa_root,
+                ptoas_cfg=ptoas_cfg,
+                use_cache=use_cache,
+                core_type=ct if binaries else None,
+            )
+            for fid, pto, ct in ordered
+        ]
+    for future in futures:
+        err = future.exception()
+        if err is not None:
+            raise err
+    built = [future.result() for future in futures]
+
+    out: dict[int, Path] = {}
+    for (fid, _, ct), (cpp_path, binary) in zip(ordered, built):
+        _load_kernel(
+            runner=runner, func_id=fid, cpp_path=cpp_path, binary=binary, pto_isa_root=pto_isa_root, core_type=ct
+        )
+        out[fid] = cpp_path
+    return out
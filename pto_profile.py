@@ -0,0 +1,417 @@
+"""
+Task profile analysis for graphs launched through `pto_runtime`.
+
+Joins a launch profile (`DeviceRunner.get_last_profile_array()` or
+`get_last_profile()`) with the graph's dependency edges and task names to
+separate kernel time from scheduling overhead:
+
+- critical path: the chain of tasks that determined the end of the launch,
+  split into kernel time and time spent waiting to be dispatched
+- per-core utilization and idle gaps, each gap split into time the next task
+  was still blocked on a dependency and time it was ready but not dispatched
+- scheduling latency per task (ready -> start, where "ready" is the end of the
+  last predecessor to finish)
+- per-func_id execution time statistics and histograms
+- Chrome trace / Perfetto JSON export
+
+All times are in profile ticks (the device counter) relative to the first task
+start; pass `ticks_per_us` to the trace export to get a wall-clock timeline.
+
+Usage:
+    runner.set_profile_enabled(True)
+    rt.run()
+    analysis = ProfileAnalysis.from_runtime(rt)
+    print(analysis.report())
+    analysis.export_chrome_trace("trace.json", ticks_per_us=50.0)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+
+from pto_runtime import profile_columns
+
+_CORE_TYPE_NAMES = {0: "AIC", 1: "AIV"}
+
+
+def _core_label(core_type: int, core_id: int) -> str:
+    return f"{_CORE_TYPE_NAMES.get(core_type, f'core{core_type}')}-{core_id}"
+
+
+@dataclass(frozen=True)
+class CriticalPath:
+    task_ids: tuple[int, ...]
+    # Sum of the path's task durations.
+    kernel_time: int
+    # Sum of ready -> start latencies along the path.
+    wait_time: int
+
+    @property
+    def length(self) -> int:
+        return self.kernel_time + self.wait_time
+
+
+@dataclass(frozen=True)
+class IdleGap:
+    core_type: int
+    core_id: int
+    start: int
+    end: int
+    # Task that ended the gap (None for the trailing gap).
+    next_task: Optional[int]
+    # Part of the gap during which `next_task` was not ready yet.
+    blocked: int
+
+    @property
+    def duration(self) -> int:
+        return self.end - self.start
+
+    @property
+    def dispatch(self) -> int:
+        """Part of the gap during which `next_task` was ready but not started."""
+        return self.duration - self.blocked
+
+
+@dataclass(frozen=True)
+class CoreUtilization:
+    core_type: int
+    core_id: int
+    num_tasks: int
+    busy: int
+    span: int
+    idle_gaps: tuple[IdleGap, ...]
+
+    @property
+    def name(self) -> str:
+        return _core_label(self.core_type, self.core_id)
+
+    @property
+    def utilization(self) -> float:
+        return self.busy / self.span if self.span > 0 else 0.0
+
+    @property
+    def idle(self) -> int:
+        return self.span - self.busy
+
+
+@dataclass(frozen=True)
+class FuncTimeStats:
+    func_id: int
+    count: int
+    total: int
+    mean: float
+    min: int
+    p50: float
+    p95: float
+    max: int
+    # np.histogram of the task durations.
+    counts: Any
+    bin_edges: Any
+
+
+class ProfileAnalysis:
+    """
+    Analysis of one launch profile.
+
+    Args:
+        profile: Structured array or list of `TaskProfileRecord`
+        edges: Dependency edges `(from_task, to_task)`, e.g. `Graph.edges()`.
+            Edges touching tasks missing from the profile are ignored.
+        task_names: Optional `{task_id: name}` (`OrchestrationRuntime.get_task_name_map()`)
+    """
+
+    def __init__(
+        self,
+        profile: Any,
+        edges: Iterable[tuple[int, int]] = (),
+        task_names: Optional[dict[int, str]] = None,
+    ) -> None:
+        cols = profile_columns(profile)
+        self.task_ids = cols["task_id"].astype(np.int64)
+        self.func_ids = cols["func_id"].astype(np.int64)
+        self.core_types = cols["exec_core_type"].astype(np.int64)
+        self.core_ids = cols["exec_core_id"].astype(np.int64)
+        start = cols["start_time"].astype(np.int64)
+        end = cols["end_time"].astype(np.int64)
+        self.origin = int(start.min()) if start.size else 0
+        self.start = start - self.origin
+        self.end = end - self.origin
+        self.task_names = dict(task_names or {})
+
+        # Row of each task id; predecessor lists by row.
+        self._row = {int(t): i for i, t in enumerate(self.task_ids.tolist())}
+        self._preds: list[list[int]] = [[] for _ in range(self.task_ids.size)]
+        for a, b in edges:
+            ra, rb = self._row.get(int(a)), self._row.get(int(b))
+            if ra is not None and rb is not None:
+                self._preds[rb].append(ra)
+
+        # Ready time: end of the last predecessor, or the launch start for roots.
+        self.ready = np.zeros_like(self.start)
+        for i, preds in enumerate(self._preds):
+            if preds:
+                self.ready[i] = self.end[preds].max()
+
+    @classmethod
+    def from_runtime(cls, rt: Any, profile: Any = None) -> "ProfileAnalysis":
+        """Analyze the last launch of an `OrchestrationRuntime`."""
+        if profile is None:
+            profile = rt.runner.get_last_profile_array()
+        return cls(profile, edges=rt.graph.edges(), task_names=rt.get_task_name_map())
+
+    def __len__(self) -> int:
+        return int(self.task_ids.size)
+
+    def task_name(self, task_id: int) -> str:
+        name = self.task_names.get(int(task_id))
+        if name is not None:
+            return name
+        return f"func{int(self.func_ids[self._row[int(task_id)]])}"
+
+    @property
+    def durations(self) -> Any:
+        return self.end - self.start
+
+    @property
+    def makespan(self) -> int:
+        return int(self.end.max()) if self.end.size else 0
+
+    def scheduling_latency(self) -> Any:
+        """Per-task ready -> start latency, in profile row order."""
+        return self.start - self.ready
+
+    # -- Critical path ---------------------------------------------------------
+
+    def critical_path(self) -> CriticalPath:
+        """
+        Chain of tasks that determined the end of the launch: starting from the
+        last task to finish, repeatedly step to the predecessor that finished
+        last (the one that made the task ready).
+        """
+        if not len(self):
+            return CriticalPath((), 0, 0)
+        row = int(np.argmax(self.end))
+        path = [row]
+        while self._preds[row]:
+            preds = self._preds[row]
+            row = preds[int(np.argmax(self.end[preds]))]
+            path.append(row)
+        path.reverse()
+        rows = np.asarray(path)
+        return CriticalPath(
+            task_ids=tuple(int(t) for t in self.task_ids[rows].tolist()),
+            kernel_time=int(self.durations[rows].sum()),
+            wait_time=int((self.start[rows] - self.ready[rows]).sum()),
+        )
+
+    def dependency_bound(self) -> int:
+        """
+        Longest duration-weighted path through the graph: the makespan with
+        unlimited cores and zero dispatch overhead.
+        """
+        finish = np.zeros_like(self.end)
+        dur = self.durations
+        for i in self._topological_rows():
+            preds = self._preds[i]
+            finish[i] = dur[i] + (finish[preds].max() if preds else 0)
+        return int(finish.max()) if finish.size else 0
+
+    def _topological_rows(self) -> list[int]:
+        n = len(self)
+        succs: list[list[int]] = [[] for _ in range(n)]
+        indegree = [0] * n
+        for b, preds in enumerate(self._preds):
+            for a in preds:
+                succs[a].append(b)
+                indegree[b] += 1
+        order = [i for i in range(n) if indegree[i] == 0]
+        for i in order:
+            for b in succs[i]:
+                indegree[b] -= 1
+                if indegree[b] == 0:
+                    order.append(b)
+        if len(order) != n:
+            raise ValueError("dependency cycle in profile edges")
+        return order
+
+    # -- Cores -----------------------------------------------------------------
+
+    def core_utilization(self) -> list[CoreUtilization]:
+        """Busy time and idle gaps of every core that ran at least one task."""
+        span = self.makespan
+        out: list[CoreUtilization] = []
+        keys = sorted(set(zip(self.core_types.tolist(), self.core_ids.tolist())))
+        for core_type, core_id in keys:
+            rows = np.flatnonzero((self.core_types == core_type) & (self.core_ids == core_id))
+            rows = rows[np.argsort(self.start[rows], kind="stable")]
+            gaps: list[IdleGap] = []
+            t = 0
+            for r in rows.tolist():
+                s = int(self.start[r])
+                if s > t:
+                    blocked = min(max(int(self.ready[r]) - t, 0), s - t)
+                    gaps.append(IdleGap(core_type, core_id, t, s, int(self.task_ids[r]), blocked))
+                t = max(t, int(self.end[r]))
+            if span > t:
+                gaps.append(IdleGap(core_type, core_id, t, span, None, 0))
+            out.append(
+                CoreUtilization(
+                    core_type=core_type,
+                    core_id=core_id,
+                    num_tasks=int(rows.size),
+                    busy=int(self.durations[rows].sum()),
+                    span=span,
+                    idle_gaps=tuple(gaps),
+                )
+            )
+        return out
+
+    # -- Kernels ---------------------------------------------------------------
+
+    def func_time_stats(self, bins: Union[int, str] = 20) -> dict[int, FuncTimeStats]:
+        """Execution time statistics and a duration histogram per func_id."""
+        dur = self.durations
+        out: dict[int, FuncTimeStats] = {}
+        for fid in np.unique(self.func_ids).tolist():
+            d = dur[self.func_ids == fid]
+            counts, bin_edges = np.histogram(d, bins=bins)
+            out[int(fid)] = FuncTimeStats(
+                func_id=int(fid),
+                count=int(d.size),
+                total=int(d.sum()),
+                mean=float(d.mean()),
+                min=int(d.min()),
+                p50=float(np.percentile(d, 50)),
+                p95=float(np.percentile(d, 95)),
+                max=int(d.max()),
+                counts=counts,
+                bin_edges=bin_edges,
+            )
+        return out
+
+    # -- Summary ---------------------------------------------------------------
+
+    def summary(self) -> dict[str, Any]:
+        cores = self.core_utilization()
+        latency = self.scheduling_latency()
+        path = self.critical_path()
+        busy = sum(c.busy for c in cores)
+        capacity = self.makespan * len(cores)
+        return {
+            "tasks": len(self),
+            "cores": len(cores),
+            "makespan": self.makespan,
+            "dependency_bound": self.dependency_bound(),
+            "critical_path_tasks": len(path.task_ids),
+            "critical_path_kernel_time": path.kernel_time,
+            "critical_path_wait_time": path.wait_time,
+            "mean_utilization": busy / capacity if capacity > 0 else 0.0,
+            "sched_latency_mean": float(latency.mean()) if latency.size else 0.0,
+            "sched_latency_p95": float(np.percentile(latency, 95)) if latency.size else 0.0,
+            "sched_latency_max": int(latency.max()) if latency.size else 0,
+            "idle_blocked": sum(g.blocked for c in cores for g in c.idle_gaps),
+            "idle_dispatch": sum(g.dispatch for c in cores for g in c.idle_gaps if g.next_task is not None),
+        }
+
+    def report(self, top: int = 10) -> str:
+        """Human-readable summary; `top` limits the per-func and per-core tables."""
+        s = self.summary()
+        lines = [
+            f"Tasks: {s['tasks']} on {s['cores']} cores, makespan {s['makespan']} ticks "
+            f"(dependency bound {s['dependency_bound']})",
+            f"Critical path: {s['critical_path_tasks']} tasks, "
+            f"kernel {s['critical_path_kernel_time']}, wait {s['critical_path_wait_time']}",
+            f"Scheduling latency: mean {s['sched_latency_mean']:.1f}, "
+            f"p95 {s['sched_latency_p95']:.1f}, max {s['sched_latency_max']}",
+            f"Idle: {s['idle_blocked']} blocked on dependencies, {s['idle_dispatch']} ready but not dispatched",
+            f"Mean core utilization: {s['mean_utilization']:.1%}",
+            "",
+            f"{'func_id':>8} {'count':>7} {'total':>12} {'mean':>10} {'p95':>10} {'max':>10}",
+        ]
+        funcs = sorted(self.func_time_stats().values(), key=lambda f: -f.total)
+        for f in funcs[:top]:
+            lines.append(f"{f.func_id:>8} {f.count:>7} {f.total:>12} {f.mean:>10.1f} {f.p95:>10.1f} {f.max:>10}")
+        lines += ["", f"{'core':>8} {'tasks':>7} {'busy':>12} {'util':>7} {'gaps':>6}"]
+        for c in sorted(self.core_utilization(), key=lambda c: c.utilization)[:top]:
+            lines.append(f"{c.name:>8} {c.num_tasks:>7} {c.busy:>12} {c.utilization:>7.1%} {len(c.idle_gaps):>6}")
+        return "\n".join(lines)
+
+    # -- Trace export ----------------------------------------------------------
+
+    def chrome_trace(self, *, ticks_per_us: float = 1.0, flows: bool = True) -> dict[str, Any]:
+        """
+        Chrome trace / Perfetto JSON: one process per core type, one thread per
+        core, one complete event per task, and (with `flows`) an arrow along
+        every dependency edge.
+        """
+        scale = 1.0 / float(ticks_per_us)
+        events: list[dict[str, Any]] = []
+        for core_type in sorted(set(self.core_types.tolist())):
+            label = _CORE_TYPE_NAMES.get(core_type, f"core{core_type}")
+            events.append({"name": "process_name", "ph": "M", "pid": core_type, "args": {"name": f"{label} cores"}})
+        for core_type, core_id in sorted(set(zip(self.core_types.tolist(), self.core_ids.tolist()))):
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": core_type,
+                    "tid": core_id,
+                    "args": {"name": _core_label(core_type, core_id)},
+                }
+            )
+
+        latency = self.scheduling_latency()
+        for i, tid in enumerate(self.task_ids.tolist()):
+            events.append(
+                {
+                    "name": self.task_name(tid),
+                    "cat": "task",
+                    "ph": "X",
+                    "ts": float(self.start[i]) * scale,
+                    "dur": float(self.end[i] - self.start[i]) * scale,
+                    "pid": int(self.core_types[i]),
+                    "tid": int(self.core_ids[i]),
+                    "args": {"task_id": tid, "func_id": int(self.func_ids[i]), "sched_latency": int(latency[i])},
+                }
+            )
+
+        if flows:
+            flow_id = 0
+            for b, preds in enumerate(self._preds):
+                for a in preds:
+                    common = {"name": "dep", "cat": "dependency", "id": flow_id}
+                    events.append(
+                        dict(common, ph="s", ts=float(self.end[a]) * scale,
+                             pid=int(self.core_types[a]), tid=int(self.core_ids[a]))
+                    )
+                    events.append(
+                        dict(common, ph="f", bp="e", ts=float(self.start[b]) * scale,
+                             pid=int(self.core_types[b]), tid=int(self.core_ids[b]))
+                    )
+                    flow_id += 1
+        return {"traceEvents": events, "displayTimeUnit": "ns"}
+
+    def export_chrome_trace(
+        self,
+        path: Union[str, os.PathLike[str]],
+        *,
+        ticks_per_us: float = 1.0,
+        flows: bool = True,
+    ) -> None:
+        """Write `chrome_trace()` to `path` (open in chrome://tracing or ui.perfetto.dev)."""
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(ticks_per_us=ticks_per_us, flows=flows), f)
+
+
+__all__ = [
+    "CoreUtilization",
+    "CriticalPath",
+    "FuncTimeStats",
+    "IdleGap",
+    "ProfileAnalysis",
+]
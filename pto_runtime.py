@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import bisect
 import ctypes
+import itertools
 import os
 import secrets
 import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, ClassVar, Optional, Union
@@ -23,6 +28,9 @@ def _ensure_ref_runtime_python_on_path() -> None:
 
 _LIB: Optional[ctypes.CDLL] = None
 _LIB_PATH: Optional[Path] = None
+# Private host library copies of per-device runners, by slot (see _load_device_lib).
+_DEVICE_LIBS: dict[int, ctypes.CDLL] = {}
+_DEVICE_LIBS_LOCK = threading.Lock()
 _COMPILER: Optional[Any] = None
 _AICPU_BINARY: Optional[bytes] = None
 _AICORE_BINARY: Optional[bytes] = None
@@ -63,6 +71,102 @@ def _read_binary_blob(spec: Union[None, str, os.PathLike[str], bytes, bytearray,
     return Path(spec).read_bytes()
 
 
+# Runtime binary cache: set to a directory, or to "off" to always rebuild.
+BINARY_CACHE_ENV = "PTO_RUNTIME_CACHE_DIR"
+_BINARY_CACHE_FORMAT = 1
+_SOURCE_SUFFIXES = (".h", ".hpp", ".c", ".cc", ".cpp", ".inc", ".s", ".S", ".cmake", ".txt")
+_TOOL_VERSIONS: dict[str, str] = {}
+
+
+def _binary_cache_dir() -> Optional[Path]:
+    _ensure_ref_runtime_python_on_path()
+    from object_cache import cache_dir_from_env  # type: ignore
+
+    return cache_dir_from_env(BINARY_CACHE_ENV, Path.home() / ".cache" / "pto" / "runtime_binaries")
+
+
+def _tool_version(tool: str) -> str:
+    """First line of `<tool> --version` (cached per process)."""
+    if tool not in _TOOL_VERSIONS:
+        import subprocess
+
+        try:
+            out = subprocess.run([tool, "--version"], capture_output=True, text=True, timeout=30)
+            lines = (out.stdout or out.stderr).splitlines()
+            _TOOL_VERSIONS[tool] = lines[0].strip() if lines else ""
+        except (OSError, subprocess.SubprocessError):
+            _TOOL_VERSIONS[tool] = ""
+    return _TOOL_VERSIONS[tool]
+
+
+def _hash_tree(h: Any, root: str) -> None:
+    """Fold the paths and contents of all source files under `root` into `h`."""
+    root_path = Path(root)
+    h.update(os.fsencode(os.path.abspath(root)))
+    if not root_path.is_dir():
+        return
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        dirnames.sort()
+        for fname in sorted(filenames):
+            if not fname.endswith(_SOURCE_SUFFIXES):
+                continue
+            fpath = Path(dirpath) / fname
+            h.update(os.fsencode(str(fpath.relative_to(root_path))))
+            h.update(fpath.read_bytes())
+
+
+def _binary_cache_key(compiler: Any, target: str, include_dirs: list[str], source_dirs: list[str]) -> str:
+    """Digest of the sources, include dirs, toolchain and build flags of a runtime binary."""
+    import hashlib
+
+    toolchain = getattr(compiler, f"{target}_toolchain")
+    h = hashlib.sha256()
+    h.update(f"format={_BINARY_CACHE_FORMAT};platform={compiler.platform};target={target}".encode())
+    h.update(toolchain.get_binary_name().encode())
+    h.update(toolchain.gen_cmake_args(include_dirs, source_dirs).encode())
+    for attr in ("cc", "cxx", "ld"):
+        tool = getattr(toolchain, attr, None)
+        if tool:
+            h.update(_tool_version(tool).encode())
+    for root in [toolchain.get_root_dir(), *include_dirs, *source_dirs]:
+        _hash_tree(h, root)
+    return h.hexdigest()
+
+
+def _compile_cached(compiler: Any, target: str, include_dirs: list[str], source_dirs: list[str]) -> Path:
+    """
+    Path of the runtime binary for `target`, built with BinaryCompiler on a cache miss.
+
+    Artifacts are stored under $PTO_RUNTIME_CACHE_DIR (default
+    ~/.cache/pto/runtime_binaries), keyed by a hash of the source trees,
+    include dirs, toolchain versions and CMake arguments. Writes are atomic,
+    so concurrent worker processes can share the directory. With the cache
+    disabled, the binary goes to a fresh temp file.
+    """
+    toolchain = getattr(compiler, f"{target}_toolchain")
+    suffix = Path(toolchain.get_binary_name()).suffix or ".bin"
+    cache_dir = _binary_cache_dir()
+
+    path = None
+    if cache_dir is not None:
+        key = _binary_cache_key(compiler, target, include_dirs, source_dirs)
+        path = cache_dir / f"{target}-{key}{suffix}"
+        if path.is_file():
+            return path
+
+    binary = compiler.compile(target, include_dirs, source_dirs)
+    if path is None:
+        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix, prefix=f"pto_{target}_runtime_")
+        tmp.write(binary)
+        tmp.close()
+        return Path(tmp.name)
+
+    from object_cache import write_atomic  # type: ignore
+
+    write_atomic(path, binary)
+    return path
+
+
 def _ensure_device_binaries() -> tuple[bytes, bytes]:
     global _AICPU_BINARY, _AICORE_BINARY
     if _AICPU_BINARY is not None and _AICORE_BINARY is not None:
@@ -73,8 +177,8 @@ def _ensure_device_binaries() -> tuple[bytes, bytes]:
     graph_sources = [str(_repo_root() / "ref_runtime" / "src" / "runtime" / "graph")]
 
     try:
-        aicore_binary = compiler.compile("aicore", include_dirs, graph_sources)
-        aicpu_binary = compiler.compile("aicpu", include_dirs, graph_sources)
+        aicore_binary = _compile_cached(compiler, "aicore", include_dirs, graph_sources).read_bytes()
+        aicpu_binary = _compile_cached(compiler, "aicpu", include_dirs, graph_sources).read_bytes()
     except Exception as exc:  # pragma: no cover
         where = os.environ.get("ASCEND_HOME_PATH", "").strip()
         hint = (
@@ -102,7 +206,8 @@ def _load_lib() -> ctypes.CDLL:
             str(_repo_root() / "ref_runtime" / "src" / "runtime" / "graph"),
             str(_repo_root() / "ref_runtime" / "src" / "runtime" / "host"),
         ]
-        host_binary = compiler.compile("host", include_dirs, source_dirs)
+        # Cached artifacts are dlopen'ed in place; no temp copy is needed.
+        _LIB_PATH = _compile_cached(compiler, "host", include_dirs, source_dirs)
     except Exception as exc:  # pragma: no cover
         where = os.environ.get("ASCEND_HOME_PATH", "").strip()
         hint = (
@@ -113,26 +218,45 @@ def _load_lib() -> ctypes.CDLL:
             hint += f" (ASCEND_HOME_PATH={where})"
         raise ImportError(f"pto_runtime: failed to build host runtime. {hint}") from exc
 
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".so", prefix="pto_host_runtime_")
-    tmp.write(host_binary)
-    tmp.flush()
-    tmp.close()
-    _LIB_PATH = Path(tmp.name)
-
     lib = ctypes.CDLL(str(_LIB_PATH))
     _bind_ctypes_signatures(lib)
     _LIB = lib
     return lib
 
 
-def _bind_ctypes_signatures(lib: ctypes.CDLL) -> None:
+def _load_device_lib(slot: int) -> ctypes.CDLL:
+    """
+    Host library for runner slot `slot`: slot 0 is the process-wide library,
+    other slots load a private copy so their native singletons are separate.
+
+    The copy must be a distinct file: the dynamic loader returns the already
+    loaded object for the same path or inode.
+    """
+    if slot == 0:
+        return _load_lib()
+    with _DEVICE_LIBS_LOCK:
+        lib = _DEVICE_LIBS.get(slot)
+        if lib is not None:
+            return lib
+        _load_lib()
+        assert _LIB_PATH is not None
+        _ensure_ref_runtime_python_on_path()
+        from object_cache import write_atomic  # type: ignore
+
+        path = _LIB_PATH.with_name(f"{_LIB_PATH.stem}.slot{slot}{_LIB_PATH.suffix}")
+        if not path.is_file() or path.stat().st_size != _LIB_PATH.stat().st_size:
+            write_atomic(path, _LIB_PATH.read_bytes())
+        lib = ctypes.CDLL(str(path))
+        _bind_ctypes_signatures(lib)
+        _DEVICE_LIBS[slot] = lib
+        return lib
+
+
+def _bind_graph_signatures(lib: ctypes.CDLL) -> None:
+    """Graph_* entry points (host_build_graph/host/graph_c_api.cpp)."""
     c_int = ctypes.c_int
-    c_size_t = ctypes.c_size_t
     c_void_p = ctypes.c_void_p
-    c_uint8 = ctypes.c_uint8
-    c_uint32 = ctypes.c_uint32
     c_uint64 = ctypes.c_uint64
-    c_char_p = ctypes.c_char_p
 
     lib.Graph_Create.argtypes = []
     lib.Graph_Create.restype = c_void_p
@@ -145,6 +269,48 @@ def _bind_ctypes_signatures(lib: ctypes.CDLL) -> None:
     lib.Graph_GetTaskCount.argtypes = [c_void_p]
     lib.Graph_GetTaskCount.restype = c_int
 
+    # Batch entry points are optional: host runtimes built before they existed
+    # do not export them, and Graph falls back to per-task calls.
+    if hasattr(lib, "Graph_AddTasks"):
+        lib.Graph_AddTasks.argtypes = [
+            c_void_p,
+            ctypes.POINTER(c_uint64),
+            c_int,
+            c_int,
+            ctypes.POINTER(c_int),
+            ctypes.POINTER(c_int),
+        ]
+        lib.Graph_AddTasks.restype = c_int
+    if hasattr(lib, "Graph_AddSuccessors"):
+        lib.Graph_AddSuccessors.argtypes = [c_void_p, ctypes.POINTER(c_int), ctypes.POINTER(c_int), c_int]
+        lib.Graph_AddSuccessors.restype = c_int
+    if hasattr(lib, "Graph_SetTaskArgs"):
+        lib.Graph_SetTaskArgs.argtypes = [
+            c_void_p,
+            ctypes.POINTER(c_int),
+            ctypes.POINTER(c_int),
+            ctypes.POINTER(c_uint64),
+            c_int,
+        ]
+        lib.Graph_SetTaskArgs.restype = c_int
+    if hasattr(lib, "Graph_ReduceEdges"):
+        lib.Graph_ReduceEdges.argtypes = [c_void_p, c_int, ctypes.POINTER(c_int)]
+        lib.Graph_ReduceEdges.restype = c_int
+    if hasattr(lib, "Graph_ResetForReplay"):
+        lib.Graph_ResetForReplay.argtypes = [c_void_p]
+        lib.Graph_ResetForReplay.restype = c_int
+
+
+def _bind_ctypes_signatures(lib: ctypes.CDLL) -> None:
+    c_int = ctypes.c_int
+    c_size_t = ctypes.c_size_t
+    c_void_p = ctypes.c_void_p
+    c_uint8 = ctypes.c_uint8
+    c_uint64 = ctypes.c_uint64
+    c_char_p = ctypes.c_char_p
+
+    _bind_graph_signatures(lib)
+
     lib.DeviceRunner_Init.argtypes = [
         c_int,
         ctypes.POINTER(c_uint8),
@@ -164,6 +330,13 @@ def _bind_ctypes_signatures(lib: ctypes.CDLL) -> None:
     lib.DeviceRunner_CopyFromDevice.argtypes = [c_void_p, c_void_p, c_size_t]
     lib.DeviceRunner_CopyFromDevice.restype = c_int
 
+    # Pinned host memory for async copy staging (optional; pageable memory otherwise).
+    if hasattr(lib, "DeviceRunner_AllocHostPinned") and hasattr(lib, "DeviceRunner_FreeHostPinned"):
+        lib.DeviceRunner_AllocHostPinned.argtypes = [c_size_t]
+        lib.DeviceRunner_AllocHostPinned.restype = c_void_p
+        lib.DeviceRunner_FreeHostPinned.argtypes = [c_void_p]
+        lib.DeviceRunner_FreeHostPinned.restype = None
+
     lib.DeviceRunner_Run.argtypes = [c_void_p, c_int, c_int]
     lib.DeviceRunner_Run.restype = c_int
     lib.DeviceRunner_PrintHandshakeResults.argtypes = [c_void_p]
@@ -177,29 +350,77 @@ def _bind_ctypes_signatures(lib: ctypes.CDLL) -> None:
     lib.DeviceRunner_HasLastProfile.restype = c_int
 
     class _PtoTaskProfileRecord(ctypes.Structure):
-        _fields_ = [
-            ("task_id", c_int),
-            ("func_id", c_int),
-            ("core_type", c_int),
-            ("exec_core_id", c_uint32),
-            ("exec_core_type", c_uint32),
-            ("exec_phys_core_id", c_uint32),
-            ("start_time", c_uint64),
-            ("end_time", c_uint64),
-            ("pmu_cnt", c_uint32 * 8),
-        ]
+        _fields_ = _PROFILE_FIELDS
 
     lib._PtoTaskProfileRecord = _PtoTaskProfileRecord  # type: ignore[attr-defined]
     lib.DeviceRunner_GetLastProfile.argtypes = [ctypes.POINTER(_PtoTaskProfileRecord), c_int]
     lib.DeviceRunner_GetLastProfile.restype = c_int
 
+    # Binds the runner's device to the calling thread (optional; see DeviceRunner._submit_copy).
+    if hasattr(lib, "DeviceRunner_BindDevice"):
+        lib.DeviceRunner_BindDevice.argtypes = [c_int]
+        lib.DeviceRunner_BindDevice.restype = c_int
+
     lib.DeviceRunner_CompileAndLoadKernel.argtypes = [c_int, c_char_p, c_int]
     lib.DeviceRunner_CompileAndLoadKernel.restype = c_int
-
+    # Loads a prebuilt kernel binary, so kernel objects can be cached (optional).
+    if hasattr(lib, "DeviceRunner_LoadKernelBinary"):
+        lib.DeviceRunner_LoadKernelBinary.argtypes = [c_int, ctypes.POINTER(c_uint8), c_size_t]
+        lib.DeviceRunner_LoadKernelBinary.restype = c_int
     lib.DeviceRunner_Finalize.argtypes = []
     lib.DeviceRunner_Finalize.restype = c_int
 
 
+# Mirror of the native _PtoTaskProfileRecord layout (see _bind_ctypes_signatures).
+_PROFILE_FIELDS = [
+    ("task_id", ctypes.c_int),
+    ("func_id", ctypes.c_int),
+    ("core_type", ctypes.c_int),
+    ("exec_core_id", ctypes.c_uint32),
+    ("exec_core_type", ctypes.c_uint32),
+    ("exec_phys_core_id", ctypes.c_uint32),
+    ("start_time", ctypes.c_uint64),
+    ("end_time", ctypes.c_uint64),
+    ("pmu_cnt", ctypes.c_uint32 * 8),
+]
+
+
+def profile_dtype() -> Any:
+    """NumPy structured dtype matching the native task profile record."""
+    import numpy as np
+
+    class _Record(ctypes.Structure):
+        _fields_ = _PROFILE_FIELDS
+
+    return np.dtype(_Record)
+
+
+def profile_columns(profile: Any) -> dict[str, Any]:
+    """
+    Split a profile (structured array or list of TaskProfileRecord) into
+    contiguous per-field columns; `pmu_cnt` becomes an [n x 8] uint32 matrix.
+    """
+    import numpy as np
+
+    if not isinstance(profile, np.ndarray):
+        arr = np.empty(len(profile), dtype=profile_dtype())
+        for name, _ in _PROFILE_FIELDS:
+            arr[name] = [getattr(r, name) for r in profile]
+        profile = arr
+    return {name: np.ascontiguousarray(profile[name]) for name in profile.dtype.names}
+
+
+def export_profile_npz(path: Union[str, os.PathLike[str]], profile: Any) -> None:
+    """
+    Save a profile as columnar NPZ: one array per field, the layout Arrow /
+    Parquet writers take directly (e.g. `pa.table(dict(np.load(path)))` after
+    splitting `pmu_cnt` into its columns).
+    """
+    import numpy as np
+
+    np.savez(path, **profile_columns(profile))
+
+
 @dataclass(frozen=True)
 class TaskProfileRecord:
     task_id: int
@@ -213,71 +434,588 @@ class TaskProfileRecord:
     pmu_cnt: tuple[int, ...]
 
 
+@dataclass(frozen=True)
+class EdgeReductionStats:
+    edges_before: int
+    edges_removed: int
+    exact: bool
+    seconds: float
+
+    @property
+    def edges_after(self) -> int:
+        return self.edges_before - self.edges_removed
+
+
+def _pack_task_arg(item: Any) -> int:
+    """Pack one task argument into its uint64 slot value."""
+    if isinstance(item, bool):
+        return int(item)
+    if isinstance(item, int):
+        return int(item) & 0xFFFFFFFFFFFFFFFF
+    if isinstance(item, float):
+        import struct
+
+        return int(struct.unpack("<I", struct.pack("<f", float(item)))[0])
+    raise TypeError(f"unsupported task arg type: {type(item)}")
+
+
+def pack_task_args(*columns: Any) -> Any:
+    """
+    Pack per-task argument columns into a [num_tasks x num_args] uint64 matrix
+    for `Graph.add_tasks`.
+
+    Each column is an array (one value per task) or a scalar broadcast to all
+    tasks. Floating-point columns are packed as float32 bit patterns and
+    integer/bool columns are reinterpreted as uint64, matching `Graph.add_task`.
+    """
+    import numpy as np
+
+    arrays = [np.asarray(c) for c in columns]
+    num_tasks = max((a.shape[0] for a in arrays if a.ndim > 0), default=1)
+    out = np.empty((num_tasks, len(arrays)), dtype=np.uint64)
+    for i, a in enumerate(arrays):
+        if a.ndim > 1:
+            raise ValueError(f"task arg column {i} must be 1-D, got shape {a.shape}")
+        if a.dtype.kind == "f":
+            a = a.astype(np.float32).view(np.uint32)
+        elif a.dtype.kind not in "biu":
+            raise TypeError(f"unsupported task arg dtype in column {i}: {a.dtype}")
+        out[:, i] = a.astype(np.int64).view(np.uint64) if a.dtype.kind == "i" else a
+    return out
+
+
 class Graph:
-    def __init__(self) -> None:
-        lib = _load_lib()
+    def __init__(self, runner: "DeviceRunner" | None = None) -> None:
+        # A graph is bound to the host library of the runner that launches it.
+        lib = runner._native() if runner is not None else _load_lib()
         handle = lib.Graph_Create()
         if not handle:
             raise RuntimeError("Graph_Create failed")
+        self._lib = lib
         self._handle = ctypes.c_void_p(handle)
+        # Edges as added (before any reduce_edges()), for profile analysis:
+        # int32 (from, to) array chunks, then single edges not yet packed.
+        self._edge_chunks: list[tuple[Any, Any]] = []
+        self._edge_tail: list[tuple[int, int]] = []
 
     @property
     def _ptr(self) -> ctypes.c_void_p:
         return self._handle
 
     def add_task(self, args: list[Any], *, func_id: int, core_type: int = 1) -> int:
-        lib = _load_lib()
+        lib = self._lib
         c_uint64 = ctypes.c_uint64
 
-        packed: list[int] = []
-        for item in args:
-            if isinstance(item, bool):
-                packed.append(int(item))
-            elif isinstance(item, int):
-                packed.append(int(item) & 0xFFFFFFFFFFFFFFFF)
-            elif isinstance(item, float):
-                import struct
-
-                bits = struct.unpack("<I", struct.pack("<f", float(item)))[0]
-                packed.append(int(bits))
-            else:
-                raise TypeError(f"unsupported task arg type: {type(item)}")
-
+        packed = [_pack_task_arg(item) for item in args]
         arr = (c_uint64 * len(packed))(*[c_uint64(x) for x in packed])
         return int(lib.Graph_AddTask(self._ptr, arr, int(len(packed)), int(func_id), int(core_type)))
 
+    def add_tasks(self, args: Any, *, func_ids: Any, core_types: Any = 1) -> range:
+        """
+        Add a batch of tasks with consecutive IDs in a single native call.
+
+        `args` is a [num_tasks x num_args] integer array of packed task args
+        (see `pack_task_args`); `func_ids` and `core_types` are per-task arrays
+        or scalars. Returns the range of the new task IDs.
+        """
+        lib = self._lib
+        import numpy as np
+
+        arg_mat = np.asarray(args)
+        if arg_mat.ndim != 2:
+            raise ValueError(f"add_tasks expects a 2-D arg matrix, got shape {arg_mat.shape}")
+        if arg_mat.dtype.kind not in "biu":
+            raise TypeError(f"add_tasks expects packed integer args, got {arg_mat.dtype}; use pack_task_args()")
+        if arg_mat.dtype != np.uint64:
+            arg_mat = arg_mat.astype(np.int64).view(np.uint64)
+        arg_mat = np.ascontiguousarray(arg_mat)
+
+        num_tasks, num_args = int(arg_mat.shape[0]), int(arg_mat.shape[1])
+        func_id_arr = np.ascontiguousarray(np.broadcast_to(np.asarray(func_ids, dtype=np.int32), (num_tasks,)))
+        core_type_arr = np.ascontiguousarray(np.broadcast_to(np.asarray(core_types, dtype=np.int32), (num_tasks,)))
+        if num_tasks == 0:
+            start = self.get_task_count()
+            return range(start, start)
+
+        c_uint64_p = ctypes.POINTER(ctypes.c_uint64)
+        c_int_p = ctypes.POINTER(ctypes.c_int)
+        if hasattr(lib, "Graph_AddTasks"):
+            first = int(
+                lib.Graph_AddTasks(
+                    self._ptr,
+                    arg_mat.ctypes.data_as(c_uint64_p),
+                    num_tasks,
+                    num_args,
+                    func_id_arr.ctypes.data_as(c_int_p),
+                    core_type_arr.ctypes.data_as(c_int_p),
+                )
+            )
+            if first < 0:
+                raise RuntimeError(f"Graph_AddTasks failed: rc={first}")
+            return range(first, first + num_tasks)
+
+        # Fallback: one FFI call per task, passing rows of the matrix in place.
+        base = int(arg_mat.ctypes.data)
+        row_bytes = num_args * arg_mat.itemsize
+        first = -1
+        for i, (fid, ct) in enumerate(zip(func_id_arr.tolist(), core_type_arr.tolist())):
+            row = ctypes.cast(base + i * row_bytes, c_uint64_p)
+            tid = int(lib.Graph_AddTask(self._ptr, row, num_args, fid, ct))
+            if tid < 0:
+                raise RuntimeError(f"Graph_AddTask failed for batch task {i}: rc={tid}")
+            if first < 0:
+                first = tid
+        return range(first, first + num_tasks)
+
     def add_successor(self, from_task: int, to_task: int) -> None:
-        lib = _load_lib()
+        lib = self._lib
         rc = int(lib.Graph_AddSuccessor(self._ptr, int(from_task), int(to_task)))
         if rc != 0:
             raise RuntimeError(f"Graph_AddSuccessor failed: rc={rc}")
+        self._edge_tail.append((int(from_task), int(to_task)))
+
+    def add_successors(self, from_tasks: Any, to_tasks: Any) -> None:
+        """
+        Add dependency edges from_tasks[i] -> to_tasks[i] in a single native call.
+
+        Both arguments are int32-convertible arrays of equal length. The native
+        side validates the whole batch and leaves the graph unchanged on error.
+        """
+        lib = self._lib
+        import numpy as np
+
+        # Copies, so they can be kept as the recorded edges.
+        src = np.array(from_tasks, dtype=np.int32).reshape(-1)
+        dst = np.array(to_tasks, dtype=np.int32).reshape(-1)
+        if src.shape != dst.shape:
+            raise ValueError(f"edge arrays differ in length: {src.shape[0]} vs {dst.shape[0]}")
+        num_edges = int(src.shape[0])
+        if num_edges == 0:
+            return
+
+        if hasattr(lib, "Graph_AddSuccessors"):
+            c_int_p = ctypes.POINTER(ctypes.c_int)
+            rc = int(
+                lib.Graph_AddSuccessors(
+                    self._ptr, src.ctypes.data_as(c_int_p), dst.ctypes.data_as(c_int_p), num_edges
+                )
+            )
+            if rc != 0:
+                raise RuntimeError(f"Graph_AddSuccessors failed: rc={rc}")
+            self._pack_edge_tail()
+            self._edge_chunks.append((src, dst))
+            return
+
+        # Fallback: validate in bulk, then one FFI call per edge.
+        count = self.get_task_count()
+        bad = (src < 0) | (src >= count) | (dst < 0) | (dst >= count)
+        if bad.any():
+            i = int(np.flatnonzero(bad)[0])
+            raise RuntimeError(f"Graph_AddSuccessors failed: invalid edge {i}: {int(src[i])} -> {int(dst[i])}")
+        add = lib.Graph_AddSuccessor
+        ptr = self._ptr
+        for i, (a, b) in enumerate(zip(src.tolist(), dst.tolist())):
+            rc = int(add(ptr, a, b))
+            if rc != 0:
+                raise RuntimeError(f"Graph_AddSuccessor failed for edge {i}: rc={rc}")
+            self._edge_tail.append((a, b))
+
+    # Largest task count for which reduce_edges() computes the exact reduction.
+    EXACT_REDUCTION_LIMIT: ClassVar[int] = 8192
+
+    def reduce_edges(self, exact_limit: int | None = None) -> EdgeReductionStats:
+        """
+        Drop dependency edges implied by other paths (transitive reduction).
+
+        Graphs with at most `exact_limit` tasks are reduced exactly; larger
+        ones only lose edges implied by a path of length two. Duplicate edges
+        are always collapsed. Call before the graph is launched.
+        """
+        lib = self._lib
+        if not hasattr(lib, "Graph_ReduceEdges"):
+            raise RuntimeError("host runtime does not export Graph_ReduceEdges; rebuild it to reduce edges")
+        if exact_limit is None:
+            exact_limit = self.EXACT_REDUCTION_LIMIT
+        edges_before = ctypes.c_int(0)
+        start = time.perf_counter()
+        removed = int(lib.Graph_ReduceEdges(self._ptr, int(exact_limit), ctypes.byref(edges_before)))
+        seconds = time.perf_counter() - start
+        if removed < 0:
+            raise RuntimeError(f"Graph_ReduceEdges failed: rc={removed}")
+        return EdgeReductionStats(
+            edges_before=int(edges_before.value),
+            edges_removed=removed,
+            exact=self.get_task_count() <= int(exact_limit),
+            seconds=seconds,
+        )
+
+    def set_task_args(self, task_ids: Any, slots: Any, values: Any) -> None:
+        """
+        Overwrite argument slots of existing tasks in place:
+        task `task_ids[i]` gets `values[i]` (packed uint64) in slot `slots[i]`.
+        """
+        lib = self._lib
+        import numpy as np
+
+        if not hasattr(lib, "Graph_SetTaskArgs"):
+            raise RuntimeError("host runtime does not export Graph_SetTaskArgs; rebuild it to patch task args")
+        tids = np.ascontiguousarray(task_ids, dtype=np.int32).reshape(-1)
+        slot_arr = np.ascontiguousarray(slots, dtype=np.int32).reshape(-1)
+        vals = np.ascontiguousarray(values, dtype=np.uint64).reshape(-1)
+        if not (tids.shape == slot_arr.shape == vals.shape):
+            raise ValueError("task_ids, slots and values must have the same length")
+        if tids.shape[0] == 0:
+            return
+        c_int_p = ctypes.POINTER(ctypes.c_int)
+        rc = int(
+            lib.Graph_SetTaskArgs(
+                self._ptr,
+                tids.ctypes.data_as(c_int_p),
+                slot_arr.ctypes.data_as(c_int_p),
+                vals.ctypes.data_as(ctypes.POINTER(ctypes.c_uint64)),
+                int(tids.shape[0]),
+            )
+        )
+        if rc != 0:
+            raise RuntimeError(f"Graph_SetTaskArgs failed: rc={rc}")
+
+    def reset_for_replay(self) -> None:
+        """Restore the dependency counters consumed by a previous launch."""
+        lib = self._lib
+        if not hasattr(lib, "Graph_ResetForReplay"):
+            raise RuntimeError("host runtime does not export Graph_ResetForReplay; rebuild it to replay graphs")
+        rc = int(lib.Graph_ResetForReplay(self._ptr))
+        if rc != 0:
+            raise RuntimeError(f"Graph_ResetForReplay failed: rc={rc}")
 
     def get_task_count(self) -> int:
-        lib = _load_lib()
+        lib = self._lib
         return int(lib.Graph_GetTaskCount(self._ptr))
 
+    def _pack_edge_tail(self) -> None:
+        if not self._edge_tail:
+            return
+        import numpy as np
+
+        pairs = np.array(self._edge_tail, dtype=np.int32)
+        self._edge_chunks.append((pairs[:, 0].copy(), pairs[:, 1].copy()))
+        self._edge_tail = []
+
+    def edge_arrays(self) -> tuple[Any, Any]:
+        """Dependency edges as read-only int32 `(from_tasks, to_tasks)` arrays, in the order they were added."""
+        import numpy as np
+
+        self._pack_edge_tail()
+        if not self._edge_chunks:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+        if len(self._edge_chunks) > 1:
+            src = np.concatenate([c[0] for c in self._edge_chunks])
+            dst = np.concatenate([c[1] for c in self._edge_chunks])
+            self._edge_chunks = [(src, dst)]
+        src, dst = self._edge_chunks[0]
+        src.flags.writeable = False
+        dst.flags.writeable = False
+        return src, dst
+
+    def edges(self) -> list[tuple[int, int]]:
+        """Dependency edges `(from_task, to_task)` in the order they were added."""
+        if not self._edge_chunks:
+            return list(self._edge_tail)
+        src, dst = self.edge_arrays()
+        return list(zip(src.tolist(), dst.tolist()))
+
     def __del__(self) -> None:  # pragma: no cover
         try:
-            lib = _load_lib()
             if getattr(self, "_handle", None):
-                lib.Graph_Destroy(self._ptr)
+                self._lib.Graph_Destroy(self._ptr)
         except Exception:
             pass
 
 
+class CachingAllocator:
+    """
+    Size-class caching allocator in front of a raw device allocator.
+
+    Freed blocks are kept on per-stream free lists keyed by size class and
+    handed back to later requests of the same class on the same stream, so
+    repeated allocate/free of the same few sizes never reaches the driver.
+
+    Size classes bound internal fragmentation: requests up to 1 MiB round up
+    to 512 B, larger ones to a quarter of their power-of-two range (at most
+    25% waste). A block is only reused for its own class, and at most
+    `max_cached_bytes` are kept cached; beyond that, frees go to the driver.
+    Blocks are stream-ordered: a block freed on one stream is only reused on
+    that stream until `synchronize()` marks the stream idle and moves its
+    cached blocks to a shared pool that serves every stream.
+    """
+
+    SMALL_LIMIT: ClassVar[int] = 1 << 20
+    SMALL_ROUND: ClassVar[int] = 512
+
+    def __init__(self, alloc_fn: Any, free_fn: Any, *, max_cached_bytes: int | None = None) -> None:
+        self._alloc_fn = alloc_fn
+        self._free_fn = free_fn
+        self.max_cached_bytes = max_cached_bytes
+        # (stream, size class) -> cached block pointers; stream None is the shared pool
+        self._free_lists: dict[tuple[int | None, int], list[int]] = {}
+        # ptr -> (size class, stream) of blocks handed out
+        self._active: dict[int, tuple[int, int]] = {}
+        self._allocated_bytes = 0
+        self._cached_bytes = 0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "driver_allocs": 0,
+            "driver_frees": 0,
+            "peak_allocated_bytes": 0,
+            "peak_reserved_bytes": 0,
+        }
+
+    @classmethod
+    def size_class(cls, nbytes: int) -> int:
+        """Rounded block size used for a request of `nbytes`."""
+        nbytes = max(int(nbytes), 1)
+        if nbytes <= cls.SMALL_LIMIT:
+            step = cls.SMALL_ROUND
+        else:
+            step = (1 << (nbytes.bit_length() - 1)) // 4
+        return -(-nbytes // step) * step
+
+    def allocate(self, nbytes: int, stream: int = 0) -> int:
+        size = self.size_class(nbytes)
+        blocks = self._free_lists.get((int(stream), size)) or self._free_lists.get((None, size))
+        if blocks:
+            ptr = blocks.pop()
+            self._cached_bytes -= size
+            self._stats["hits"] += 1
+        else:
+            self._stats["misses"] += 1
+            ptr = int(self._alloc_fn(size) or 0)
+            if ptr == 0 and self._cached_bytes:
+                # Out of memory: return cached blocks to the driver and retry once.
+                self.empty_cache()
+                ptr = int(self._alloc_fn(size) or 0)
+            if ptr == 0:
+                return 0
+            self._stats["driver_allocs"] += 1
+
+        self._active[ptr] = (size, int(stream))
+        self._allocated_bytes += size
+        self._stats["peak_allocated_bytes"] = max(self._stats["peak_allocated_bytes"], self._allocated_bytes)
+        self._stats["peak_reserved_bytes"] = max(
+            self._stats["peak_reserved_bytes"], self._allocated_bytes + self._cached_bytes
+        )
+        return ptr
+
+    def free(self, ptr: int) -> None:
+        ptr = int(ptr)
+        if ptr == 0:
+            return
+        entry = self._active.pop(ptr, None)
+        if entry is None:
+            # Not allocated through the cache: release directly.
+            self._free_fn(ptr)
+            self._stats["driver_frees"] += 1
+            return
+        size, stream = entry
+        self._allocated_bytes -= size
+        if self.max_cached_bytes is not None and self._cached_bytes + size > self.max_cached_bytes:
+            self._free_fn(ptr)
+            self._stats["driver_frees"] += 1
+            return
+        self._free_lists.setdefault((stream, size), []).append(ptr)
+        self._cached_bytes += size
+
+    def synchronize(self, streams: Any = None) -> None:
+        """
+        Mark `streams` (all streams if None) idle: their cached blocks move to
+        the shared pool and become reusable on any stream.
+        """
+        idle = None if streams is None else {int(s) for s in streams}
+        merged: dict[tuple[int | None, int], list[int]] = {}
+        for (stream, size), blocks in self._free_lists.items():
+            key = (None, size) if idle is None or stream in idle else (stream, size)
+            merged.setdefault(key, []).extend(blocks)
+        self._free_lists = merged
+
+    def streams(self) -> set[int]:
+        """Streams that have cached blocks not yet shared."""
+        return {stream for stream, _ in self._free_lists if stream is not None}
+
+    def empty_cache(self) -> None:
+        """Release every cached (free) block to the driver."""
+        for blocks in self._free_lists.values():
+            for ptr in blocks:
+                self._free_fn(ptr)
+                self._stats["driver_frees"] += 1
+        self._free_lists.clear()
+        self._cached_bytes = 0
+
+    def reset(self) -> None:
+        """Forget all blocks without freeing them (the device context is gone)."""
+        self._free_lists.clear()
+        self._active.clear()
+        self._allocated_bytes = 0
+        self._cached_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        out = dict(self._stats)
+        out["allocated_bytes"] = self._allocated_bytes
+        out["cached_bytes"] = self._cached_bytes
+        out["reserved_bytes"] = self._allocated_bytes + self._cached_bytes
+        out["active_blocks"] = len(self._active)
+        out["cached_blocks"] = sum(len(b) for b in self._free_lists.values())
+        return out
+
+
+class _StagingPool:
+    """
+    Reusable host staging buffers for asynchronous copies.
+
+    Buffers are pinned when the host runtime exports DeviceRunner_AllocHostPinned,
+    and page-aligned pageable NumPy memory otherwise. Thread-safe.
+    """
+
+    ALIGNMENT: ClassVar[int] = 4096
+
+    def __init__(self, native: Any = _load_lib) -> None:
+        self._native = native
+        self._lock = threading.Lock()
+        self._free: dict[int, list[Any]] = {}
+        self._pinned: list[int] = []
+
+    def _new_buffer(self, size: int) -> Any:
+        import numpy as np
+
+        lib = self._native()
+        if hasattr(lib, "DeviceRunner_AllocHostPinned"):
+            ptr = int(ctypes.c_void_p(lib.DeviceRunner_AllocHostPinned(ctypes.c_size_t(size))).value or 0)
+            if ptr:
+                self._pinned.append(ptr)
+                return np.ctypeslib.as_array((ctypes.c_uint8 * size).from_address(ptr))
+        raw = np.empty(size + self.ALIGNMENT, dtype=np.uint8)
+        offset = (-int(raw.ctypes.data)) % self.ALIGNMENT
+        return raw[offset : offset + size]
+
+    def acquire(self, nbytes: int) -> Any:
+        """A uint8 buffer of at least `nbytes` bytes."""
+        size = CachingAllocator.size_class(nbytes)
+        with self._lock:
+            blocks = self._free.get(size)
+            if blocks:
+                return blocks.pop()
+            return self._new_buffer(size)
+
+    def release(self, buf: Any) -> None:
+        with self._lock:
+            self._free.setdefault(int(buf.nbytes), []).append(buf)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._free.clear()
+            if self._pinned:
+                lib = self._native()
+                for ptr in self._pinned:
+                    lib.DeviceRunner_FreeHostPinned(ctypes.c_void_p(ptr))
+                self._pinned.clear()
+
+
+def _copy_succeeded(future: Future) -> bool:
+    """True once an async copy has finished with rc 0."""
+    return future.done() and future.exception() is None and int(future.result()) == 0
+
+
+def _wait_copies(futures: list[Future]) -> None:
+    for future in futures:
+        rc = int(future.result())
+        if rc != 0:
+            raise RuntimeError(f"async device copy failed: rc={rc}")
+
+
 class DeviceRunner:
+    """
+    Host-side handle of the device runtime.
+
+    The native runner is a per-library singleton bound to one device, so
+    `DeviceRunner.get()` drives the process-wide library (slot 0) while
+    `DeviceRunner.for_device(device_id)` returns one runner per device. The
+    first device (or the device `get()`'s runner was initialized on) shares
+    that runner; every other device gets a private copy of the host library
+    (`lib_slot`), giving it independent native state. A runner only ever
+    initializes the device it is registered for.
+    The device runtime binds a device to the calling thread: drive each
+    runner from one thread (see `MultiDeviceRunner`). Async copies run on
+    per-stream worker threads that bind the runner's device first
+    (`DeviceRunner_BindDevice`); with a host library that cannot bind
+    threads, they run synchronously on the calling thread instead.
+    """
+
     _instance: ClassVar["DeviceRunner" | None] = None
+    _device_runners: ClassVar[dict[int, "DeviceRunner"]] = {}
+    _device_lock: ClassVar[threading.Lock] = threading.Lock()
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        caching_allocator: bool = True,
+        max_cached_bytes: int | None = None,
+        lib_slot: int = 0,
+    ) -> None:
+        self._lib_slot = int(lib_slot)
+        self.device_id: int | None = None
         self._cube_blocks: int = 0
         self._initialized: bool = False
+        self.allocator: CachingAllocator | None = (
+            CachingAllocator(self._raw_allocate, self._raw_free, max_cached_bytes=max_cached_bytes)
+            if caching_allocator
+            else None
+        )
+        # Async copy streams: one worker thread each, so copies on a stream run in order.
+        self._copy_streams: dict[int, ThreadPoolExecutor] = {}
+        self._pending_copies: dict[int, list[Future]] = {}
+        self._copy_lock = threading.Lock()
+        self._staging = _StagingPool(self._native)
 
     @classmethod
     def get(cls) -> "DeviceRunner":
         if cls._instance is None:
-            cls._instance = cls()
+            with cls._device_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
+    @classmethod
+    def for_device(cls, device_id: int, **kwargs: Any) -> "DeviceRunner":
+        """
+        Runner for `device_id`, created on first use. The process-wide runner
+        of `get()` (library slot 0) serves the first device asked for, unless
+        it is already initialized on another one; other devices get their own
+        host library copy. `kwargs` are passed to the constructor of a new runner.
+        """
+        device_id = int(device_id)
+        with cls._device_lock:
+            runner = cls._device_runners.get(device_id)
+            if runner is not None:
+                return runner
+            shared = cls._instance
+            if shared is None:
+                runner = cls._instance = cls(**kwargs)
+            elif shared.device_id in (None, device_id) and shared not in cls._device_runners.values():
+                runner = shared
+            else:
+                slots = {r._lib_slot for r in cls._device_runners.values()}
+                runner = cls(lib_slot=next(s for s in itertools.count(1) if s not in slots), **kwargs)
+            cls._device_runners[device_id] = runner
+            return runner
+
+    def _registered_device(self) -> int | None:
+        """Device this runner serves through `for_device`, if any."""
+        with self._device_lock:
+            return next((d for d, r in self._device_runners.items() if r is self), None)
+
+    def _native(self) -> ctypes.CDLL:
+        return _load_device_lib(self._lib_slot)
+
     def init(
         self,
         device_id: int,
@@ -286,7 +1024,10 @@ class DeviceRunner:
         aicore_kernel_path: Union[None, str, os.PathLike[str], bytes, bytearray, memoryview] = None,
         pto_isa_root: str | None = None,
     ) -> int:
-        lib = _load_lib()
+        registered = self._registered_device()
+        if registered is not None and registered != int(device_id):
+            raise ValueError(f"DeviceRunner for device {registered} cannot init device {device_id}")
+        lib = self._native()
 
         if pto_isa_root is None:
             pto_isa_root = os.fspath(_repo_root())
@@ -316,12 +1057,13 @@ class DeviceRunner:
             )
         )
         if rc == 0:
+            self.device_id = int(device_id)
             self._cube_blocks = int(num_cores)
             self._initialized = True
         return rc
 
     def compile_and_load_kernel(self, func_id: int, kernel_path: str, pto_isa_root: str | None = None, core_type: int = 0) -> int:
-        lib = _load_lib()
+        lib = self._native()
         _ = pto_isa_root  # pto_isa_root is configured at init() time
         return int(
             lib.DeviceRunner_CompileAndLoadKernel(
@@ -331,17 +1073,49 @@ class DeviceRunner:
             )
         )
 
-    def allocate_tensor(self, bytes: int) -> int:
-        lib = _load_lib()
-        ptr = lib.DeviceRunner_AllocateTensor(ctypes.c_size_t(int(bytes)))
+    def supports_kernel_binaries(self) -> bool:
+        """True if the host library can load prebuilt kernel binaries (`load_kernel_binary`)."""
+        return hasattr(self._native(), "DeviceRunner_LoadKernelBinary")
+
+    def load_kernel_binary(self, func_id: int, binary: bytes) -> int:
+        """Load a kernel's device code (the `.text` section of its object) as `func_id`."""
+        lib = self._native()
+        if not self.supports_kernel_binaries():
+            raise RuntimeError("host runtime does not export DeviceRunner_LoadKernelBinary; rebuild it to load kernel binaries")
+        buf = (ctypes.c_uint8 * len(binary)).from_buffer_copy(binary)
+        return int(lib.DeviceRunner_LoadKernelBinary(int(func_id), buf, ctypes.c_size_t(len(binary))))
+
+    def _raw_allocate(self, nbytes: int) -> int:
+        lib = self._native()
+        ptr = lib.DeviceRunner_AllocateTensor(ctypes.c_size_t(int(nbytes)))
         return int(ctypes.c_void_p(ptr).value or 0)
 
-    def free_tensor(self, ptr: int) -> None:
-        lib = _load_lib()
+    def _raw_free(self, ptr: int) -> None:
+        lib = self._native()
         lib.DeviceRunner_FreeTensor(ctypes.c_void_p(int(ptr)))
 
+    def allocate_tensor(self, bytes: int, stream: int = 0) -> int:
+        if self.allocator is None:
+            return self._raw_allocate(bytes)
+        return self.allocator.allocate(bytes, stream)
+
+    def free_tensor(self, ptr: int) -> None:
+        if self.allocator is None:
+            self._raw_free(ptr)
+        else:
+            self.allocator.free(ptr)
+
+    def empty_cache(self) -> None:
+        """Release device memory cached by the allocator."""
+        if self.allocator is not None:
+            self.allocator.empty_cache()
+
+    def memory_stats(self) -> dict[str, int]:
+        """Allocator statistics (empty when caching is disabled)."""
+        return self.allocator.stats() if self.allocator is not None else {}
+
     def copy_to_device(self, dev_ptr: int, host_data: Any) -> int:
-        lib = _load_lib()
+        lib = self._native()
         import numpy as np
 
         if not isinstance(host_data, np.ndarray):
@@ -356,8 +1130,113 @@ class DeviceRunner:
             )
         )
 
+    # -- Asynchronous copies ---------------------------------------------------
+
+    def _bind_copy_thread(self) -> None:
+        """Copy stream thread initializer: bind the runner's device to the thread."""
+        rc = int(self._native().DeviceRunner_BindDevice(int(self.device_id)))
+        if rc != 0:
+            raise RuntimeError(f"DeviceRunner_BindDevice({self.device_id}) failed: rc={rc}")
+
+    def _submit_copy(self, stream: int, fn: Any, *args: Any) -> Future:
+        if self.device_id is None:
+            raise RuntimeError("DeviceRunner: init() a device before async copies")
+        future: Future | None = None
+        if not hasattr(self._native(), "DeviceRunner_BindDevice"):
+            # No way to bind another thread: copy on the caller's (device) thread.
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as exc:
+                future.set_exception(exc)
+        with self._copy_lock:
+            if future is None:
+                executor = self._copy_streams.get(stream)
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix=f"pto-copy-{stream}", initializer=self._bind_copy_thread
+                    )
+                    self._copy_streams[stream] = executor
+                future = executor.submit(fn, *args)
+            # Failed copies stay pending so synchronize() reports them.
+            pending = [f for f in self._pending_copies.get(stream, []) if not _copy_succeeded(f)]
+            pending.append(future)
+            self._pending_copies[stream] = pending
+        return future
+
+    def copy_to_device_async(self, dev_ptr: int, host_data: Any, *, stream: int = 0) -> Future:
+        """
+        Start a host-to-device copy and return a Future resolving to its return code.
+
+        `host_data` is copied into a staging buffer before this returns, so the
+        caller may modify it immediately. Copies on one stream complete in
+        order. `run()` waits for pending stream-0 copies; copies on other
+        streams overlap with launches and are synchronized through their
+        futures (`run(..., wait_for=[...])`) or `synchronize()`.
+        """
+        import numpy as np
+
+        if not isinstance(host_data, np.ndarray):
+            raise TypeError("copy_to_device_async expects a NumPy array")
+        nbytes = int(host_data.nbytes)
+        staging = self._staging.acquire(nbytes)
+        # Staging also makes non-contiguous inputs contiguous, explicitly.
+        np.copyto(staging[:nbytes].view(host_data.dtype).reshape(host_data.shape), host_data)
+
+        def task() -> int:
+            try:
+                lib = self._native()
+                return int(
+                    lib.DeviceRunner_CopyToDevice(
+                        ctypes.c_void_p(int(dev_ptr)),
+                        ctypes.c_void_p(int(staging.ctypes.data)),
+                        ctypes.c_size_t(nbytes),
+                    )
+                )
+            finally:
+                self._staging.release(staging)
+
+        return self._submit_copy(int(stream), task)
+
+    def copy_from_device_async(self, host_data: Any, dev_ptr: int, *, stream: int = 0) -> Future:
+        """
+        Start a device-to-host copy into `host_data` (C-contiguous) and return a
+        Future resolving to its return code. `host_data` must not be read
+        until the future completes.
+        """
+        import numpy as np
+
+        if not isinstance(host_data, np.ndarray):
+            raise TypeError("copy_from_device_async expects a NumPy array")
+        if not host_data.flags["C_CONTIGUOUS"]:
+            raise ValueError("copy_from_device_async requires a C-contiguous NumPy array")
+        return self._submit_copy(int(stream), self.copy_from_device, host_data, int(dev_ptr))
+
+    def synchronize(self, stream: int | None = None) -> None:
+        """
+        Wait for pending async copies on `stream` (all streams if None).
+
+        Raises RuntimeError if any of them failed, including copies that
+        finished before this call. On success the stream is idle and the
+        allocator may hand its freed blocks to other streams.
+        """
+        with self._copy_lock:
+            if stream is None:
+                pending = [f for fs in self._pending_copies.values() for f in fs]
+                self._pending_copies.clear()
+            else:
+                pending = self._pending_copies.pop(int(stream), [])
+        _wait_copies(pending)
+        if self.allocator is not None:
+            self.allocator.synchronize(None if stream is None else [int(stream)])
+
+    def _busy_streams(self) -> set[int]:
+        """Streams with async copies still in flight."""
+        with self._copy_lock:
+            return {s for s, fs in self._pending_copies.items() if any(not f.done() for f in fs)}
+
     def copy_from_device(self, host_data: Any, dev_ptr: int) -> int:
-        lib = _load_lib()
+        lib = self._native()
         import numpy as np
 
         if not isinstance(host_data, np.ndarray):
@@ -373,21 +1252,21 @@ class DeviceRunner:
         )
 
     def set_profile_enabled(self, enabled: bool) -> None:
-        lib = _load_lib()
+        lib = self._native()
         rc = int(lib.DeviceRunner_SetProfileEnabled(1 if enabled else 0))
         if rc != 0:
             raise RuntimeError(f"DeviceRunner_SetProfileEnabled failed: rc={rc}")
 
     def profile_enabled(self) -> bool:
-        lib = _load_lib()
+        lib = self._native()
         return bool(int(lib.DeviceRunner_ProfileEnabled()) != 0)
 
     def has_last_profile(self) -> bool:
-        lib = _load_lib()
+        lib = self._native()
         return bool(int(lib.DeviceRunner_HasLastProfile()) != 0)
 
     def get_last_profile(self) -> list[TaskProfileRecord]:
-        lib = _load_lib()
+        lib = self._native()
         rec_t = getattr(lib, "_PtoTaskProfileRecord")  # type: ignore[attr-defined]
         n = int(lib.DeviceRunner_GetLastProfile(None, 0))
         if n <= 0:
@@ -414,26 +1293,466 @@ class DeviceRunner:
             )
         return out
 
-    def run(self, graph: Graph, launch_aicpu_num: int = 1) -> int:
-        lib = _load_lib()
+    def get_last_profile_array(self) -> Any:
+        """
+        Last profile as a NumPy structured array with the native
+        `_PtoTaskProfileRecord` layout (`pmu_cnt` is a uint32[8] subarray).
+
+        The native side writes straight into the array's memory, so no
+        per-task Python objects are created.
+        """
+        lib = self._native()
+        import numpy as np
+
+        dtype = profile_dtype()
+        n = int(lib.DeviceRunner_GetLastProfile(None, 0))
+        if n <= 0:
+            return np.empty(0, dtype=dtype)
+        arr = np.empty(n, dtype=dtype)
+        rec_t = getattr(lib, "_PtoTaskProfileRecord")  # type: ignore[attr-defined]
+        m = int(lib.DeviceRunner_GetLastProfile(arr.ctypes.data_as(ctypes.POINTER(rec_t)), int(n)))
+        if m < 0:
+            raise RuntimeError(f"DeviceRunner_GetLastProfile failed: rc={m}")
+        return arr[:m]
+
+    def export_last_profile(self, path: Union[str, os.PathLike[str]]) -> Any:
+        """Write the last profile as columnar NPZ (see `export_profile_npz`); return the array."""
+        arr = self.get_last_profile_array()
+        export_profile_npz(path, arr)
+        return arr
+
+    def run(self, graph: Graph, launch_aicpu_num: int = 1, *, wait_for: list[Future] | None = None) -> int:
+        """
+        Launch a graph and wait for it to finish.
+
+        Pending stream-0 async copies, and the copies in `wait_for`, complete
+        before the launch; copies on other streams keep running during it.
+        """
+        lib = self._native()
         if not self._initialized:
             raise RuntimeError("DeviceRunner not initialized; call init() first")
         if self._cube_blocks <= 0:
             raise RuntimeError("invalid num_cores; expected cube block count > 0")
+        self.synchronize(0)
+        _wait_copies(wait_for or [])
         total_workers = int(self._cube_blocks) * 3
-        return int(lib.DeviceRunner_Run(graph._ptr, int(total_workers), int(launch_aicpu_num)))
+        rc = int(lib.DeviceRunner_Run(graph._ptr, int(total_workers), int(launch_aicpu_num)))
+        if self.allocator is not None:
+            # The launch is synchronous, but copies on other streams may still
+            # be writing: only blocks of streams with nothing in flight merge.
+            busy = self._busy_streams()
+            self.allocator.synchronize(s for s in self.allocator.streams() if s not in busy)
+        return rc
 
     def print_handshake_results(self, graph: Graph) -> None:
-        lib = _load_lib()
+        lib = self._native()
         lib.DeviceRunner_PrintHandshakeResults(graph._ptr)
 
     def finalize(self) -> int:
-        lib = _load_lib()
+        lib = self._native()
+        self.synchronize()
+        with self._copy_lock:
+            for executor in self._copy_streams.values():
+                executor.shutdown(wait=True)
+            self._copy_streams.clear()
+        self._staging.clear()
+        if self.allocator is not None:
+            self.allocator.empty_cache()
+            self.allocator.reset()
         self._initialized = False
         self._cube_blocks = 0
+        self.device_id = None
         return int(lib.DeviceRunner_Finalize())
 
 
+class InputPipeline:
+    """
+    Double-buffered input upload: batch N+1 is copied to the device while
+    batch N executes.
+
+    `depth` sets of device buffers (one per input, sized by `input_nbytes`)
+    are used round-robin. Uploads go to a dedicated copy stream, and each
+    launch waits only for its own batch's uploads. (Uploads overlap launches
+    only if the host library can bind copy threads to the device; otherwise
+    they run synchronously, see `DeviceRunner`.)
+
+        pipe = InputPipeline(runner, [x.nbytes for x in first_batch])
+        for rc in pipe.run(batches, lambda ptrs: rt.replay(x=ptrs[0])):
+            ...
+    """
+
+    def __init__(self, runner: "DeviceRunner", input_nbytes: list[int], *, depth: int = 2, stream: int = 1) -> None:
+        if depth < 2:
+            raise ValueError("InputPipeline needs depth >= 2 to overlap uploads")
+        self.runner = runner
+        self.input_nbytes = [int(n) for n in input_nbytes]
+        self.depth = int(depth)
+        self.stream = int(stream)
+        self.buffers: list[list[int]] = []
+        for _ in range(self.depth):
+            ptrs = [runner.allocate_tensor(n) for n in self.input_nbytes]
+            if not all(ptrs):
+                self.close()
+                raise MemoryError("InputPipeline: device allocation failed")
+            self.buffers.append(ptrs)
+
+    def _upload(self, slot: int, batch: Any) -> list[Future]:
+        if len(batch) != len(self.input_nbytes):
+            raise ValueError(f"expected {len(self.input_nbytes)} inputs, got {len(batch)}")
+        futures = []
+        for ptr, nbytes, host in zip(self.buffers[slot], self.input_nbytes, batch):
+            if int(host.nbytes) > nbytes:
+                raise ValueError(f"input of {host.nbytes} bytes exceeds its {nbytes}-byte device buffer")
+            futures.append(self.runner.copy_to_device_async(ptr, host, stream=self.stream))
+        return futures
+
+    def run(self, batches: Any, launch: Any) -> Any:
+        """
+        Upload and launch each batch; yield `launch(device_ptrs)` results in order.
+
+        `launch` must run the batch synchronously (e.g. `OrchestrationRuntime.run`
+        or `replay`) before returning.
+        """
+        it = iter(batches)
+        try:
+            batch = next(it)
+        except StopIteration:
+            return
+        inflight = self._upload(0, batch)
+        index = 0
+        while True:
+            slot = index % self.depth
+            ready = inflight
+            try:
+                batch = next(it)
+                inflight = self._upload((index + 1) % self.depth, batch)
+            except StopIteration:
+                inflight = None
+            _wait_copies(ready)
+            yield launch(self.buffers[slot])
+            if inflight is None:
+                return
+            index += 1
+
+    def close(self) -> None:
+        self.runner.synchronize(self.stream)
+        for ptrs in self.buffers:
+            for ptr in ptrs:
+                if ptr:
+                    self.runner.free_tensor(ptr)
+        self.buffers = []
+
+
+def partition_tasks(
+    num_tasks: int,
+    edges: Any,
+    num_parts: int,
+    weights: Any = None,
+) -> list[list[int]]:
+    """
+    Split tasks `0..num_tasks-1` into `num_parts` groups with no dependency
+    edge between groups, for running one graph across several devices.
+
+    Weakly connected components are kept whole and assigned, heaviest first,
+    to the least loaded group (task weight `weights[i]`, default 1). A graph
+    that is a single component ends up entirely in one group.
+    """
+    if num_parts <= 0:
+        raise ValueError("num_parts must be positive")
+    parent = list(range(int(num_tasks)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in edges:
+        ra, rb = find(int(a)), find(int(b))
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+
+    components: dict[int, list[int]] = {}
+    for t in range(int(num_tasks)):
+        components.setdefault(find(t), []).append(t)
+    w = [1.0] * int(num_tasks) if weights is None else [float(x) for x in weights]
+
+    parts: list[list[int]] = [[] for _ in range(int(num_parts))]
+    loads = [0.0] * int(num_parts)
+    for comp in sorted(components.values(), key=lambda c: (-sum(w[t] for t in c), c[0])):
+        i = loads.index(min(loads))
+        parts[i].extend(comp)
+        loads[i] += sum(w[t] for t in comp)
+    for part in parts:
+        part.sort()
+    return parts
+
+
+@dataclass(frozen=True)
+class ShardResult:
+    device_id: int
+    rc: int
+    # Whatever the shard's build function returned (e.g. its OrchestrationRuntime).
+    value: Any
+    # Profile of the shard's launch, if profiling was enabled on its runner.
+    profile: Any = None
+
+
+class MultiDeviceRunner:
+    """
+    One `DeviceRunner` per device (`DeviceRunner.for_device`), each driven from
+    its own thread, for data-parallel execution in a single process.
+
+    Work is submitted as `fn(runner, item)` callables; the items of one call
+    are spread one per device and run concurrently:
+
+        with MultiDeviceRunner(range(8), num_cores=24) as devices:
+            y = devices.run_batch(x, infer)          # infer(runner, x_shard) -> y_shard
+            results = devices.run_graphs(build, shards)
+            profiles = devices.last_profiles()
+
+    Per-device work may use synchronous or async copies: async copy threads
+    bind the runner's device (see `DeviceRunner`).
+    """
+
+    def __init__(self, device_ids: Any, num_cores: int, **init_kwargs: Any) -> None:
+        self.device_ids = [int(d) for d in device_ids]
+        if not self.device_ids:
+            raise ValueError("MultiDeviceRunner needs at least one device")
+        if len(set(self.device_ids)) != len(self.device_ids):
+            raise ValueError(f"duplicate device ids: {self.device_ids}")
+        self.runners = [DeviceRunner.for_device(d) for d in self.device_ids]
+        self._threads = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"pto-device-{d}") for d in self.device_ids
+        ]
+        rcs = self.map(lambda runner, d: runner.init(d, num_cores, **init_kwargs), self.device_ids)
+        failed = [d for d, rc in zip(self.device_ids, rcs) if rc != 0]
+        if failed:
+            self.close()
+            raise RuntimeError(f"DeviceRunner init failed on devices {failed}")
+
+    def __len__(self) -> int:
+        return len(self.device_ids)
+
+    def __enter__(self) -> "MultiDeviceRunner":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def submit(self, index: int, fn: Any, *args: Any) -> Future:
+        """Run `fn(runner, *args)` on the thread of the `index`-th device."""
+        return self._threads[index].submit(fn, self.runners[index], *args)
+
+    def map(self, fn: Any, items: Any) -> list[Any]:
+        """
+        Run `fn(runner, items[i])` on device `i` for every item, concurrently,
+        and return the results in order. Waits for all devices before
+        re-raising the first error.
+        """
+        items = list(items)
+        if len(items) > len(self):
+            raise ValueError(f"{len(items)} shards for {len(self)} devices")
+        futures = [self.submit(i, fn, item) for i, item in enumerate(items)]
+        errors = [f.exception() for f in futures]
+        for err in errors:
+            if err is not None:
+                raise err
+        return [f.result() for f in futures]
+
+    def set_profile_enabled(self, enabled: bool) -> None:
+        self.map(lambda runner, _: runner.set_profile_enabled(enabled), [None] * len(self))
+
+    def last_profiles(self) -> dict[int, Any]:
+        """Last launch profile of every device that has one, as structured arrays."""
+        arrays = self.map(
+            lambda runner, _: runner.get_last_profile_array() if runner.has_last_profile() else None,
+            [None] * len(self),
+        )
+        return {d: a for d, a in zip(self.device_ids, arrays) if a is not None}
+
+    def run_graphs(self, build: Any, shards: Any) -> list[ShardResult]:
+        """
+        Build and run one graph per shard: `build(runner, shard)` returns an
+        `OrchestrationRuntime` (or anything with `run()`) for that device.
+        """
+
+        def job(runner: DeviceRunner, shard: Any) -> ShardResult:
+            rt = build(runner, shard)
+            rc = int(rt.run())
+            profile = runner.get_last_profile_array() if runner.profile_enabled() and runner.has_last_profile() else None
+            return ShardResult(device_id=int(runner.device_id), rc=rc, value=rt, profile=profile)
+
+        return self.map(job, shards)
+
+    def run_batch(self, batch: Any, fn: Any, *, axis: int = 0) -> Any:
+        """
+        Split `batch` (a NumPy array) along `axis` into one shard per device,
+        run `fn(runner, shard)` on each, and concatenate the returned arrays.
+        """
+        import numpy as np
+
+        shards = [s for s in np.array_split(np.asarray(batch), len(self), axis=axis) if s.shape[axis] > 0]
+        return np.concatenate(self.map(fn, shards), axis=axis)
+
+    def close(self) -> None:
+        """Finalize every initialized runner and stop the device threads."""
+        if not self._threads:
+            return
+        futures = [
+            self.submit(i, lambda runner: runner.finalize() if runner._initialized else 0)
+            for i in range(len(self))
+        ]
+        for f in futures:
+            f.exception()
+        for t in self._threads:
+            t.shutdown(wait=True)
+        self._threads = []
+
+
+@dataclass(frozen=True)
+class MemRegion:
+    """
+    Byte region of device memory accessed by a task.
+
+    A contiguous region is `MemRegion(ptr, nbytes)`. A strided view (e.g. a
+    sub-tile of a larger row-major buffer) covers `rows` runs of `nbytes`
+    bytes whose starts are `stride` bytes apart.
+    """
+
+    ptr: int
+    nbytes: int
+    rows: int = 1
+    stride: int = 0
+
+    def intervals(self) -> list[tuple[int, int]]:
+        """Half-open [start, end) byte intervals, contiguous runs merged."""
+        if self.nbytes <= 0 or self.rows <= 0:
+            raise ValueError(f"empty memory region: {self}")
+        if self.rows == 1 or self.stride <= self.nbytes:
+            # Contiguous (or overlapping) rows: the union is one span.
+            span = self.nbytes if self.rows == 1 else self.stride * (self.rows - 1) + self.nbytes
+            return [(self.ptr, self.ptr + span)]
+        return [(self.ptr + r * self.stride, self.ptr + r * self.stride + self.nbytes) for r in range(self.rows)]
+
+    @classmethod
+    def of(cls, spec: Any) -> "MemRegion":
+        """Coerce a pointer, a (ptr, nbytes) pair or a MemRegion."""
+        if isinstance(spec, MemRegion):
+            return spec
+        if isinstance(spec, tuple):
+            return cls(*(int(x) for x in spec))
+        # A bare pointer names the single byte at that address: accesses through
+        # the same pointer conflict, as with exact-pointer tracking.
+        return cls(int(spec), 1)
+
+
+class RegionDependencyTracker:
+    """
+    Interval index of device memory used to derive RAW, WAR and WAW edges.
+
+    Tracked memory is kept as sorted, disjoint byte segments, each holding the
+    task that last wrote it and the tasks that read it since. A new access
+    splits the segments at its boundaries, so partially overlapping views only
+    depend on the tasks that touched the overlapping bytes.
+    """
+
+    def __init__(self) -> None:
+        self._starts: list[int] = []
+        # [start, end, last writer or None, readers since that write]
+        self._segments: list[list[Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def clear(self) -> None:
+        self._starts.clear()
+        self._segments.clear()
+
+    def _boundary(self, pos: int) -> int:
+        """Split the segment containing `pos`; return the index of the first segment starting at or after it."""
+        i = bisect.bisect_right(self._starts, pos) - 1
+        if i < 0:
+            return 0
+        start, end, writer, readers = self._segments[i]
+        if start == pos:
+            return i
+        if pos >= end:
+            return i + 1
+        self._segments[i] = [start, pos, writer, readers]
+        self._segments.insert(i + 1, [pos, end, writer, list(readers)])
+        self._starts.insert(i + 1, pos)
+        return i + 1
+
+    def _cover(self, lo: int, hi: int) -> tuple[int, int]:
+        """Make segments tile [lo, hi) exactly (untracked gaps become empty segments)."""
+        i = self._boundary(lo)
+        j = self._boundary(hi)
+        pos = lo
+        k = i
+        while pos < hi:
+            if k < j and self._segments[k][0] == pos:
+                pos = self._segments[k][1]
+                k += 1
+                continue
+            gap_end = self._segments[k][0] if k < j else hi
+            self._segments.insert(k, [pos, gap_end, None, []])
+            self._starts.insert(k, pos)
+            j += 1
+            k += 1
+            pos = gap_end
+        return i, j
+
+    def read(self, task_id: int, lo: int, hi: int) -> set[int]:
+        """Record a read of [lo, hi); return the tasks it depends on (RAW)."""
+        deps: set[int] = set()
+        i, j = self._cover(lo, hi)
+        for seg in self._segments[i:j]:
+            if seg[2] is not None and seg[2] != task_id:
+                deps.add(seg[2])
+            if task_id not in seg[3]:
+                seg[3].append(task_id)
+        return deps
+
+    def write(self, task_id: int, lo: int, hi: int) -> set[int]:
+        """Record a write of [lo, hi); return the tasks it depends on (WAR, WAW)."""
+        deps: set[int] = set()
+        i, j = self._cover(lo, hi)
+        for _, _, writer, readers in self._segments[i:j]:
+            other_readers = [r for r in readers if r != task_id]
+            deps.update(other_readers)
+            # Readers already depend on the writer, so WAW is only needed without them.
+            if writer is not None and writer != task_id and not other_readers:
+                deps.add(writer)
+        self._segments[i:j] = [[lo, hi, task_id, []]]
+        self._starts[i:j] = [lo]
+        return deps
+
+    def access(self, task_id: int, reads: list[Any] = (), writes: list[Any] = ()) -> set[int]:
+        """Record all accesses of a task (reads before writes); return its dependencies."""
+        deps: set[int] = set()
+        for spec in reads:
+            for lo, hi in MemRegion.of(spec).intervals():
+                deps |= self.read(task_id, lo, hi)
+        for spec in writes:
+            for lo, hi in MemRegion.of(spec).intervals():
+                deps |= self.write(task_id, lo, hi)
+        deps.discard(task_id)
+        return deps
+
+
+@dataclass(frozen=True)
+class GraphParam:
+    """
+    Named placeholder for a task argument of a captured graph.
+
+    Pass it in `OrchestrationRuntime.add_task(args=...)` in place of a value;
+    `OrchestrationRuntime.replay(name=value)` patches every slot it occupies.
+    """
+
+    name: str
+
+
 class OrchestrationRuntime:
     """
     Helper for "orchestration functions" that build a task graph and run it via the
@@ -443,19 +1762,63 @@ class OrchestrationRuntime:
     - The orchestration code itself runs on the host CPU (Python), but *execution*
       is performed by launching the AICPU scheduler kernel which dispatches tasks
       to AICore workers.
-    - Dependency tracking here is intentionally lightweight. Use explicit
-      `graph.add_successor(...)` when you need precise dependencies.
+    - Dependencies are derived from the memory regions passed as `reads` /
+      `writes` (RAW, WAR and WAW on overlapping bytes). Use explicit
+      `add_successor(...)` for dependencies not visible through memory.
+    - With `reduce_edges=True`, edges implied by other paths are removed
+      before the first launch (`Graph.reduce_edges`); the result is kept in
+      `edge_reduction`.
+
+    Capture mode (`capture=True`): the first `run()` freezes the graph as a
+    template. Arguments given as `param(name, value)` placeholders can then be
+    patched in place by `replay(name=value, ...)`, which re-launches the same
+    tasks and edges without rebuilding the graph:
+
+        rt = OrchestrationRuntime(runner=runner, capture=True)
+        x = rt.param("x", x_dev)
+        rt.add_task([x, out_dev], func_id=0)
+        rt.run()                      # records the template
+        rt.replay(x=next_x_dev)       # patches slot 0 of the task and relaunches
     """
 
-    def __init__(self, *, runner: DeviceRunner, launch_aicpu_num: int = 1) -> None:
+    def __init__(
+        self,
+        *,
+        runner: DeviceRunner,
+        launch_aicpu_num: int = 1,
+        capture: bool = False,
+        reduce_edges: bool = False,
+    ) -> None:
         if not isinstance(runner, DeviceRunner):
             raise TypeError("OrchestrationRuntime requires a DeviceRunner")
         self.runner = runner
-        self.graph = Graph()
+        self.graph = Graph(runner)
         self.launch_aicpu_num = int(launch_aicpu_num)
-        # Coarse dependency map: "a buffer was last written by task X".
-        self._last_writer: dict[int, int] = {}
+        # Byte-range index of which tasks last wrote / read device memory.
+        self._regions = RegionDependencyTracker()
         self._task_names: dict[int, str] = {}
+        self.reduce_edges = bool(reduce_edges)
+        self.edge_reduction: EdgeReductionStats | None = None
+        # Capture state: parameter values and the (task, slot) pairs they occupy.
+        self.capture = bool(capture)
+        self._captured = False
+        self._params: dict[str, Any] = {}
+        self._param_slots: dict[str, list[tuple[int, int]]] = {}
+
+    def param(self, name: str, value: Any) -> GraphParam:
+        """Declare a patchable argument with its value for the first run."""
+        if not self.capture:
+            raise RuntimeError("param() requires an OrchestrationRuntime created with capture=True")
+        if self._captured:
+            raise RuntimeError("graph already captured; pass new values to replay()")
+        _pack_task_arg(value)  # Validate the type early
+        self._params[str(name)] = value
+        self._param_slots.setdefault(str(name), [])
+        return GraphParam(str(name))
+
+    @property
+    def captured(self) -> bool:
+        return self._captured
 
     def add_task(
         self,
@@ -464,30 +1827,39 @@ class OrchestrationRuntime:
         func_id: int,
         core_type: int = 1,
         name: str | None = None,
-        reads: list[int] | None = None,
-        writes: list[int] | None = None,
+        reads: list[Any] | None = None,
+        writes: list[Any] | None = None,
     ) -> int:
         """
-        Add a task to the graph and optionally add coarse dependencies.
+        Add a task to the graph and add the dependencies implied by its memory
+        accesses.
 
-        `reads`/`writes` are device pointers (ints). If a read pointer was last
-        written by another task, a dependency edge is added.
+        `reads`/`writes` entries are `MemRegion`s, `(ptr, nbytes)` pairs, or bare
+        device pointers (which conflict only with the same pointer). Edges are
+        added from earlier tasks that wrote overlapping bytes (RAW), read bytes
+        this task writes (WAR), or wrote bytes this task overwrites (WAW).
         """
-        tid = int(self.graph.add_task(args, func_id=int(func_id), core_type=int(core_type)))
+        if self._captured:
+            raise RuntimeError("graph is captured; use replay() instead of adding tasks")
+        values = list(args)
+        param_slots: list[tuple[str, int]] = []
+        for slot, item in enumerate(values):
+            if isinstance(item, GraphParam):
+                if item.name not in self._params:
+                    raise KeyError(f"unknown graph param: {item.name}")
+                param_slots.append((item.name, slot))
+                values[slot] = self._params[item.name]
+
+        tid = int(self.graph.add_task(values, func_id=int(func_id), core_type=int(core_type)))
+        for pname, slot in param_slots:
+            self._param_slots[pname].append((tid, slot))
         if name is None:
             # Keep names short so they fit in trace visualizations.
             name = f"t{tid}_{secrets.token_hex(3)}"
         self._task_names[tid] = str(name)
 
-        if reads:
-            for ptr in reads:
-                p = int(ptr)
-                if p in self._last_writer:
-                    self.graph.add_successor(int(self._last_writer[p]), tid)
-
-        if writes:
-            for ptr in writes:
-                self._last_writer[int(ptr)] = tid
+        for dep in sorted(self._regions.access(tid, reads or (), writes or ())):
+            self.graph.add_successor(int(dep), tid)
 
         return tid
 
@@ -499,10 +1871,56 @@ class OrchestrationRuntime:
         return dict(self._task_names)
 
     def add_successor(self, from_task: int, to_task: int) -> None:
+        if self._captured:
+            raise RuntimeError("graph is captured; edges cannot be added")
         self.graph.add_successor(int(from_task), int(to_task))
 
+    def add_successors(self, from_tasks: Any, to_tasks: Any) -> None:
+        """Add explicit dependency edges in bulk (see `Graph.add_successors`)."""
+        if self._captured:
+            raise RuntimeError("graph is captured; edges cannot be added")
+        self.graph.add_successors(from_tasks, to_tasks)
+
     def run(self) -> int:
         """
         Run the built graph via the AICPU scheduler (AI CPU).
+
+        In capture mode the first run records the graph as a template; later
+        runs replay it with the current parameter values.
+        """
+        if self._captured:
+            return self.replay()
+        if self.reduce_edges and self.edge_reduction is None:
+            self.edge_reduction = self.graph.reduce_edges()
+        rc = int(self.runner.run(self.graph, int(self.launch_aicpu_num)))
+        self._captured = self.capture
+        return rc
+
+    def replay(self, **values: Any) -> int:
+        """
+        Patch the named parameters and re-launch the captured graph.
+
+        Parameters not given keep their previous values. Tasks and edges are
+        not re-added; only the affected argument slots are rewritten.
         """
+        if not self._captured:
+            raise RuntimeError("no captured graph; create with capture=True and call run() first")
+        unknown = set(values) - set(self._params)
+        if unknown:
+            raise KeyError(f"unknown graph params: {sorted(unknown)}")
+
+        task_ids: list[int] = []
+        slots: list[int] = []
+        packed: list[int] = []
+        for pname, value in values.items():
+            bits = _pack_task_arg(value)
+            self._params[pname] = value
+            for tid, slot in self._param_slots[pname]:
+                task_ids.append(tid)
+                slots.append(slot)
+                packed.append(bits)
+        if task_ids:
+            self.graph.set_task_args(task_ids, slots, packed)
+
+        self.graph.reset_for_replay()
         return int(self.runner.run(self.graph, int(self.launch_aicpu_num)))
@@ -597,13 +597,14 @@ class CodeRunner:
 
         for kernel in self.kernels:
             print(f"Compiling kernel: {kernel['source']} (func_id={kernel['func_id']})")
-            incore_o = pto_compiler.compile_incore(
-                kernel["source"],
-                core_type=kernel["core_type"],
-                pto_isa_root=pto_isa_root,
-            )
+        # Compile concurrently; register in func_id order.
+        compiled = pto_compiler.compile_incore_batch(
+            [(kernel["func_id"], kernel["source"], kernel["core_type"]) for kernel in self.kernels],
+            pto_isa_root=pto_isa_root,
+        )
+        for func_id, incore_o in compiled:
             kernel_bin = extract_text_section(incore_o)
-            register_kernel(kernel["func_id"], kernel_bin)
+            register_kernel(func_id, kernel_bin)
 
         print("All kernels compiled and registered")
 
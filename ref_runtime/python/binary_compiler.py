@@ -1,11 +1,19 @@
+import fcntl
+import hashlib
 import os
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+from object_cache import cache_dir_from_env
 from toolchain import AICoreToolchain, AICPUToolchain, HostToolchain, HostSimToolchain
 
 
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
 class BinaryCompiler:
     """
     Binary compiler for compiling binaries for multiple target platforms.
@@ -19,6 +27,13 @@ class BinaryCompiler:
     Platform determines which toolchains and CMake directories are used:
     - "a2a3": ccec for aicore, aarch64 cross-compiler for aicpu, gcc for host
     - "a2a3sim": all use host gcc/g++ (builds host-compatible .so files)
+
+    Build settings (attributes, defaults from the environment):
+    - build_root: persistent build directories for incremental rebuilds
+      (PTO_BUILD_DIR, default ~/.cache/pto/build; "off" builds in a temp dir)
+    - jobs: parallel build jobs (PTO_BUILD_JOBS, default CPU count)
+    - use_ninja: use the Ninja generator when ninja is installed (PTO_BUILD_NINJA=1)
+    - verbose: echo full compiler command lines and build stdout (PTO_BUILD_VERBOSE=1)
     """
     _instances = {}
 
@@ -35,6 +50,10 @@ class BinaryCompiler:
         self.platform = platform
         self.project_root = Path(__file__).parent.parent
         self.platform_dir = self.project_root / "src" / "platform" / platform
+        self.build_root = self._default_build_root()
+        self.jobs = int(os.environ.get("PTO_BUILD_JOBS") or os.cpu_count() or 1)
+        self.use_ninja = _env_flag("PTO_BUILD_NINJA") and shutil.which("ninja") is not None
+        self.verbose = _env_flag("PTO_BUILD_VERBOSE")
 
         if not self.platform_dir.is_dir():
             raise ValueError(
@@ -117,6 +136,10 @@ class BinaryCompiler:
             host_dir=str(self.platform_dir / "host"),
         )
 
+    @staticmethod
+    def _default_build_root() -> Optional[Path]:
+        return cache_dir_from_env("PTO_BUILD_DIR", Path.home() / ".cache" / "pto" / "build")
+
     def _ensure_host_compilers(self):
         if not self._find_executable("gcc"):
             raise FileNotFoundError("Host C compiler not found: gcc. Please install gcc.")
@@ -177,6 +200,48 @@ class BinaryCompiler:
             cmake_source_dir, cmake_args, binary_name, platform=target_platform.upper()
         )
 
+    def _build_dir_key(self, cmake_source_dir: str, cmake_args: str, generator: str) -> str:
+        """Digest of everything that fixes a CMake build tree's configuration."""
+        h = hashlib.sha256()
+        h.update(f"{self.platform}\0{os.path.abspath(cmake_source_dir)}\0{cmake_args}\0{generator}".encode())
+        return h.hexdigest()[:16]
+
+    def _build_command(self, generator: str) -> List[str]:
+        if generator == "Ninja":
+            return ["ninja", f"-j{self.jobs}"] + (["-v"] if self.verbose else [])
+        return ["make", f"-j{self.jobs}"] + (["VERBOSE=1"] if self.verbose else [])
+
+    def _run_step(self, name: str, cmd: List[str], build_dir: str, platform: str) -> None:
+        print(f"\n{'='*80}")
+        print(f"[{platform}] {name} Command:")
+        print(f"  Working directory: {build_dir}")
+        print(f"  Command: {' '.join(cmd)}")
+        print(f"{'='*80}\n")
+
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=build_dir,
+                check=False,
+                capture_output=True,
+                text=True
+            )
+        except FileNotFoundError:
+            raise RuntimeError(f"{name} not found. Please install {name}.")
+
+        if result.stdout and (self.verbose or result.returncode != 0):
+            print(f"[{platform}] {name} stdout:")
+            print(result.stdout)
+        if result.stderr:
+            print(f"[{platform}] {name} stderr:")
+            print(result.stderr)
+
+        if result.returncode != 0:
+            step = "CMake configuration" if name == "CMake" else f"{name} build"
+            raise RuntimeError(
+                f"{step} failed for {platform}: {result.stderr}"
+            )
+
     def _run_compilation(
         self,
         cmake_source_dir: str,
@@ -185,7 +250,14 @@ class BinaryCompiler:
         platform: str = "AICore"
     ) -> bytes:
         """
-        Run CMake configuration and Make build in a temporary directory.
+        Run CMake configuration and an incremental parallel build.
+
+        Each (platform, source dir, CMake args, generator) combination gets a
+        persistent build directory under build_root, so repeated builds only
+        recompile changed sources. CMake is re-run every time because the
+        CMakeLists glob their source directories. Concurrent builds of the
+        same tree are serialized with a file lock. With build_root set to
+        None, a temporary directory is used as before.
 
         Args:
             cmake_source_dir: Path to CMake source directory
@@ -197,83 +269,45 @@ class BinaryCompiler:
             Compiled binary data as bytes
 
         Raises:
-            RuntimeError: If CMake or Make fails
+            RuntimeError: If CMake or the build fails
             FileNotFoundError: If output binary not found
         """
-        with tempfile.TemporaryDirectory(prefix=f"{platform.lower()}_build_", dir="/tmp") as build_dir:
-            # Run CMake configuration
-            cmake_cmd = ["cmake", cmake_source_dir] + cmake_args.split()
+        generator = "Ninja" if self.use_ninja else "Unix Makefiles"
 
-            print(f"\n{'='*80}")
-            print(f"[{platform}] CMake Command:")
-            print(f"  Working directory: {build_dir}")
-            print(f"  Command: {' '.join(cmake_cmd)}")
-            print(f"{'='*80}\n")
+        if self.build_root is None:
+            with tempfile.TemporaryDirectory(prefix=f"{platform.lower()}_build_", dir="/tmp") as build_dir:
+                return self._build_in(build_dir, cmake_source_dir, cmake_args, binary_name, generator, platform)
 
+        key = self._build_dir_key(cmake_source_dir, cmake_args, generator)
+        build_dir = self.build_root / f"{self.platform}-{platform.lower()}-{key}"
+        build_dir.mkdir(parents=True, exist_ok=True)
+        with open(build_dir / ".build.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
             try:
-                result = subprocess.run(
-                    cmake_cmd,
-                    cwd=build_dir,
-                    check=False,
-                    capture_output=True,
-                    text=True
-                )
-
-                if result.stdout:
-                    print(f"[{platform}] CMake stdout:")
-                    print(result.stdout)
-                if result.stderr:
-                    print(f"[{platform}] CMake stderr:")
-                    print(result.stderr)
-
-                if result.returncode != 0:
-                    raise RuntimeError(
-                        f"CMake configuration failed for {platform}: {result.stderr}"
-                    )
-            except FileNotFoundError:
-                raise RuntimeError(f"CMake not found. Please install CMake.")
-
-            # Run Make to build
-            make_cmd = ["make", "VERBOSE=1"]
-
-            print(f"\n{'='*80}")
-            print(f"[{platform}] Make Command:")
-            print(f"  Working directory: {build_dir}")
-            print(f"  Command: {' '.join(make_cmd)}")
-            print(f"{'='*80}\n")
+                return self._build_in(str(build_dir), cmake_source_dir, cmake_args, binary_name, generator, platform)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
 
-            try:
-                result = subprocess.run(
-                    make_cmd,
-                    cwd=build_dir,
-                    check=False,
-                    capture_output=True,
-                    text=True
-                )
-
-                if result.stdout:
-                    print(f"[{platform}] Make stdout:")
-                    print(result.stdout)
-                if result.stderr:
-                    print(f"[{platform}] Make stderr:")
-                    print(result.stderr)
-
-                if result.returncode != 0:
-                    raise RuntimeError(
-                        f"Make build failed for {platform}: {result.stderr}"
-                    )
-            except FileNotFoundError:
-                raise RuntimeError(f"Make not found. Please install Make.")
-
-            # Read the compiled binary
-            binary_path = os.path.join(build_dir, binary_name)
-            if not os.path.isfile(binary_path):
-                raise FileNotFoundError(
-                    f"Compiled binary not found: {binary_path}. "
-                    f"Expected output file name: {binary_name}"
-                )
-
-            with open(binary_path, "rb") as f:
-                binary_data = f.read()
-
-        return binary_data
+    def _build_in(
+        self,
+        build_dir: str,
+        cmake_source_dir: str,
+        cmake_args: str,
+        binary_name: str,
+        generator: str,
+        platform: str
+    ) -> bytes:
+        cmake_cmd = ["cmake", "-G", generator, cmake_source_dir] + cmake_args.split()
+        self._run_step("CMake", cmake_cmd, build_dir, platform)
+        self._run_step("Ninja" if generator == "Ninja" else "Make", self._build_command(generator), build_dir, platform)
+
+        # Read the compiled binary
+        binary_path = os.path.join(build_dir, binary_name)
+        if not os.path.isfile(binary_path):
+            raise FileNotFoundError(
+                f"Compiled binary not found: {binary_path}. "
+                f"Expected output file name: {binary_name}"
+            )
+
+        with open(binary_path, "rb") as f:
+            return f.read()
@@ -0,0 +1,120 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# Values of a cache-directory environment variable that disable the cache.
+DISABLED_VALUES = ("off", "0", "false", "none")
+
+
+def cache_dir_from_env(name: str, default: Path) -> Optional[Path]:
+    """
+    Cache directory configured by environment variable name.
+
+    Args:
+        name: Environment variable holding the directory
+        default: Directory used when the variable is unset or empty
+
+    Returns:
+        The directory, or None if the variable disables the cache ("off", "0", "false", "none")
+    """
+    value = os.environ.get(name, "").strip()
+    if value.lower() in DISABLED_VALUES:
+        return None
+    return Path(value).expanduser() if value else Path(default)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write data to path through a temp file in the same directory and a rename,
+    so concurrent readers see either the old file or the complete new one.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp_", suffix=path.suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ObjectCache:
+    """
+    Content-addressed on-disk cache of compiled objects with LRU size eviction.
+
+    Entries are files named by their key. A hit refreshes the entry's mtime,
+    and a store evicts the least recently used entries until the cache fits
+    in max_bytes. Writes are atomic, so several processes (or threads) can
+    share one directory.
+
+    Configured from the environment by from_env():
+    - PTO_COMPILE_CACHE_DIR: cache directory (default ~/.cache/pto/objects;
+      "off" disables the cache)
+    - PTO_COMPILE_CACHE_MAX_BYTES: size limit (default 2 GiB)
+    """
+
+    DEFAULT_MAX_BYTES = 2 << 30
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize ObjectCache.
+
+        Args:
+            cache_dir: Directory holding the cached objects (created on first store)
+            max_bytes: Total size above which least recently used entries are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_bytes)
+
+    @classmethod
+    def from_env(cls) -> Optional["ObjectCache"]:
+        """Cache configured by PTO_COMPILE_CACHE_DIR / PTO_COMPILE_CACHE_MAX_BYTES, or None if disabled."""
+        cache_dir = cache_dir_from_env("PTO_COMPILE_CACHE_DIR", Path.home() / ".cache" / "pto" / "objects")
+        if cache_dir is None:
+            return None
+        max_bytes = int(os.environ.get("PTO_COMPILE_CACHE_MAX_BYTES") or cls.DEFAULT_MAX_BYTES)
+        return cls(cache_dir, max_bytes)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.bin"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached bytes for key (marking the entry as recently used), or None."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store data under key, then evict old entries beyond max_bytes."""
+        write_atomic(self._path(key), data)
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.bin"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+            total += st.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
@@ -1,9 +1,14 @@
+import hashlib
 import os
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from object_cache import ObjectCache
 
 
 class PTOCompiler:
@@ -15,8 +20,14 @@ class PTOCompiler:
     - "a2a3sim": Uses g++ for simulation kernels (host execution)
 
     Both platforms use g++ for orchestration compilation.
+
+    Compiled objects are cached in an ObjectCache (see ObjectCache.from_env;
+    set object_cache to None to disable), keyed by the preprocessed source,
+    the compiler command line and the compiler version.
     """
 
+    _compiler_versions: Dict[str, str] = {}
+
     def __init__(self, platform: str = "a2a3", ascend_home_path: Optional[str] = None):
         """
         Initialize PTOCompiler.
@@ -44,6 +55,7 @@ class PTOCompiler:
             ascend_home_path = os.getenv("ASCEND_HOME_PATH")
 
         self.ascend_home_path = ascend_home_path
+        self.object_cache = ObjectCache.from_env()
 
         if platform == "a2a3":
             if not self.ascend_home_path:
@@ -122,7 +134,7 @@ class PTOCompiler:
 
         # Generate output path
         timestamp = int(time.time() * 1000)
-        output_path = f"/tmp/incore_{timestamp}_{os.getpid()}.o"
+        output_path = f"/tmp/incore_{timestamp}_{os.getpid()}_{threading.get_ident()}.o"
 
         # Build compilation command
         cmd = self._build_compile_command(
@@ -141,6 +153,12 @@ class PTOCompiler:
         print(f"  Command: {' '.join(cmd)}")
         print(f"{'='*80}\n")
 
+        cache_key = self._cache_key(cmd, output_path)
+        cached = self.object_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            print(f"[Incore] Cache hit: {len(cached)} bytes")
+            return cached
+
         try:
             result = subprocess.run(
                 cmd,
@@ -172,9 +190,137 @@ class PTOCompiler:
         # Clean up temp file
         os.remove(output_path)
 
+        if cache_key:
+            self.object_cache.put(cache_key, binary_data)
+
         print(f"[Incore] Compilation successful: {len(binary_data)} bytes")
         return binary_data
 
+    def compile_incore_batch(
+        self,
+        kernels: List[Tuple[int, str, str]],
+        pto_isa_root: Optional[str] = None,
+        extra_include_dirs: Optional[List[str]] = None,
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[int, bytes]]:
+        """
+        Compile several kernels concurrently with compile_incore.
+
+        Each compilation is a compiler subprocess; at most `max_workers` run
+        at a time.
+
+        Args:
+            kernels: (func_id, source_path, core_type) entries
+            pto_isa_root: Path to PTO-ISA root directory. Required for a2a3.
+            extra_include_dirs: Additional include directories
+            max_workers: Maximum concurrent compilations. Default: CPU count
+
+        Returns:
+            (func_id, binary) pairs sorted by func_id, ready to register in order
+
+        Raises:
+            ValueError: If a func_id appears more than once
+            RuntimeError: If a compilation fails (the lowest failing func_id
+                          is reported after all compilations finish)
+        """
+        ordered = sorted(kernels, key=lambda k: k[0])
+        func_ids = [k[0] for k in ordered]
+        if len(set(func_ids)) != len(func_ids):
+            raise ValueError(f"Duplicate func_ids in kernel batch: {func_ids}")
+        if not ordered:
+            return []
+
+        workers = max(1, min(len(ordered), max_workers or os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    self.compile_incore,
+                    source_path,
+                    core_type=core_type,
+                    pto_isa_root=pto_isa_root,
+                    extra_include_dirs=extra_include_dirs
+                )
+                for _, source_path, core_type in ordered
+            ]
+
+        results = []
+        for (func_id, source_path, _), future in zip(ordered, futures):
+            exc = future.exception()
+            if exc is not None:
+                raise RuntimeError(
+                    f"Kernel compilation failed (func_id={func_id}, source={source_path}): {exc}"
+                ) from exc
+            results.append((func_id, future.result()))
+        return results
+
+    @classmethod
+    def _compiler_version(cls, compiler: str) -> str:
+        """Full `<compiler> --version` output (cached per process)."""
+        if compiler not in cls._compiler_versions:
+            try:
+                result = subprocess.run([compiler, "--version"], capture_output=True, text=True)
+                cls._compiler_versions[compiler] = result.stdout + result.stderr
+            except OSError:
+                cls._compiler_versions[compiler] = ""
+        return cls._compiler_versions[compiler]
+
+    def _cache_key(
+        self,
+        cmd: List[str],
+        output_path: str,
+        aux_paths: Optional[List[str]] = None
+    ) -> Optional[str]:
+        """
+        Object cache key for a compile command.
+
+        Hashes the preprocessed source (so header changes are seen), the
+        command line with the temporary output/aux file paths masked, the
+        contents of the aux files (e.g. linker scripts) and the compiler
+        version.
+
+        Returns:
+            The key, or None if caching is disabled or preprocessing fails
+            (the real compile then reports the error)
+        """
+        if self.object_cache is None:
+            return None
+        aux_paths = aux_paths or []
+
+        def mask(arg: str) -> str:
+            arg = arg.replace(output_path, "<output>")
+            for i, path in enumerate(aux_paths):
+                arg = arg.replace(path, f"<aux{i}>")
+            return arg
+
+        # Preprocess only: drop the output and compile/link mode flags
+        pp_cmd = []
+        skip_next = False
+        for arg in cmd:
+            if skip_next:
+                skip_next = False
+            elif arg == "-o":
+                skip_next = True
+            elif arg not in ("-c", "-shared"):
+                pp_cmd.append(arg)
+        pp_cmd.append("-E")
+
+        try:
+            result = subprocess.run(pp_cmd, capture_output=True)
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+
+        h = hashlib.sha256()
+        h.update("\0".join(mask(arg) for arg in cmd).encode())
+        h.update(b"\0")
+        h.update(self._compiler_version(cmd[0]).encode())
+        for path in aux_paths:
+            with open(path, "rb") as f:
+                h.update(f.read())
+        h.update(result.stdout)
+        return h.hexdigest()
+
     def _build_compile_command(
         self,
         source_path: str,
@@ -260,7 +406,7 @@ class PTOCompiler:
 
         # Generate output path
         timestamp = int(time.time() * 1000)
-        output_path = f"/tmp/orch_{timestamp}_{os.getpid()}.so"
+        output_path = f"/tmp/orch_{timestamp}_{os.getpid()}_{threading.get_ident()}.so"
 
         # Build compilation command (using g++)
         cmd = [
@@ -294,6 +440,12 @@ class PTOCompiler:
         print(f"  Command: {' '.join(cmd)}")
         print(f"{'='*80}\n")
 
+        cache_key = self._cache_key(cmd, output_path)
+        cached = self.object_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            print(f"[Orchestration] Cache hit: {len(cached)} bytes")
+            return cached
+
         # Execute
         try:
             result = subprocess.run(
@@ -326,6 +478,9 @@ class PTOCompiler:
         # Clean up temp file
         os.remove(output_path)
 
+        if cache_key:
+            self.object_cache.put(cache_key, binary_data)
+
         print(f"[Orchestration] Compilation successful: {len(binary_data)} bytes")
         return binary_data
 
@@ -357,7 +512,7 @@ class PTOCompiler:
         # Generate output path (use platform-appropriate extension)
         timestamp = int(time.time() * 1000)
         ext = ".dylib" if sys.platform == "darwin" else ".so"
-        output_path = f"/tmp/sim_kernel_{timestamp}_{os.getpid()}{ext}"
+        output_path = f"/tmp/sim_kernel_{timestamp}_{os.getpid()}_{threading.get_ident()}{ext}"
 
         # Build compilation command to create dynamic library
         cmd = [
@@ -377,7 +532,7 @@ class PTOCompiler:
 
         # Place kernel entry function at .text+0x0 via -ffunction-sections + linker layout
         kernel_func = Path(source_path).stem  # kernel_add.cpp -> kernel_add
-        order_file_path = f"/tmp/sim_kernel_order_{timestamp}_{os.getpid()}"
+        order_file_path = f"/tmp/sim_kernel_order_{timestamp}_{os.getpid()}_{threading.get_ident()}"
         if sys.platform == "darwin":
             order_file_path += ".txt"
             with open(order_file_path, 'w') as f:
@@ -408,6 +563,13 @@ class PTOCompiler:
         print(f"  Command: {' '.join(cmd)}")
         print(f"{'='*80}\n")
 
+        cache_key = self._cache_key(cmd, output_path, aux_paths=[order_file_path])
+        cached = self.object_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            os.remove(order_file_path)
+            print(f"[SimKernel] Cache hit: {len(cached)} bytes")
+            return cached
+
         # Execute
         try:
             result = subprocess.run(
@@ -442,5 +604,8 @@ class PTOCompiler:
         if os.path.isfile(order_file_path):
             os.remove(order_file_path)
 
+        if cache_key:
+            self.object_cache.put(cache_key, binary_data)
+
         print(f"[SimKernel] Compilation successful: {len(binary_data)} bytes")
         return binary_data
@@ -210,6 +210,10 @@ int register_kernel(int func_id, const uint8_t* bin_data, size_t bin_size) {
     }
 }
 
+int DeviceRunner_LoadKernelBinary(int func_id, const uint8_t* bin_data, size_t bin_size) {
+    return register_kernel(func_id, bin_data, bin_size);
+}
+
 void record_tensor_pair(RuntimeHandle runtime, void* host_ptr, void* dev_ptr, size_t size) {
     if (runtime == NULL) {
         return;
@@ -210,6 +210,19 @@ int set_device(int device_id);
  */
 int register_kernel(int func_id, const uint8_t* bin_data, size_t bin_size);
 
+/**
+ * Load a prebuilt kernel binary for a func_id (pto_runtime entry point).
+ *
+ * Same as register_kernel(); pto_runtime.DeviceRunner uses it to load kernel
+ * objects from its kernel cache instead of compiling the kernel source.
+ *
+ * @param func_id   Function identifier (0, 1, 2, ...)
+ * @param bin_data  Kernel .text section binary data
+ * @param bin_size  Size of binary data in bytes
+ * @return 0 on success, error code on failure
+ */
+int DeviceRunner_LoadKernelBinary(int func_id, const uint8_t* bin_data, size_t bin_size);
+
 #ifdef __cplusplus
 } /* extern "C" */
 #endif
@@ -0,0 +1,176 @@
+/**
+ * Graph C API - ctypes entry points for building host task graphs
+ *
+ * pto_runtime.Graph drives these functions through ctypes. A graph handle is
+ * a heap-allocated Runtime; every function returns an int status
+ * (0 or a task ID on success, -1 on error) so Python can check it.
+ */
+
+#include "runtime.h"
+#include <cstdint>
+#include <cstdio>
+#include <new>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Defined in graph_reduction.cpp */
+int reduce_transitive_edges_impl(Runtime* runtime, int exact_limit, int* edges_before);
+
+/**
+ * Create an empty graph.
+ *
+ * @return Graph handle, or NULL on allocation failure
+ */
+void* Graph_Create(void) { return new (std::nothrow) Runtime(); }
+
+/**
+ * Destroy a graph created by Graph_Create.
+ *
+ * @param graph  Graph handle (NULL is ignored)
+ * @return 0
+ */
+int Graph_Destroy(void* graph) {
+    delete static_cast<Runtime*>(graph);
+    return 0;
+}
+
+/**
+ * Add one task.
+ *
+ * @param graph      Graph handle
+ * @param args       Packed task arguments
+ * @param num_args   Number of arguments
+ * @param func_id    Function identifier
+ * @param core_type  CoreType value (0 = AIC, 1 = AIV)
+ * @return Task ID (>= 0) on success, -1 on failure
+ */
+int Graph_AddTask(void* graph, uint64_t* args, int num_args, int func_id, int core_type) {
+    if (graph == nullptr) {
+        return -1;
+    }
+    return static_cast<Runtime*>(graph)->add_task(args, num_args, func_id, static_cast<CoreType>(core_type));
+}
+
+/**
+ * Add a batch of tasks with consecutive IDs (see Runtime::add_tasks).
+ *
+ * @param graph       Graph handle
+ * @param args        Row-major [num_tasks x num_args] argument matrix
+ * @param num_tasks   Number of tasks
+ * @param num_args    Arguments per task
+ * @param func_ids    Per-task function identifiers
+ * @param core_types  Per-task CoreType values, or NULL for AIC
+ * @return ID of the first task (>= 0) on success, -1 on failure
+ */
+int Graph_AddTasks(void* graph, const uint64_t* args, int num_tasks, int num_args, const int* func_ids,
+                   const int* core_types) {
+    if (graph == nullptr) {
+        return -1;
+    }
+    return static_cast<Runtime*>(graph)->add_tasks(args, num_tasks, num_args, func_ids, core_types);
+}
+
+/**
+ * Add a dependency edge: from_task -> to_task.
+ *
+ * @param graph      Graph handle
+ * @param from_task  Producer task ID
+ * @param to_task    Consumer task ID
+ * @return 0 on success, -1 on an invalid task ID or fanout overflow
+ */
+int Graph_AddSuccessor(void* graph, int from_task, int to_task) {
+    if (graph == nullptr) {
+        return -1;
+    }
+    Runtime* runtime = static_cast<Runtime*>(graph);
+    Task* from = runtime->get_task(from_task);
+    if (from == nullptr || runtime->get_task(to_task) == nullptr) {
+        fprintf(stderr, "[Runtime] ERROR: Invalid edge %d -> %d\n", from_task, to_task);
+        return -1;
+    }
+    int fanout_before = from->fanout_count;
+    runtime->add_successor(from_task, to_task);
+    return from->fanout_count == fanout_before + 1 ? 0 : -1;
+}
+
+/**
+ * Add a batch of dependency edges from_tasks[i] -> to_tasks[i]
+ * (see Runtime::add_successors; the graph is unchanged on failure).
+ *
+ * @param graph       Graph handle
+ * @param from_tasks  Producer task IDs
+ * @param to_tasks    Consumer task IDs
+ * @param num_edges   Number of edges
+ * @return 0 on success, -1 on failure
+ */
+int Graph_AddSuccessors(void* graph, const int* from_tasks, const int* to_tasks, int num_edges) {
+    if (graph == nullptr) {
+        return -1;
+    }
+    return static_cast<Runtime*>(graph)->add_successors(from_tasks, to_tasks, num_edges);
+}
+
+/**
+ * Overwrite argument slots of existing tasks (see Runtime::set_task_args).
+ *
+ * @param graph        Graph handle
+ * @param task_ids     Task IDs
+ * @param slots        Argument indices
+ * @param values       New argument values
+ * @param num_patches  Number of entries
+ * @return 0 on success, -1 on failure (no argument is written)
+ */
+int Graph_SetTaskArgs(void* graph, const int* task_ids, const int* slots, const uint64_t* values, int num_patches) {
+    if (graph == nullptr) {
+        return -1;
+    }
+    return static_cast<Runtime*>(graph)->set_task_args(task_ids, slots, values, num_patches);
+}
+
+/**
+ * Restore the fanin counters consumed by a launch so the graph can be
+ * launched again (see Runtime::reset_for_replay).
+ *
+ * @param graph  Graph handle
+ * @return 0 on success, -1 for a NULL handle
+ */
+int Graph_ResetForReplay(void* graph) {
+    if (graph == nullptr) {
+        return -1;
+    }
+    static_cast<Runtime*>(graph)->reset_for_replay();
+    return 0;
+}
+
+/**
+ * Remove dependency edges implied by other paths (see graph_reduction.cpp).
+ * Call before the graph is launched.
+ *
+ * @param graph         Graph handle
+ * @param exact_limit   Largest task count for the exact reduction
+ * @param edges_before  Optional output: number of edges before reduction
+ * @return Number of edges removed, or -1 on error (e.g. a dependency cycle)
+ */
+int Graph_ReduceEdges(void* graph, int exact_limit, int* edges_before) {
+    if (graph == nullptr) {
+        return -1;
+    }
+    return reduce_transitive_edges_impl(static_cast<Runtime*>(graph), exact_limit, edges_before);
+}
+
+/**
+ * @param graph  Graph handle
+ * @return Number of tasks, or -1 for a NULL handle
+ */
+int Graph_GetTaskCount(void* graph) {
+    if (graph == nullptr) {
+        return -1;
+    }
+    return static_cast<Runtime*>(graph)->get_task_count();
+}
+
+#ifdef __cplusplus
+}  /* extern "C" */
+#endif
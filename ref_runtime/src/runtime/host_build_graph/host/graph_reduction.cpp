@@ -0,0 +1,161 @@
+/**
+ * Graph Edge Reduction - Host-side Transitive Reduction
+ *
+ * Dependency edges that are implied by another path (a -> b -> c makes
+ * a -> c redundant) still cost fanin/fanout bookkeeping in the AICPU
+ * scheduler. reduce_transitive_edges_impl removes them before launch; Python
+ * reaches it through Graph_ReduceEdges (graph_c_api.cpp).
+ *
+ * Two modes:
+ *   - Exact (task count <= exact_limit): reachability bitsets computed in
+ *     reverse topological order; every edge implied by a longer path is
+ *     removed. O(V * E / 64) time, V^2 / 8 bytes.
+ *   - Approximate (larger graphs): only edges implied by a path of length
+ *     two are removed. O(sum of out-degree^2) time, O(V) memory.
+ *
+ * Duplicate edges are always collapsed.
+ */
+
+#include "runtime.h"
+#include <cstdint>
+#include <cstdio>
+#include <vector>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * Remove redundant dependency edges from a host-built graph.
+ *
+ * Must be called before the graph is launched (fanin counters are adjusted
+ * for the removed edges).
+ *
+ * @param runtime      Runtime holding the task graph
+ * @param exact_limit  Largest task count for the exact reduction
+ * @param edges_before Optional output: number of edges before reduction
+ * @return Number of edges removed, or -1 on error (e.g. a dependency cycle)
+ */
+int reduce_transitive_edges_impl(Runtime* runtime, int exact_limit, int* edges_before) {
+    if (runtime == nullptr) {
+        fprintf(stderr, "[Runtime] ERROR: Runtime pointer is null\n");
+        return -1;
+    }
+
+    const int n = runtime->get_task_count();
+    int total_edges = 0;
+    for (int i = 0; i < n; i++) {
+        total_edges += runtime->get_task(i)->fanout_count;
+    }
+    if (edges_before != nullptr) {
+        *edges_before = total_edges;
+    }
+    if (total_edges == 0) {
+        return 0;
+    }
+
+    // Topological order (Kahn); a cycle cannot be reduced or scheduled
+    std::vector<int> indegree(n, 0);
+    for (int u = 0; u < n; u++) {
+        Task* t = runtime->get_task(u);
+        for (int k = 0; k < t->fanout_count; k++) {
+            indegree[t->fanout[k]]++;
+        }
+    }
+    std::vector<int> order;
+    order.reserve(n);
+    for (int u = 0; u < n; u++) {
+        if (indegree[u] == 0) {
+            order.push_back(u);
+        }
+    }
+    for (size_t head = 0; head < order.size(); head++) {
+        Task* t = runtime->get_task(order[head]);
+        for (int k = 0; k < t->fanout_count; k++) {
+            if (--indegree[t->fanout[k]] == 0) {
+                order.push_back(t->fanout[k]);
+            }
+        }
+    }
+    if (static_cast<int>(order.size()) != n) {
+        fprintf(stderr, "[Runtime] ERROR: Dependency cycle detected; edges not reduced\n");
+        return -1;
+    }
+
+    const bool exact = n <= exact_limit;
+    const size_t words = (static_cast<size_t>(n) + 63) / 64;
+    std::vector<uint64_t> reach(exact ? words * n : 0, 0);  // Strict descendants per task
+    std::vector<uint64_t> implied(exact ? words : 0, 0);
+    std::vector<int> mark(n, -1);                           // Grandchildren of the current task
+    std::vector<int> dedup_mark(n, -1);
+
+    int removed = 0;
+    for (int idx = n - 1; idx >= 0; idx--) {
+        const int u = order[idx];
+        Task* t = runtime->get_task(u);
+
+        // Collapse duplicate edges
+        int kept = 0;
+        for (int k = 0; k < t->fanout_count; k++) {
+            int v = t->fanout[k];
+            if (dedup_mark[v] == u) {
+                runtime->get_task(v)->fanin--;
+                removed++;
+                continue;
+            }
+            dedup_mark[v] = u;
+            t->fanout[kept++] = v;
+        }
+        t->fanout_count = kept;
+
+        // Targets reachable through another child are redundant
+        if (exact) {
+            for (size_t w = 0; w < words; w++) {
+                implied[w] = 0;
+            }
+            for (int k = 0; k < t->fanout_count; k++) {
+                const uint64_t* r = &reach[static_cast<size_t>(t->fanout[k]) * words];
+                for (size_t w = 0; w < words; w++) {
+                    implied[w] |= r[w];
+                }
+            }
+        } else {
+            for (int k = 0; k < t->fanout_count; k++) {
+                Task* child = runtime->get_task(t->fanout[k]);
+                for (int j = 0; j < child->fanout_count; j++) {
+                    mark[child->fanout[j]] = u;
+                }
+            }
+        }
+
+        kept = 0;
+        for (int k = 0; k < t->fanout_count; k++) {
+            int v = t->fanout[k];
+            bool redundant = exact ? ((implied[v / 64] >> (v % 64)) & 1ULL) != 0 : mark[v] == u;
+            if (redundant) {
+                runtime->get_task(v)->fanin--;
+                removed++;
+                continue;
+            }
+            t->fanout[kept++] = v;
+        }
+        t->fanout_count = kept;
+
+        if (exact) {
+            uint64_t* r = &reach[static_cast<size_t>(u) * words];
+            for (size_t w = 0; w < words; w++) {
+                r[w] = implied[w];
+            }
+            for (int k = 0; k < t->fanout_count; k++) {
+                int v = t->fanout[k];
+                r[v / 64] |= 1ULL << (v % 64);
+            }
+        }
+    }
+
+    return removed;
+}
+
+#ifdef __cplusplus
+}  /* extern "C" */
+#endif
@@ -73,6 +73,42 @@ int Runtime::add_task(uint64_t* args, int num_args, int func_id, CoreType core_t
     return task_id;
 }
 
+int Runtime::add_tasks(const uint64_t* args, int num_tasks, int num_args, const int* func_ids,
+                       const int* core_types) {
+    if (num_tasks <= 0 || func_ids == nullptr) {
+        fprintf(stderr, "[Runtime] ERROR: Invalid task batch (num_tasks=%d)\n", num_tasks);
+        return -1;
+    }
+
+    if (num_tasks > RUNTIME_MAX_TASKS - next_task_id) {
+        fprintf(stderr, "[Runtime] ERROR: Task table full (max=%d, batch=%d)\n", RUNTIME_MAX_TASKS, num_tasks);
+        return -1;
+    }
+
+    if (num_args < 0 || num_args > RUNTIME_MAX_ARGS) {
+        fprintf(stderr, "[Runtime] ERROR: Too many args (%d > %d)\n", num_args, RUNTIME_MAX_ARGS);
+        return -1;
+    }
+
+    int first_id = next_task_id;
+    for (int i = 0; i < num_tasks; i++) {
+        Task* task = &tasks[next_task_id];
+        task->task_id = next_task_id++;
+        task->func_id = func_ids[i];
+        task->num_args = num_args;
+        if (args && num_args > 0) {
+            memcpy(task->args, args + (size_t)i * num_args, num_args * sizeof(uint64_t));
+        }
+        task->function_bin_addr = 0;
+        task->core_type = core_types ? static_cast<CoreType>(core_types[i]) : CoreType::AIC;
+        task->fanin = 0;
+        task->fanout_count = 0;
+        memset(task->fanout, 0, sizeof(task->fanout));
+    }
+
+    return first_id;
+}
+
 void Runtime::add_successor(int from_task, int to_task) {
     // Validate task IDs
     if (from_task < 0 || from_task >= next_task_id) {
@@ -98,6 +134,79 @@ void Runtime::add_successor(int from_task, int to_task) {
     to->fanin++;
 }
 
+int Runtime::add_successors(const int* from_tasks, const int* to_tasks, int num_edges) {
+    if (num_edges < 0 || (num_edges > 0 && (from_tasks == nullptr || to_tasks == nullptr))) {
+        fprintf(stderr, "[Runtime] ERROR: Invalid edge batch (num_edges=%d)\n", num_edges);
+        return -1;
+    }
+
+    // Validate task IDs
+    for (int i = 0; i < num_edges; i++) {
+        if (from_tasks[i] < 0 || from_tasks[i] >= next_task_id || to_tasks[i] < 0 || to_tasks[i] >= next_task_id) {
+            fprintf(stderr, "[Runtime] ERROR: Invalid edge %d: %d -> %d\n", i, from_tasks[i], to_tasks[i]);
+            return -1;
+        }
+    }
+
+    for (int i = 0; i < num_edges; i++) {
+        Task* from = &tasks[from_tasks[i]];
+        if (from->fanout_count >= RUNTIME_MAX_FANOUT) {
+            fprintf(stderr, "[Runtime] ERROR: Fanout overflow for task %d (max=%d)\n", from_tasks[i], RUNTIME_MAX_FANOUT);
+            // Roll back the edges inserted by this batch
+            for (int j = i - 1; j >= 0; j--) {
+                tasks[from_tasks[j]].fanout_count--;
+                tasks[to_tasks[j]].fanin--;
+            }
+            return -1;
+        }
+        from->fanout[from->fanout_count++] = to_tasks[i];
+        tasks[to_tasks[i]].fanin++;
+    }
+
+    return 0;
+}
+
+// =============================================================================
+// Graph Replay
+// =============================================================================
+
+int Runtime::set_task_args(const int* task_ids, const int* slots, const uint64_t* values, int num_patches) {
+    if (num_patches < 0 || (num_patches > 0 && (task_ids == nullptr || slots == nullptr || values == nullptr))) {
+        fprintf(stderr, "[Runtime] ERROR: Invalid argument patch batch (num_patches=%d)\n", num_patches);
+        return -1;
+    }
+
+    for (int i = 0; i < num_patches; i++) {
+        if (task_ids[i] < 0 || task_ids[i] >= next_task_id) {
+            fprintf(stderr, "[Runtime] ERROR: Invalid task ID %d in argument patch %d\n", task_ids[i], i);
+            return -1;
+        }
+        if (slots[i] < 0 || slots[i] >= tasks[task_ids[i]].num_args) {
+            fprintf(stderr, "[Runtime] ERROR: Invalid arg slot %d for task %d (num_args=%d)\n",
+                    slots[i], task_ids[i], tasks[task_ids[i]].num_args);
+            return -1;
+        }
+    }
+
+    for (int i = 0; i < num_patches; i++) {
+        tasks[task_ids[i]].args[slots[i]] = values[i];
+    }
+    return 0;
+}
+
+void Runtime::reset_for_replay() {
+    for (int i = 0; i < next_task_id; i++) {
+        tasks[i].fanin = 0;
+        tasks[i].start_time = 0;
+        tasks[i].end_time = 0;
+    }
+    for (int i = 0; i < next_task_id; i++) {
+        for (int j = 0; j < tasks[i].fanout_count; j++) {
+            tasks[tasks[i].fanout[j]].fanin++;
+        }
+    }
+}
+
 // =============================================================================
 // Query Methods
 // =============================================================================
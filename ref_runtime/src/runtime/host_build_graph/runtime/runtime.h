@@ -206,6 +206,22 @@ public:
      */
     int add_task(uint64_t *args, int num_args, int func_id, CoreType core_type = CoreType::AIC);
 
+    /**
+     * Allocate a batch of tasks with consecutive IDs
+     *
+     * Either all tasks are added or none (capacity and argument count are
+     * checked before any task is allocated).
+     *
+     * @param args        Row-major [num_tasks x num_args] argument matrix
+     * @param num_tasks   Number of tasks
+     * @param num_args    Arguments per task (must be <= RUNTIME_MAX_ARGS)
+     * @param func_ids    Per-task function identifiers
+     * @param core_types  Per-task core types (CoreType values), or nullptr for AIC
+     * @return ID of the first task (>= 0) on success, -1 on failure
+     */
+    int add_tasks(const uint64_t *args, int num_tasks, int num_args, const int *func_ids,
+                  const int *core_types);
+
     /**
      * Add a dependency edge: from_task -> to_task
      *
@@ -217,6 +233,46 @@ public:
      */
     void add_successor(int from_task, int to_task);
 
+    /**
+     * Add a batch of dependency edges: from_tasks[i] -> to_tasks[i]
+     *
+     * All task IDs are validated first; if any fanout array would overflow,
+     * the edges inserted so far are rolled back, so the graph is unchanged
+     * on failure.
+     *
+     * @param from_tasks  Producer task IDs
+     * @param to_tasks    Consumer task IDs
+     * @param num_edges   Number of edges
+     * @return 0 on success, -1 on failure
+     */
+    int add_successors(const int *from_tasks, const int *to_tasks, int num_edges);
+
+    // =========================================================================
+    // Graph Replay
+    // =========================================================================
+
+    /**
+     * Overwrite argument slots of existing tasks: tasks[task_ids[i]].args[slots[i]] = values[i]
+     *
+     * All entries are validated before any argument is written.
+     *
+     * @param task_ids    Task IDs
+     * @param slots       Argument indices (must be < the task's num_args)
+     * @param values      New argument values
+     * @param num_patches Number of entries
+     * @return 0 on success, -1 on failure
+     */
+    int set_task_args(const int *task_ids, const int *slots, const uint64_t *values, int num_patches);
+
+    /**
+     * Prepare an executed graph to be launched again
+     *
+     * Execution consumes the fanin counters; this recomputes them from the
+     * fanout arrays and clears the per-task timestamps. Tasks and edges are
+     * left unchanged.
+     */
+    void reset_for_replay();
+
     // =========================================================================
     // Query Methods
     // =========================================================================
@@ -0,0 +1,114 @@
+"""Tests for BinaryCompiler build directories and build commands."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add python/ to path so we can import binary_compiler
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "python"))
+
+
+@pytest.fixture
+def compiler(tmp_path, monkeypatch):
+    """Fresh a2a3sim BinaryCompiler building under tmp_path."""
+    from binary_compiler import BinaryCompiler
+
+    monkeypatch.setenv("PTO_BUILD_DIR", str(tmp_path / "build"))
+    monkeypatch.setenv("PTO_BUILD_JOBS", "4")
+    BinaryCompiler._instances.clear()
+    yield BinaryCompiler(platform="a2a3sim")
+    BinaryCompiler._instances.clear()
+
+
+def _fake_run(commands):
+    """subprocess.run stand-in that records commands and 'builds' the binary."""
+
+    def run(cmd, cwd=None, **kwargs):
+        commands.append((list(cmd), cwd))
+        if cmd[0] in ("make", "ninja"):
+            Path(cwd, "libhost_runtime.so").write_bytes(b"binary")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    return run
+
+
+class TestBuildDirectories:
+    """Persistent, incremental build directories."""
+
+    def test_build_dir_reused_across_builds(self, compiler, tmp_path):
+        """Identical builds run in the same persistent directory."""
+        commands = []
+        with patch("binary_compiler.subprocess.run", side_effect=_fake_run(commands)):
+            assert compiler.compile("host", [str(tmp_path)], [str(tmp_path)]) == b"binary"
+            assert compiler.compile("host", [str(tmp_path)], [str(tmp_path)]) == b"binary"
+
+        build_dirs = {cwd for _, cwd in commands}
+        assert len(build_dirs) == 1
+        build_dir = Path(build_dirs.pop())
+        assert build_dir.parent == tmp_path / "build"
+        assert build_dir.is_dir()
+
+    def test_different_args_use_different_dirs(self, compiler, tmp_path):
+        """Builds with different CMake arguments do not share a directory."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        commands = []
+        with patch("binary_compiler.subprocess.run", side_effect=_fake_run(commands)):
+            compiler.compile("host", [str(tmp_path / "a")], [str(tmp_path)])
+            compiler.compile("host", [str(tmp_path / "b")], [str(tmp_path)])
+
+        assert len({cwd for _, cwd in commands}) == 2
+
+    def test_build_root_off_uses_temp_dir(self, compiler, tmp_path):
+        """With build_root disabled, each build gets a fresh temp directory."""
+        compiler.build_root = None
+        commands = []
+        with patch("binary_compiler.subprocess.run", side_effect=_fake_run(commands)):
+            compiler.compile("host", [str(tmp_path)], [str(tmp_path)])
+
+        cwd = commands[0][1]
+        assert not os.path.exists(cwd)
+
+
+class TestBuildCommands:
+    """Parallel jobs, generator choice and verbosity."""
+
+    def test_parallel_make_without_verbose(self, compiler, tmp_path):
+        commands = []
+        with patch("binary_compiler.subprocess.run", side_effect=_fake_run(commands)):
+            compiler.compile("host", [str(tmp_path)], [str(tmp_path)])
+
+        cmake_cmd, build_cmd = commands[0][0], commands[1][0]
+        assert cmake_cmd[:3] == ["cmake", "-G", "Unix Makefiles"]
+        assert build_cmd == ["make", "-j4"]
+
+    def test_verbose_flag(self, compiler, tmp_path):
+        compiler.verbose = True
+        commands = []
+        with patch("binary_compiler.subprocess.run", side_effect=_fake_run(commands)):
+            compiler.compile("host", [str(tmp_path)], [str(tmp_path)])
+
+        assert commands[1][0] == ["make", "-j4", "VERBOSE=1"]
+
+    def test_ninja_generator(self, compiler, tmp_path):
+        compiler.use_ninja = True
+        commands = []
+        with patch("binary_compiler.subprocess.run", side_effect=_fake_run(commands)):
+            compiler.compile("host", [str(tmp_path)], [str(tmp_path)])
+
+        assert commands[0][0][:3] == ["cmake", "-G", "Ninja"]
+        assert commands[1][0] == ["ninja", "-j4"]
+
+    def test_build_failure_raises(self, compiler, tmp_path):
+        def run(cmd, cwd=None, **kwargs):
+            rc = 2 if cmd[0] == "make" else 0
+            return subprocess.CompletedProcess(cmd, rc, stdout="", stderr="boom")
+
+        with patch("binary_compiler.subprocess.run", side_effect=run):
+            with pytest.raises(RuntimeError, match="Make build failed for HOST: boom"):
+                compiler.compile("host", [str(tmp_path)], [str(tmp_path)])
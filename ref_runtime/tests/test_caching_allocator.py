@@ -0,0 +1,156 @@
+"""Tests for the CachingAllocator in front of the raw device allocator."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the repo root to path so we can import pto_runtime
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT.parent))
+
+from pto_runtime import CachingAllocator  # noqa: E402
+
+MiB = 1 << 20
+
+
+class Driver:
+    """Raw allocator stand-in recording driver calls."""
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity
+        self.live = {}
+        self.allocs = []
+        self.frees = []
+        self._next = 0x1000
+
+    def alloc(self, nbytes):
+        if self.capacity is not None and sum(self.live.values()) + nbytes > self.capacity:
+            return 0
+        ptr = self._next
+        self._next += nbytes
+        self.live[ptr] = nbytes
+        self.allocs.append(nbytes)
+        return ptr
+
+    def free(self, ptr):
+        self.frees.append(ptr)
+        del self.live[ptr]
+
+
+@pytest.fixture
+def driver():
+    return Driver()
+
+
+def _allocator(driver, **kwargs):
+    return CachingAllocator(driver.alloc, driver.free, **kwargs)
+
+
+class TestSizeClass:
+    @pytest.mark.parametrize("nbytes, size", [
+        (0, 512), (1, 512), (512, 512), (513, 1024), (MiB, MiB),
+        (MiB + 1, MiB + MiB // 4),      # quarter steps of [1 MiB, 2 MiB)
+        (3 * MiB, 3 * MiB),
+        (3 * MiB + 1, 3 * MiB + MiB // 2),
+    ])
+    def test_rounding(self, nbytes, size):
+        assert CachingAllocator.size_class(nbytes) == size
+
+    def test_waste_is_bounded(self):
+        for nbytes in (MiB + 1, 5 * MiB - 3, 123_456_789):
+            assert CachingAllocator.size_class(nbytes) - nbytes <= nbytes // 4
+
+
+class TestReuseAndStats:
+    def test_same_class_hits(self, driver):
+        a = _allocator(driver)
+        p = a.allocate(100)
+        a.free(p)
+        assert a.allocate(300) == p
+        assert driver.allocs == [512]
+        stats = a.stats()
+        assert (stats["hits"], stats["misses"], stats["driver_allocs"]) == (1, 1, 1)
+
+    def test_other_class_misses(self, driver):
+        a = _allocator(driver)
+        a.free(a.allocate(100))
+        a.allocate(600)
+        assert driver.allocs == [512, 1024]
+        assert a.stats()["cached_bytes"] == 512
+
+    def test_peaks(self, driver):
+        a = _allocator(driver)
+        p, q = a.allocate(512), a.allocate(1024)
+        a.free(q)
+        a.free(p)
+        a.allocate(512)
+        stats = a.stats()
+        assert stats["peak_allocated_bytes"] == 1536
+        assert stats["peak_reserved_bytes"] == 1536
+        assert (stats["allocated_bytes"], stats["cached_bytes"], stats["reserved_bytes"]) == (512, 1024, 1536)
+        assert (stats["active_blocks"], stats["cached_blocks"]) == (1, 1)
+
+    def test_max_cached_bytes_trims(self, driver):
+        a = _allocator(driver, max_cached_bytes=1024)
+        ptrs = [a.allocate(512) for _ in range(3)]
+        for p in ptrs:
+            a.free(p)
+        assert driver.frees == [ptrs[2]]
+        assert a.stats()["cached_bytes"] == 1024
+        assert a.stats()["driver_frees"] == 1
+
+    def test_empty_cache(self, driver):
+        a = _allocator(driver)
+        ptrs = [a.allocate(n) for n in (512, 1024, 4096)]
+        keep = a.allocate(512)
+        for p in ptrs:
+            a.free(p)
+        a.empty_cache()
+        assert sorted(driver.frees) == sorted(ptrs)
+        assert list(driver.live) == [keep]
+        assert a.stats()["cached_bytes"] == 0
+        assert a.allocate(1024) not in ptrs
+
+    def test_out_of_memory_releases_cache_and_retries(self):
+        driver = Driver(capacity=2048)
+        a = _allocator(driver)
+        a.free(a.allocate(2048))
+        p = a.allocate(1024)
+        assert p != 0
+        assert a.stats()["cached_bytes"] == 0
+
+    def test_foreign_pointer_goes_to_driver(self, driver):
+        a = _allocator(driver)
+        ptr = driver.alloc(64)
+        a.free(ptr)
+        assert driver.frees == [ptr]
+
+
+class TestStreams:
+    def test_block_stays_on_its_stream(self, driver):
+        a = _allocator(driver)
+        p = a.allocate(512, stream=1)
+        a.free(p)
+        assert a.allocate(512, stream=0) != p
+        assert a.allocate(512, stream=1) == p
+
+    def test_synchronized_blocks_are_shared_by_all_streams(self, driver):
+        a = _allocator(driver)
+        p, q = a.allocate(512, stream=1), a.allocate(512, stream=1)
+        a.free(p)
+        a.free(q)
+        a.synchronize([1])
+        assert a.streams() == set()
+        assert {a.allocate(512, stream=2), a.allocate(512, stream=0)} == {p, q}
+        assert driver.allocs == [512, 512]
+
+    def test_synchronize_leaves_other_streams_private(self, driver):
+        a = _allocator(driver)
+        p, q = a.allocate(512, stream=1), a.allocate(1024, stream=2)
+        a.free(p)
+        a.free(q)
+        a.synchronize([2])
+        assert a.streams() == {1}
+        assert a.allocate(1024, stream=0) == q
+        assert a.allocate(512, stream=0) != p
@@ -0,0 +1,174 @@
+"""Tests for DeviceRunner async copies and stream-ordered block reuse."""
+
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Add the repo root to path so we can import pto_runtime
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT.parent))
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    """Initialized DeviceRunner over a host library stand-in."""
+    import pto_runtime
+
+    pointers = iter(range(1 << 20, 1 << 40, 1 << 20))
+    bound = threading.local()
+    lib = types.SimpleNamespace(
+        bound=bound,
+        DeviceRunner_BindDevice=lambda device_id: setattr(bound, "device", device_id) or 0,
+        DeviceRunner_AllocateTensor=lambda nbytes: next(pointers),
+        DeviceRunner_FreeTensor=lambda ptr: None,
+        DeviceRunner_CopyToDevice=lambda dst, src, nbytes: 0,
+        DeviceRunner_Run=lambda graph, workers, aicpu_num: 0,
+    )
+    monkeypatch.setattr(pto_runtime, "_LIB", lib)
+    r = pto_runtime.DeviceRunner()
+    r._initialized = True
+    r.device_id = 3
+    r._cube_blocks = 1
+    r.lib = lib
+    yield r
+    for executor in r._copy_streams.values():
+        executor.shutdown(wait=True)
+
+
+class TestAsyncCopies:
+    def test_failed_copy_reported_after_later_submit(self, runner):
+        """A copy that failed before the next submit on its stream is still reported."""
+        rcs = [7, 0]
+        runner.lib.DeviceRunner_CopyToDevice = lambda dst, src, nbytes: rcs.pop(0)
+
+        runner.copy_to_device_async(1 << 20, np.zeros(4, np.float32)).result()
+        runner.copy_to_device_async(1 << 20, np.zeros(4, np.float32)).result()
+
+        with pytest.raises(RuntimeError, match="rc=7"):
+            runner.synchronize(0)
+
+    def test_failed_copy_blocks_run(self, runner):
+        runner.lib.DeviceRunner_CopyToDevice = lambda dst, src, nbytes: 3
+        runner.copy_to_device_async(1 << 20, np.zeros(4, np.float32)).result()
+
+        with pytest.raises(RuntimeError, match="rc=3"):
+            runner.run(types.SimpleNamespace(_ptr=None))
+
+    def test_copy_threads_bind_the_device(self, runner):
+        devices = []
+
+        def copy(dst, src, nbytes):
+            devices.append(getattr(runner.lib.bound, "device", None))
+            return 0
+
+        runner.lib.DeviceRunner_CopyToDevice = copy
+        runner.copy_to_device_async(1 << 20, np.zeros(4, np.float32), stream=0)
+        runner.copy_to_device_async(1 << 20, np.zeros(4, np.float32), stream=1)
+        runner.synchronize()
+        assert devices == [3, 3]
+
+    def test_without_binding_copies_run_on_calling_thread(self, runner):
+        del runner.lib.DeviceRunner_BindDevice
+        threads = []
+
+        def copy(dst, src, nbytes):
+            threads.append(threading.current_thread())
+            return 0
+
+        runner.lib.DeviceRunner_CopyToDevice = copy
+        future = runner.copy_to_device_async(1 << 20, np.zeros(4, np.float32), stream=1)
+        assert future.done() and future.result() == 0
+        assert threads == [threading.current_thread()]
+        assert runner._copy_streams == {}
+
+
+class TestStreamReuse:
+    def test_busy_stream_blocks_not_shared_after_run(self, runner):
+        """Blocks of a stream with a copy in flight stay on that stream after run()."""
+        release = threading.Event()
+        runner.lib.DeviceRunner_CopyToDevice = lambda dst, src, nbytes: (release.wait(), 0)[1]
+
+        block = runner.allocate_tensor(100, stream=1)
+        runner.free_tensor(block)
+        runner.copy_to_device_async(1 << 30, np.zeros(4, np.float32), stream=1)
+        runner.run(types.SimpleNamespace(_ptr=None))
+        assert runner.allocate_tensor(100) != block
+
+        release.set()
+        runner.synchronize(1)
+        assert runner.allocate_tensor(100) == block
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Fresh DeviceRunner singleton and per-device registry."""
+    import pto_runtime
+
+    monkeypatch.setattr(pto_runtime.DeviceRunner, "_instance", None)
+    monkeypatch.setattr(pto_runtime.DeviceRunner, "_device_runners", {})
+    return pto_runtime.DeviceRunner
+
+
+class TestForDevice:
+    def test_first_device_shares_the_process_runner(self, registry):
+        first = registry.for_device(4)
+        assert first is registry.get()
+        assert first._lib_slot == 0
+        assert registry.for_device(4) is first
+        assert [registry.for_device(d)._lib_slot for d in (0, 5)] == [1, 2]
+
+    def test_process_runner_serves_its_initialized_device(self, registry):
+        shared = registry.get()
+        shared.device_id = 2
+        assert registry.for_device(0) is not shared
+        assert registry.for_device(2) is shared
+
+    def test_runner_rejects_another_device(self, registry):
+        runner = registry.for_device(1)
+        with pytest.raises(ValueError, match="device 1 cannot init device 0"):
+            runner.init(0, 1)
+
+
+class TestDeviceLibraries:
+    @pytest.fixture
+    def libs(self, tmp_path, monkeypatch):
+        """Host library 'loaded' from a temp file; CDLL records the paths it opens."""
+        import pto_runtime
+
+        host = tmp_path / "libhost.so"
+        host.write_bytes(b"\x7fELF host library")
+        opened = []
+
+        def cdll(path):
+            opened.append(Path(path))
+            return types.SimpleNamespace(path=Path(path))
+
+        monkeypatch.setattr(pto_runtime, "_LIB", types.SimpleNamespace(path=host))
+        monkeypatch.setattr(pto_runtime, "_LIB_PATH", host)
+        monkeypatch.setattr(pto_runtime, "_DEVICE_LIBS", {})
+        monkeypatch.setattr(pto_runtime.ctypes, "CDLL", cdll)
+        monkeypatch.setattr(pto_runtime, "_bind_ctypes_signatures", lambda lib: None)
+        return host, opened
+
+    def test_slots_load_distinct_copies(self, libs):
+        import pto_runtime
+
+        host, opened = libs
+        assert pto_runtime._load_device_lib(0).path == host
+        one = pto_runtime._load_device_lib(1)
+        two = pto_runtime._load_device_lib(2)
+        assert pto_runtime._load_device_lib(1) is one
+        assert opened == [one.path, two.path]
+        assert len({host, one.path, two.path}) == 3
+        assert one.path.read_bytes() == two.path.read_bytes() == host.read_bytes()
+
+    def test_runners_use_their_slot(self, libs, registry):
+        host, _ = libs
+        first, second = registry.for_device(0), registry.for_device(1)
+        assert first._native().path == host
+        assert second._native().path == host.with_name("libhost.slot1.so")
@@ -0,0 +1,204 @@
+"""Tests for the host_build_graph Graph C API driven through pto_runtime.Graph."""
+
+import ctypes
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Add the repo root to path so we can import pto_runtime
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT.parent))
+
+RUNTIME_DIR = PROJECT_ROOT / "src" / "runtime" / "host_build_graph"
+GRAPH_SOURCES = [
+    RUNTIME_DIR / "runtime" / "runtime.cpp",
+    RUNTIME_DIR / "host" / "graph_c_api.cpp",
+    RUNTIME_DIR / "host" / "graph_reduction.cpp",
+]
+
+
+@pytest.fixture(scope="module")
+def graph_lib(tmp_path_factory):
+    """Graph_* entry points built into a shared library with the host C++ compiler."""
+    import pto_runtime
+
+    cxx = shutil.which("g++") or shutil.which("c++")
+    if cxx is None:
+        pytest.skip("no C++ compiler")
+    out = tmp_path_factory.mktemp("graph") / "libgraph.so"
+    subprocess.run(
+        [cxx, "-std=c++17", "-O2", "-shared", "-fPIC",
+         f"-I{RUNTIME_DIR / 'runtime'}", f"-I{PROJECT_ROOT / 'src' / 'platform' / 'include'}",
+         *map(str, GRAPH_SOURCES), "-o", str(out)],
+        check=True, capture_output=True,
+    )
+    lib = ctypes.CDLL(str(out))
+    pto_runtime._bind_graph_signatures(lib)
+    return lib
+
+
+@pytest.fixture
+def graph(graph_lib, monkeypatch):
+    import pto_runtime
+
+    monkeypatch.setattr(pto_runtime, "_LIB", graph_lib)
+    return pto_runtime.Graph()
+
+
+def _no_per_item_calls(lib, monkeypatch, *names):
+    """Make the per-task/per-edge entry points fail, so only batch calls can succeed."""
+    def fail(*args):
+        raise AssertionError("per-item FFI call used")
+
+    for name in names:
+        monkeypatch.setattr(lib, name, fail)
+
+
+class TestAddTasks:
+    def test_batch_is_one_native_call(self, graph, graph_lib, monkeypatch):
+        _no_per_item_calls(graph_lib, monkeypatch, "Graph_AddTask")
+        ids = graph.add_tasks(np.arange(12, dtype=np.uint64).reshape(4, 3), func_ids=[0, 1, 2, 3])
+        assert ids == range(0, 4)
+        ids = graph.add_tasks(np.zeros((2, 3), dtype=np.uint64), func_ids=7, core_types=0)
+        assert ids == range(4, 6)
+        assert graph.get_task_count() == 6
+
+    def test_too_many_args_raises(self, graph):
+        with pytest.raises(RuntimeError, match="Graph_AddTasks failed"):
+            graph.add_tasks(np.zeros((2, 64), dtype=np.uint64), func_ids=0)
+        assert graph.get_task_count() == 0
+
+
+class TestAddSuccessors:
+    def test_batch_is_one_native_call(self, graph, graph_lib, monkeypatch):
+        _no_per_item_calls(graph_lib, monkeypatch, "Graph_AddSuccessor")
+        graph.add_tasks(np.zeros((4, 1), dtype=np.uint64), func_ids=0)
+        graph.add_successors([0, 0, 1, 2], [1, 2, 3, 3])
+        assert graph.edges() == [(0, 1), (0, 2), (1, 3), (2, 3)]
+
+    def test_invalid_edge_leaves_graph_unchanged(self, graph):
+        graph.add_tasks(np.zeros((2, 1), dtype=np.uint64), func_ids=0)
+        with pytest.raises(RuntimeError, match="Graph_AddSuccessors failed"):
+            graph.add_successors([0, 1], [1, 5])
+        assert graph.edges() == []
+        graph.add_successor(0, 1)
+        assert graph.edges() == [(0, 1)]
+
+    def test_edges_kept_as_int32_arrays(self, graph):
+        graph.add_tasks(np.zeros((4, 1), dtype=np.uint64), func_ids=0)
+        src = np.array([1, 2], dtype=np.int32)
+        graph.add_successor(0, 1)
+        graph.add_successors(src, [3, 3])
+        src[0] = 0  # the graph keeps its own copy
+        graph.add_successor(0, 2)
+
+        from_tasks, to_tasks = graph.edge_arrays()
+        assert from_tasks.dtype == to_tasks.dtype == np.int32
+        assert from_tasks.tolist() == [0, 1, 2, 0] and to_tasks.tolist() == [1, 3, 3, 2]
+        assert not from_tasks.flags.writeable
+        assert graph.edges() == [(0, 1), (1, 3), (2, 3), (0, 2)]
+
+
+class TestReplay:
+    def test_set_task_args_validates_slots(self, graph):
+        graph.add_tasks(np.zeros((2, 2), dtype=np.uint64), func_ids=0)
+        graph.set_task_args([0, 1], [1, 0], [5, 6])
+        with pytest.raises(RuntimeError, match="Graph_SetTaskArgs failed"):
+            graph.set_task_args([1], [2], [7])
+
+    def test_orchestration_replay(self, graph_lib):
+        import pto_runtime
+
+        class Runner(pto_runtime.DeviceRunner):
+            """Runner that records launches instead of driving a device."""
+
+            def __init__(self):
+                super().__init__(caching_allocator=False)
+                self.launches = []
+
+            def _native(self):
+                return graph_lib
+
+            def run(self, graph, launch_aicpu_num=1, **kwargs):
+                self.launches.append(graph.get_task_count())
+                return 0
+
+        runner = Runner()
+        rt = pto_runtime.OrchestrationRuntime(runner=runner, capture=True)
+        x = rt.param("x", 0x1000)
+        rt.add_task([x, 0x2000], func_id=0)
+        rt.add_task([0x2000, x], func_id=1)
+        assert rt.run() == 0
+        assert rt.replay(x=0x3000) == 0
+        assert rt.run() == 0
+        assert runner.launches == [2, 2, 2]
+
+
+def _reduced_edge_count(num_tasks, edges):
+    """Size of the transitive reduction of a DAG given in topological task order."""
+    succ = [set() for _ in range(num_tasks)]
+    for a, b in edges:
+        succ[a].add(b)
+    reach = [set() for _ in range(num_tasks)]
+    kept = 0
+    for u in reversed(range(num_tasks)):
+        implied = set().union(*(reach[v] for v in succ[u])) if succ[u] else set()
+        kept += len(succ[u] - implied)
+        reach[u] = implied | succ[u]
+    return kept
+
+
+class TestReduceEdges:
+    def test_removes_implied_and_duplicate_edges(self, graph):
+        graph.add_tasks(np.zeros((3, 1), dtype=np.uint64), func_ids=0)
+        graph.add_successors([0, 1, 0, 0], [1, 2, 2, 1])
+        stats = graph.reduce_edges()
+        assert (stats.edges_before, stats.edges_removed, stats.edges_after) == (4, 2, 2)
+        assert stats.exact
+
+    def test_exact_matches_transitive_reduction(self, graph):
+        rng = np.random.default_rng(0)
+        n = 60
+        graph.add_tasks(np.zeros((n, 1), dtype=np.uint64), func_ids=0)
+        src, dst = np.triu_indices(n, k=1)
+        pick = rng.random(src.shape[0]) < 0.15
+        edges = list(zip(src[pick].tolist(), dst[pick].tolist()))
+        graph.add_successors(src[pick], dst[pick])
+
+        stats = graph.reduce_edges()
+        assert stats.edges_before == len(edges)
+        assert stats.edges_after == _reduced_edge_count(n, edges)
+
+    def test_approximate_mode_only_uses_length_two_paths(self, graph):
+        graph.add_tasks(np.zeros((4, 1), dtype=np.uint64), func_ids=0)
+        # 0 -> 3 is implied only through a path of length three
+        graph.add_successors([0, 1, 2, 0], [1, 2, 3, 3])
+        stats = graph.reduce_edges(exact_limit=0)
+        assert not stats.exact
+        assert stats.edges_removed == 0
+        assert graph.reduce_edges().edges_removed == 1
+
+    def test_orchestration_reduce_edges(self, graph_lib):
+        import pto_runtime
+
+        class Runner(pto_runtime.DeviceRunner):
+            def __init__(self):
+                super().__init__(caching_allocator=False)
+
+            def _native(self):
+                return graph_lib
+
+            def run(self, graph, launch_aicpu_num=1, **kwargs):
+                return 0
+
+        rt = pto_runtime.OrchestrationRuntime(runner=Runner(), reduce_edges=True)
+        for _ in range(3):
+            rt.add_task([], func_id=0)
+        rt.add_successors([0, 1, 0], [1, 2, 2])
+        assert rt.run() == 0
+        assert rt.edge_reduction.edges_removed == 1
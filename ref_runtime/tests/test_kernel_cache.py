@@ -0,0 +1,91 @@
+"""Tests for the content-addressed kernel cache in pto.runtime."""
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# Add the repo root to path so we can import pto.runtime
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT.parent))
+
+from pto import runtime as pto_rt  # noqa: E402
+
+PTO_TEXT = "func @k() { return }"
+
+
+class Runner:
+    """Runner stand-in recording how kernels are loaded."""
+
+    def __init__(self, binaries=True):
+        self.loaded = []
+        if binaries:
+            self.supports_kernel_binaries = lambda: True
+
+    def load_kernel_binary(self, func_id, binary):
+        self.loaded.append(("binary", func_id, binary))
+        return 0
+
+    def compile_and_load_kernel(self, func_id, kernel_path, pto_isa_root=None, core_type=0):
+        self.loaded.append(("source", func_id, Path(kernel_path).read_text()))
+        return 0
+
+
+@pytest.fixture
+def tools(tmp_path, monkeypatch):
+    """Cache under tmp_path; ptoas and the device compiler are counted stand-ins."""
+    calls = {"ptoas": 0, "cc": []}
+
+    def ptoas(*, pto_path, out_cpp, cfg):
+        calls["ptoas"] += 1
+        out_cpp.write_text("// " + pto_path.read_text())
+
+    def compile_incore(source_path, core_type, pto_isa_root):
+        calls["cc"].append(core_type)
+        return f"obj:{core_type}".encode()
+
+    monkeypatch.setenv(pto_rt.KERNEL_CACHE_ENV, str(tmp_path / "cache"))
+    monkeypatch.setattr(pto_rt, "compile_pto_to_cce_cpp", ptoas)
+    monkeypatch.setattr(pto_rt.tempfile, "mkdtemp", lambda prefix: str(tmp_path / "build"))
+    monkeypatch.setattr(pto_rt, "_KERNEL_COMPILER", types.SimpleNamespace(compile_incore=compile_incore))
+    elf_parser = pto_rt._ref_runtime_module("elf_parser")
+    monkeypatch.setattr(elf_parser, "extract_text_section", lambda obj: b"text:" + obj)
+    return calls
+
+
+def _load(runner, core_type=0, func_id=0):
+    return pto_rt.compile_and_load_kernel_from_pto(
+        runner=runner, func_id=func_id, pto=PTO_TEXT, pto_isa_root=PROJECT_ROOT, core_type=core_type
+    )
+
+
+class TestKernelCache:
+    def test_warm_load_skips_ptoas_and_device_compiler(self, tools):
+        cold, warm = Runner(), Runner()
+        _load(cold)
+        _load(warm, func_id=1)
+        assert tools == {"ptoas": 1, "cc": ["aic"]}
+        assert warm.loaded == [("binary", 1, b"text:obj:aic")]
+
+    def test_binary_keyed_by_core_type(self, tools):
+        runner = Runner()
+        _load(runner, core_type=0)
+        _load(runner, core_type=1)
+        assert tools == {"ptoas": 1, "cc": ["aic", "aiv"]}
+        assert [b for _, _, b in runner.loaded] == [b"text:obj:aic", b"text:obj:aiv"]
+
+    def test_runner_without_binaries_compiles_source(self, tools):
+        runner = Runner(binaries=False)
+        _load(runner)
+        _load(runner)
+        assert tools == {"ptoas": 1, "cc": []}
+        assert runner.loaded[-1] == ("source", 0, "// " + PTO_TEXT)
+
+    def test_batch_loads_in_func_id_order(self, tools):
+        runner = Runner()
+        out = pto_rt.compile_and_load_kernels_from_pto(
+            runner=runner, kernels=[(2, PTO_TEXT, 1), (0, PTO_TEXT, 0)], pto_isa_root=PROJECT_ROOT
+        )
+        assert sorted(out) == [0, 2]
+        assert [(f, b) for _, f, b in runner.loaded] == [(0, b"text:obj:aic"), (2, b"text:obj:aiv")]
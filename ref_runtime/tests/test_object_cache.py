@@ -0,0 +1,126 @@
+"""Tests for ObjectCache and PTOCompiler object caching."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add python/ to path so we can import object_cache and pto_compiler
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "python"))
+
+
+class TestObjectCache:
+    """Store, lookup and LRU eviction."""
+
+    def test_put_get(self, tmp_path):
+        from object_cache import ObjectCache
+
+        cache = ObjectCache(tmp_path)
+        assert cache.get("k") is None
+        cache.put("k", b"object")
+        assert cache.get("k") == b"object"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        from object_cache import ObjectCache
+
+        cache = ObjectCache(tmp_path, max_bytes=25)
+        cache.put("a", b"a" * 10)
+        cache.put("b", b"b" * 10)
+        os.utime(tmp_path / "a.bin", ns=(1, 1))
+        os.utime(tmp_path / "b.bin", ns=(2, 2))
+        cache.get("a")  # a is now the most recently used
+
+        cache.put("c", b"c" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"a" * 10
+        assert cache.get("c") == b"c" * 10
+
+    def test_from_env(self, tmp_path, monkeypatch):
+        from object_cache import ObjectCache
+
+        monkeypatch.setenv("PTO_COMPILE_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("PTO_COMPILE_CACHE_MAX_BYTES", "1234")
+        cache = ObjectCache.from_env()
+        assert cache.cache_dir == tmp_path
+        assert cache.max_bytes == 1234
+
+        monkeypatch.setenv("PTO_COMPILE_CACHE_DIR", "off")
+        assert ObjectCache.from_env() is None
+
+    @pytest.mark.parametrize("value", ["off", "0", "False", " none "])
+    def test_cache_dir_from_env_disabled(self, value, tmp_path, monkeypatch):
+        from object_cache import cache_dir_from_env
+
+        monkeypatch.setenv("PTO_TEST_CACHE_DIR", value)
+        assert cache_dir_from_env("PTO_TEST_CACHE_DIR", tmp_path) is None
+        monkeypatch.setenv("PTO_TEST_CACHE_DIR", "")
+        assert cache_dir_from_env("PTO_TEST_CACHE_DIR", tmp_path) == tmp_path
+
+
+class TestCompilerCache:
+    """PTOCompiler reuses cached objects for unchanged compiles."""
+
+    @pytest.fixture
+    def compiler(self, tmp_path, monkeypatch):
+        from pto_compiler import PTOCompiler
+
+        monkeypatch.setenv("PTO_COMPILE_CACHE_DIR", str(tmp_path / "cache"))
+        return PTOCompiler(platform="a2a3sim")
+
+    def _fake_run(self, compiles, preprocessed):
+        """subprocess.run stand-in: -E prints the 'preprocessed' source, -o writes an object."""
+
+        def run(cmd, **kwargs):
+            if "--version" in cmd:
+                return subprocess.CompletedProcess(cmd, 0, stdout="g++ 1.0\n", stderr="")
+            if "-E" in cmd:
+                return subprocess.CompletedProcess(cmd, 0, stdout=preprocessed[0], stderr=b"")
+            compiles.append(cmd)
+            Path(cmd[cmd.index("-o") + 1]).write_bytes(b"object:" + preprocessed[0])
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+        return run
+
+    def test_orchestration_cache_hit_skips_compiler(self, compiler, tmp_path):
+        source = tmp_path / "orch.cpp"
+        source.write_text("int f() { return 0; }\n")
+        compiles = []
+        preprocessed = [b"int f() { return 0; }"]
+
+        with patch("pto_compiler.subprocess.run", side_effect=self._fake_run(compiles, preprocessed)):
+            first = compiler.compile_orchestration(str(source))
+            second = compiler.compile_orchestration(str(source))
+
+        assert first == second == b"object:int f() { return 0; }"
+        assert len(compiles) == 1
+
+    def test_preprocessed_change_misses(self, compiler, tmp_path):
+        """A change visible after preprocessing (e.g. in a header) recompiles."""
+        source = tmp_path / "orch.cpp"
+        source.write_text('#include "h.h"\n')
+        compiles = []
+        preprocessed = [b"int x = 1;"]
+
+        with patch("pto_compiler.subprocess.run", side_effect=self._fake_run(compiles, preprocessed)):
+            compiler.compile_orchestration(str(source))
+            preprocessed[0] = b"int x = 2;"
+            assert compiler.compile_orchestration(str(source)) == b"object:int x = 2;"
+
+        assert len(compiles) == 2
+
+    def test_disabled_cache_always_compiles(self, compiler, tmp_path):
+        compiler.object_cache = None
+        source = tmp_path / "orch.cpp"
+        source.write_text("int f();\n")
+        compiles = []
+
+        with patch("pto_compiler.subprocess.run", side_effect=self._fake_run(compiles, [b"x"])):
+            compiler.compile_orchestration(str(source))
+            compiler.compile_orchestration(str(source))
+
+        assert len(compiles) == 2
@@ -0,0 +1,59 @@
+"""Tests for the PerformanceEstimator static cycle model."""
+
+import sys
+from pathlib import Path
+
+# Add the repo's src/ to path so we can import the compiler
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT.parent / "src"))
+
+from compile.pto_codegen_ascend_a2a3_sim import get_cycle_cost  # noqa: E402
+from compile.pto_compile import PTOFunctionBuilder  # noqa: E402
+from compile.pto_compile_common import PTOModule  # noqa: E402
+from compile.pto_compile_perf import PerformanceEstimator  # noqa: E402
+from isa_definition.pto_isa_definition import TMATMUL_ACC, ElementType  # noqa: E402
+
+
+def _matmul_acc():
+    b = PTOFunctionBuilder("mm_acc")
+    for t in ("acc", "a", "b", "c"):
+        b.tile(t, 64, 64, ElementType.F32)
+    b.memref("x")
+    b.load("acc", "x").load("a", "x").load("b", "x")
+    # Added directly so is_cube is left unset, as for a hand-built program.
+    b._add_instr(TMATMUL_ACC(dst=b._get_tile("c"), acc=b._get_tile("acc"),
+                             a=b._get_tile("a"), b=b._get_tile("b")))
+    b.store("c", "x")
+    return b.build()
+
+
+class TestMatmulAcc:
+    def test_costed_like_matmul(self):
+        assert get_cycle_cost("TMATMUL_ACC", 64, 64) == get_cycle_cost("TMATMUL", 64, 64)
+
+    def test_runs_on_cube(self):
+        program = _matmul_acc()
+        assert not program.is_cube
+        est = PerformanceEstimator().estimate(program)
+        assert est.engine == "cube"
+        assert est.op_cycles["TMATMUL_ACC"] == get_cycle_cost("TMATMUL", 64, 64)
+
+
+class TestCalls:
+    def test_callee_assumptions_reach_caller(self):
+        inner = PTOFunctionBuilder("inner")
+        inner.tile("t", 32, 32, ElementType.F32).memref("x")
+        inner.for_loop("i", 0, "n").load("t", "x").store("t", "x").end_for()
+
+        outer = PTOFunctionBuilder("outer").not_in_core()
+        outer.call("inner").call("missing")
+
+        module = PTOModule("m")
+        module.add_function(inner.build())
+        module.add_function(outer.build())
+        est = PerformanceEstimator(module).estimate(module.get_function("outer"))
+
+        assert est.assumptions == [
+            "inner: loop i: trip count 1 assumed",
+            "call missing: not resolved, callee cost ignored",
+        ]
@@ -0,0 +1,85 @@
+"""Tests for PTOCompiler batch compilation."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add python/ to path so we can import pto_compiler
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "python"))
+
+
+class TestCompileIncoreBatch:
+    """Test compile_incore_batch() with compile_incore mocked out."""
+
+    def _compiler(self):
+        from pto_compiler import PTOCompiler
+
+        # a2a3sim does not require ASCEND_HOME_PATH
+        return PTOCompiler(platform="a2a3sim")
+
+    def test_results_sorted_by_func_id(self):
+        """Results come back in func_id order regardless of completion order."""
+        compiler = self._compiler()
+
+        def fake_compile(source_path, **kwargs):
+            # Later func_ids finish first
+            time.sleep(0.05 if source_path == "a.cpp" else 0.0)
+            return f"bin:{source_path}:{kwargs['core_type']}".encode()
+
+        with patch.object(compiler, "compile_incore", side_effect=fake_compile):
+            result = compiler.compile_incore_batch(
+                [(2, "c.cpp", "aiv"), (0, "a.cpp", "aiv"), (1, "b.cpp", "aic")]
+            )
+
+        assert result == [
+            (0, b"bin:a.cpp:aiv"),
+            (1, b"bin:b.cpp:aic"),
+            (2, b"bin:c.cpp:aiv"),
+        ]
+
+    def test_compiles_concurrently_within_bound(self):
+        """At most max_workers compilations run at the same time."""
+        compiler = self._compiler()
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def fake_compile(source_path, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return b"bin"
+
+        kernels = [(i, f"k{i}.cpp", "aiv") for i in range(8)]
+        with patch.object(compiler, "compile_incore", side_effect=fake_compile):
+            compiler.compile_incore_batch(kernels, max_workers=3)
+
+        assert 1 < peak[0] <= 3
+
+    def test_duplicate_func_id_raises(self):
+        compiler = self._compiler()
+        with pytest.raises(ValueError, match="Duplicate func_ids"):
+            compiler.compile_incore_batch([(0, "a.cpp", "aiv"), (0, "b.cpp", "aiv")])
+
+    def test_failure_reports_lowest_func_id(self):
+        """A failed compilation raises RuntimeError naming the lowest failing func_id."""
+        compiler = self._compiler()
+
+        def fake_compile(source_path, **kwargs):
+            if source_path in ("b.cpp", "c.cpp"):
+                raise RuntimeError(f"ccec failed on {source_path}")
+            return b"bin"
+
+        with patch.object(compiler, "compile_incore", side_effect=fake_compile):
+            with pytest.raises(RuntimeError, match=r"func_id=1, source=b\.cpp"):
+                compiler.compile_incore_batch(
+                    [(2, "c.cpp", "aiv"), (1, "b.cpp", "aiv"), (0, "a.cpp", "aiv")]
+                )
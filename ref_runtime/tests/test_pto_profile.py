@@ -0,0 +1,142 @@
+"""Tests for ProfileAnalysis on hand-built launch profiles."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Add the repo root to path so we can import pto_profile / pto_runtime
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT.parent))
+
+from pto_profile import ProfileAnalysis  # noqa: E402
+from pto_runtime import profile_dtype  # noqa: E402
+
+AIC, AIV = 0, 1
+ORIGIN = 1000
+
+# (task_id, func_id, core_type, core_id, start, end), times relative to ORIGIN:
+#
+#   AIC-0  [0 ... 10)                          [35 .. 40)
+#   AIV-0           [12 ... 20)                   task 3
+#   AIV-1       [10 ............ 30)
+#
+# with edges 0 -> 1, 0 -> 2, 1 -> 3, 2 -> 3.
+TASKS = [
+    (0, 0, AIC, 0, 0, 10),
+    (1, 1, AIV, 0, 12, 20),
+    (2, 1, AIV, 1, 10, 30),
+    (3, 2, AIC, 0, 35, 40),
+]
+EDGES = [(0, 1), (0, 2), (1, 3), (2, 3)]
+
+
+def _profile(tasks):
+    profile = np.zeros(len(tasks), dtype=profile_dtype())
+    for row, (task_id, func_id, core_type, core_id, start, end) in zip(profile, tasks):
+        row["task_id"] = task_id
+        row["func_id"] = func_id
+        row["exec_core_type"] = core_type
+        row["exec_core_id"] = core_id
+        row["start_time"] = ORIGIN + start
+        row["end_time"] = ORIGIN + end
+    return profile
+
+
+@pytest.fixture
+def analysis():
+    # The edge to a task missing from the profile is ignored.
+    return ProfileAnalysis(_profile(TASKS), edges=EDGES + [(3, 99)], task_names={0: "load"})
+
+
+class TestPaths:
+    def test_times_are_relative_to_first_start(self, analysis):
+        assert analysis.start.tolist() == [0, 12, 10, 35]
+        assert analysis.makespan == 40
+
+    def test_ready_and_scheduling_latency(self, analysis):
+        assert analysis.ready.tolist() == [0, 10, 10, 30]
+        assert analysis.scheduling_latency().tolist() == [0, 2, 0, 5]
+
+    def test_critical_path_follows_last_finishing_predecessor(self, analysis):
+        path = analysis.critical_path()
+        assert path.task_ids == (0, 2, 3)
+        assert (path.kernel_time, path.wait_time) == (35, 5)
+        assert path.length == analysis.makespan
+
+    def test_dependency_bound(self, analysis):
+        assert analysis.dependency_bound() == 35
+
+    def test_cycle_is_rejected(self):
+        with pytest.raises(ValueError, match="cycle"):
+            ProfileAnalysis(_profile(TASKS), edges=[(0, 1), (1, 0)]).dependency_bound()
+
+    def test_empty_profile(self):
+        analysis = ProfileAnalysis(_profile([]))
+        assert analysis.critical_path().task_ids == ()
+        assert analysis.makespan == 0
+
+
+class TestCores:
+    def test_utilization_and_gaps(self, analysis):
+        cores = {c.name: c for c in analysis.core_utilization()}
+        assert sorted(cores) == ["AIC-0", "AIV-0", "AIV-1"]
+        assert {n: c.busy for n, c in cores.items()} == {"AIC-0": 15, "AIV-0": 8, "AIV-1": 20}
+        assert cores["AIV-1"].utilization == pytest.approx(0.5)
+
+        (gap,) = cores["AIC-0"].idle_gaps
+        assert (gap.start, gap.end, gap.next_task) == (10, 35, 3)
+        assert (gap.blocked, gap.dispatch) == (20, 5)
+
+        lead, trail = cores["AIV-0"].idle_gaps
+        assert (lead.start, lead.end, lead.blocked, lead.dispatch) == (0, 12, 10, 2)
+        assert (trail.start, trail.end, trail.next_task, trail.blocked) == (20, 40, None, 0)
+
+    def test_summary_totals(self, analysis):
+        s = analysis.summary()
+        assert (s["tasks"], s["cores"], s["makespan"]) == (4, 3, 40)
+        assert (s["critical_path_tasks"], s["critical_path_kernel_time"], s["critical_path_wait_time"]) == (3, 35, 5)
+        assert (s["idle_blocked"], s["idle_dispatch"]) == (40, 7)
+        assert s["mean_utilization"] == pytest.approx(43 / 120)
+        assert s["sched_latency_mean"] == pytest.approx(1.75)
+        assert s["sched_latency_max"] == 5
+
+    def test_report(self, analysis):
+        report = analysis.report()
+        assert "makespan 40 ticks (dependency bound 35)" in report
+        assert "Idle: 40 blocked on dependencies, 7 ready but not dispatched" in report
+
+
+class TestFuncStats:
+    def test_per_func_statistics(self, analysis):
+        stats = analysis.func_time_stats(bins=4)
+        assert sorted(stats) == [0, 1, 2]
+        f1 = stats[1]
+        assert (f1.count, f1.total, f1.min, f1.max) == (2, 28, 8, 20)
+        assert f1.mean == pytest.approx(14.0)
+        assert f1.p50 == pytest.approx(14.0)
+        assert f1.counts.sum() == 2 and len(f1.bin_edges) == 5
+
+
+class TestChromeTrace:
+    def test_events(self, analysis, tmp_path):
+        path = tmp_path / "trace.json"
+        analysis.export_chrome_trace(path, ticks_per_us=2.0)
+        events = json.loads(path.read_text())["traceEvents"]
+
+        tasks = {e["args"]["task_id"]: e for e in events if e["ph"] == "X"}
+        assert tasks[0]["name"] == "load" and tasks[1]["name"] == "func1"
+        assert (tasks[3]["ts"], tasks[3]["dur"], tasks[3]["pid"], tasks[3]["tid"]) == (17.5, 2.5, AIC, 0)
+        assert tasks[3]["args"]["sched_latency"] == 5
+
+        assert sum(e["ph"] == "M" for e in events) == 2 + 3
+        starts = [e for e in events if e["ph"] == "s"]
+        finishes = [e for e in events if e["ph"] == "f"]
+        assert len(starts) == len(finishes) == len(EDGES)
+
+    def test_without_flows(self, analysis):
+        events = analysis.chrome_trace(flows=False)["traceEvents"]
+        assert not any(e["ph"] in ("s", "f") for e in events)
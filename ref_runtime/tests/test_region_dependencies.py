@@ -0,0 +1,100 @@
+"""Tests for MemRegion and RegionDependencyTracker dependency inference."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the repo root to path so we can import pto_runtime
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT.parent))
+
+from pto_runtime import MemRegion, RegionDependencyTracker  # noqa: E402
+
+# A row-major 8 x 64-byte buffer; views are (row, col, rows, cols) in bytes.
+BASE = 0x10000
+ROW_BYTES = 64
+
+
+def view(row, col, rows, cols):
+    return MemRegion(BASE + row * ROW_BYTES + col, cols, rows=rows, stride=ROW_BYTES)
+
+
+# Rows 0-3, bytes 0-31 and rows 2-5, bytes 16-47 share rows 2-3, bytes 16-31.
+LEFT = view(0, 0, 4, 32)
+OVERLAP = view(2, 16, 4, 32)
+# Rows 0-3, bytes 32-63: interleaved with LEFT row by row, but disjoint.
+RIGHT = view(0, 32, 4, 32)
+
+
+class TestMemRegion:
+    def test_strided_view_intervals(self):
+        assert LEFT.intervals() == [(BASE + r * ROW_BYTES, BASE + r * ROW_BYTES + 32) for r in range(4)]
+
+    def test_full_width_rows_merge(self):
+        assert view(1, 0, 3, ROW_BYTES).intervals() == [(BASE + ROW_BYTES, BASE + 4 * ROW_BYTES)]
+
+    def test_coercion(self):
+        assert MemRegion.of(BASE) == MemRegion(BASE, 1)
+        assert MemRegion.of((BASE, 16)) == MemRegion(BASE, 16)
+        with pytest.raises(ValueError):
+            MemRegion(BASE, 0).intervals()
+
+
+class TestOverlappingViews:
+    def test_raw(self):
+        t = RegionDependencyTracker()
+        assert t.access(0, writes=[LEFT]) == set()
+        assert t.access(1, reads=[OVERLAP]) == {0}
+
+    def test_war(self):
+        t = RegionDependencyTracker()
+        t.access(0, reads=[LEFT])
+        assert t.access(1, writes=[OVERLAP]) == {0}
+
+    def test_waw(self):
+        t = RegionDependencyTracker()
+        t.access(0, writes=[LEFT])
+        assert t.access(1, writes=[OVERLAP]) == {0}
+
+    def test_write_after_reads_depends_on_readers_only(self):
+        """The readers already depend on the writer, so the new writer needs only them."""
+        t = RegionDependencyTracker()
+        t.access(0, writes=[LEFT])
+        t.access(1, reads=[OVERLAP])
+        assert t.access(2, writes=[OVERLAP]) == {1}
+        # Rows 0-1 of LEFT were not read since task 0 wrote them: WAW there.
+        assert t.access(3, writes=[LEFT]) == {0, 2}
+
+    def test_partial_overwrite_keeps_older_writer_elsewhere(self):
+        t = RegionDependencyTracker()
+        t.access(0, writes=[LEFT])
+        t.access(1, writes=[OVERLAP])
+        # Row 0 was written only by task 0; rows 2-3, bytes 16-31 last by task 1.
+        assert t.access(2, reads=[view(0, 0, 1, 32)]) == {0}
+        assert t.access(3, reads=[view(2, 16, 2, 16)]) == {1}
+        assert t.access(4, reads=[LEFT]) == {0, 1}
+
+
+class TestDisjointViews:
+    @pytest.mark.parametrize("first, second", [("writes", "reads"), ("reads", "writes"), ("writes", "writes")])
+    def test_interleaved_views_get_no_edge(self, first, second):
+        t = RegionDependencyTracker()
+        t.access(0, **{first: [LEFT]})
+        assert t.access(1, **{second: [RIGHT]}) == set()
+
+    def test_adjacent_ranges_get_no_edge(self):
+        t = RegionDependencyTracker()
+        t.access(0, writes=[(BASE, 64)])
+        assert t.access(1, writes=[(BASE + 64, 64)]) == set()
+        assert t.access(2, reads=[(BASE + 63, 2)]) == {0, 1}
+
+    def test_reads_do_not_serialize(self):
+        t = RegionDependencyTracker()
+        t.access(0, writes=[LEFT])
+        assert t.access(1, reads=[LEFT]) == {0}
+        assert t.access(2, reads=[OVERLAP]) == {0}
+
+    def test_task_does_not_depend_on_itself(self):
+        t = RegionDependencyTracker()
+        assert t.access(0, reads=[LEFT], writes=[OVERLAP]) == set()
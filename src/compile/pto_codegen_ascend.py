@@ -267,9 +267,10 @@ class AscendCodeGenerator:
         ]
         
         # Add buffer analysis for InCore functions
+        buffer_analysis = None
         if is_in_core and self.analyze_buffers:
-            analyzer = TileBufferAnalyzer(program)
-            analyzer.analyze()
+            analyzer = TileBufferAnalyzer(program, target=f"ascend_{self.target}")
+            buffer_analysis = analyzer.analyze()
             report = analyzer.generate_report()
             lines.append(report)
         
@@ -313,8 +314,10 @@ class AscendCodeGenerator:
         lines.append("")
         
         if self.enable_fusion:
-            optimizer = LoopFusionOptimizer(tile_info)
+            optimizer = LoopFusionOptimizer(tile_info, buffer_analysis=buffer_analysis)
             fused_result = optimizer.optimize(mock_instructions)
+            if optimizer.stats['loop_passes_removed']:
+                lines.append(f"    // Loop fusion: {optimizer.stats['loop_passes_removed']} loop passes removed by reordering")
             lines.append(f"    // Loop fusion: {optimizer.stats['fusion_savings']} loop overheads saved\n")
             
             fused_codegen = AscendFusedCodeGenerator()
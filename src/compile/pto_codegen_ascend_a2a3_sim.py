@@ -103,6 +103,7 @@ ASCEND_A2A3_CYCLE_COSTS = {
     
     # Matrix operations (Cube Engine)
     "TMATMUL": 50,      # Per 32x32 output tile
+    "TMATMUL_ACC": 50,
     "TMATMULACC": 50,
     
     # Comparison
@@ -135,7 +136,7 @@ ASCEND_A2A3_CYCLE_COSTS = {
 }
 
 # Which operations go to Cube Engine vs Vector Engine
-CUBE_OPS = {"TMATMUL", "TMATMULACC"}
+CUBE_OPS = {"TMATMUL", "TMATMUL_ACC", "TMATMULACC"}
 VECTOR_OPS = set(ASCEND_A2A3_CYCLE_COSTS.keys()) - CUBE_OPS - {"FOR", "ENDFOR", "IF", "ELSE", "ENDIF", "CALL", "RETURN"}
 
 
@@ -55,7 +55,7 @@ if _current_dir not in sys.path:
 
 from compile.pto_compile_common import (
     # Error types
-    CompilerError, ParseError, TypeError, ValidationError,
+    CompilerError, ParseError, TypeError, ValidationError, BufferCapacityWarning,
     
     # Symbol table
     Symbol, SymbolTable,
@@ -71,7 +71,8 @@ from compile.pto_compile_common import (
     MockTileInfo, MockInstruction, convert_program_to_mock_instructions,
     
     # Buffer analysis
-    TileBufferInfo, TileBufferAnalyzer,
+    TileBufferInfo, TileBufferAnalyzer, TileLivenessAnalysis, tile_defs_uses,
+    build_control_flow_graph,
     
     # Type checker and optimizer
     TypeChecker, Optimizer, CodeGenerator, PTOCompiler,
@@ -114,6 +115,30 @@ from compile.pto_codegen_ascend_a2a3_sim import (
     is_cube_op,
 )
 
+from compile.pto_compile_cache import (
+    CompileCache,
+    program_fingerprint,
+)
+
+from compile.pto_compile_ssa import (
+    SSAFunction,
+    build_ssa,
+    lower_ssa,
+)
+
+from compile.pto_compile_memopt import (
+    eliminate_redundant_memory_ops,
+    merge_in_core_calls,
+    scratch_memrefs,
+)
+
+from compile.pto_compile_perf import (
+    FunctionEstimate,
+    PerformanceEstimator,
+    estimate_module,
+    estimate_program,
+)
+
 # =============================================================================
 # Import ISA Definitions (for backward compatibility)
 # =============================================================================
@@ -662,11 +687,48 @@ class PTOModuleCompiler:
         Initialize the module compiler.
         
         Args:
-            inline_in_core: If True, inline InCore function calls
-            eliminate_redundant_mem: If True, eliminate redundant memory operations
+            inline_in_core: If True, merge runs of consecutive InCore calls of
+                            orchestration functions into single InCore functions
+            eliminate_redundant_mem: If True, forward stored tiles to later loads
+                                     and remove redundant TLOAD/TSTORE
         """
         self.inline_in_core = inline_in_core
         self.eliminate_redundant_mem = eliminate_redundant_mem
+        self.stats: Dict[str, Dict[str, int]] = {}
+    
+    def optimize_module(self, module: PTOModule) -> PTOModule:
+        """
+        Apply the enabled module-level optimizations.
+        
+        Returns a new module; the input module is not modified. Per-function
+        memory optimization counts are recorded in self.stats.
+        """
+        if not (self.inline_in_core or self.eliminate_redundant_mem):
+            return module
+        
+        optimized = PTOModule(
+            name=module.name,
+            entry_function=module.entry_function,
+            imported_functions=dict(module.imported_functions),
+        )
+        dead_memrefs: Dict[str, set] = {}
+        for program in module.functions.values():
+            if self.inline_in_core and not program.is_in_core:
+                program, merged_funcs = merge_in_core_calls(module, program)
+                for merged in merged_funcs:
+                    optimized.add_function(merged)
+                    dead_memrefs[merged.name] = scratch_memrefs(program, merged.name)
+            optimized.add_function(program)
+        
+        self.stats = {}
+        if self.eliminate_redundant_mem:
+            for name, program in list(optimized.functions.items()):
+                if not program.is_in_core:
+                    continue
+                program, stats = eliminate_redundant_memory_ops(program, dead_memrefs.get(name))
+                optimized.functions[name] = program
+                self.stats[name] = stats
+        return optimized
     
     def compile_function(self, program: PTOProgram) -> str:
         """Compile a single function to PTO assembly."""
@@ -741,8 +803,18 @@ class PTOModuleCompiler:
         
         return "\n".join(lines)
     
-    def compile(self, module: PTOModule) -> str:
-        """Compile a complete module to PTO assembly."""
+    def compile(self, module: PTOModule, jobs: Optional[int] = None) -> str:
+        """
+        Compile a complete module to PTO assembly.
+        
+        Args:
+            module: Module to compile
+            jobs: Worker processes for per-function compilation
+                  (None/1 = serial, 0 = one per CPU). Small modules are
+                  compiled serially regardless (see PARALLEL_MIN_INSTRUCTIONS).
+                  Output order is always the module's function order.
+        """
+        module = self.optimize_module(module)
         lines = []
         
         # Module header
@@ -752,8 +824,17 @@ class PTOModuleCompiler:
         lines.append("")
         
         # Compile each function
-        for func_name, program in module.functions.items():
-            lines.append(self._compile_function_legacy(program))
+        programs = list(module.functions.values())
+        jobs = _parallel_jobs(jobs, programs)
+        if jobs <= 1:
+            for program in programs:
+                lines.append(self._compile_function_legacy(program))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with ProcessPoolExecutor(max_workers=min(jobs, len(programs))) as pool:
+                chunksize = max(1, len(programs) // (jobs * 4))
+                lines.extend(pool.map(self._compile_function_legacy, programs, chunksize=chunksize))
         
         return "\n".join(lines)
 
@@ -764,10 +845,43 @@ class MultiBackendCodeGenerator:
     """
     
     def __init__(self, enable_fusion: bool = True, analyze_buffers: bool = True,
-                 module: Optional['PTOModule'] = None):
+                 module: Optional['PTOModule'] = None,
+                 cache_dir: Optional[str] = None):
+        """
+        Initialize the multi-backend generator.
+        
+        Args:
+            enable_fusion: If True, fuse consecutive element-wise ops into single loops
+            analyze_buffers: If True, run tile buffer analysis for InCore functions
+            module: Module used to resolve callees of orchestration functions
+            cache_dir: Directory for the content-addressed codegen cache. Defaults to
+                       $PTO_COMPILE_CACHE_DIR; caching is disabled when neither is set.
+        """
         self.enable_fusion = enable_fusion
         self.analyze_buffers = analyze_buffers
         self.module = module
+        self.cache = CompileCache(cache_dir) if cache_dir else CompileCache.from_env()
+    
+    def _cached(self, backend: str, program: PTOProgram, generate, **flags) -> str:
+        """Serve `generate()` from the compile cache when the program is unchanged."""
+        if self.cache is None:
+            return generate()
+        
+        flags.update(enable_fusion=self.enable_fusion, analyze_buffers=self.analyze_buffers)
+        key = self.cache.make_key(program, backend, flags, self.module)
+        if key is None:
+            return generate()
+        code = self.cache.get(key)
+        if code is None:
+            code = generate()
+            self.cache.put(key, code)
+        elif backend == "arm64" and program.is_in_core and self.analyze_buffers and self.module is not None:
+            # ARM64 codegen records buffer analysis on the module as a side effect;
+            # orchestration codegen reads it back, so replay it on a cache hit.
+            analyzer = TileBufferAnalyzer(program)
+            analyzer.analyze()
+            self.module.set_buffer_analysis(program.name, analyzer.analysis_result)
+        return code
     
     def generate_arm64(self, program: PTOProgram) -> str:
         """Generate ARM64 code."""
@@ -776,7 +890,7 @@ class MultiBackendCodeGenerator:
             analyze_buffers=self.analyze_buffers,
             module=self.module
         )
-        return gen.generate(program)
+        return self._cached("arm64", program, lambda: gen.generate(program))
     
     def generate_cuda(self, program: PTOProgram) -> str:
         """Generate CUDA code."""
@@ -785,7 +899,7 @@ class MultiBackendCodeGenerator:
             analyze_buffers=self.analyze_buffers,
             module=self.module
         )
-        return gen.generate(program)
+        return self._cached("cuda", program, lambda: gen.generate(program))
     
     def generate_ascend(self, program: PTOProgram, target: str = "a2a3") -> str:
         """Generate Ascend code."""
@@ -795,7 +909,7 @@ class MultiBackendCodeGenerator:
             module=self.module,
             target=target
         )
-        return gen.generate(program)
+        return self._cached("ascend", program, lambda: gen.generate(program), target=target)
 
     def generate_ptoas(self, program: PTOProgram, *, block_dim: int = 1, kernel_name: str = "pto_kernel") -> str:
         """
@@ -816,7 +930,7 @@ class MultiBackendCodeGenerator:
             module=self.module,
             target_mode="hardware"
         )
-        return gen.generate(program)
+        return self._cached("ascend_a2a3", program, lambda: gen.generate(program))
     
     def generate_ascend_a5(self, program: PTOProgram) -> str:
         """Generate Ascend A5 code (convenience method)."""
@@ -829,7 +943,7 @@ class MultiBackendCodeGenerator:
             analyze_buffers=self.analyze_buffers,
             module=self.module
         )
-        return gen.generate(program)
+        return self._cached("ascend_a2a3_sim", program, lambda: gen.generate(program))
     
     def compile_and_run_orchestration(self, program: PTOProgram, output_dir: str,
                                        extra_args: Optional[Dict[str, Any]] = None,
@@ -914,38 +1028,205 @@ class MultiBackendCodeGenerator:
             return None
     
     def generate_all(self, program: PTOProgram, output_prefix: str,
-                     output_base_dir: str = ".") -> Dict[str, str]:
-        """Generate code for all backends."""
+                     output_base_dir: str = ".", jobs: Optional[int] = None) -> Dict[str, str]:
+        """
+        Generate code for all backends.
+        
+        Args:
+            program: Program to generate
+            output_prefix: File name (without extension) for each backend's output
+            output_base_dir: Directory containing the output_<backend>/ folders
+            jobs: Worker processes for code generation (None/1 = serial, 0 = one per CPU;
+                  small programs are generated serially, see PARALLEL_MIN_INSTRUCTIONS)
+        """
+        backends = [
+            # (backend, output dir, extension)
+            ("arm64", "output_arm64", ".c"),
+            ("cuda", "output_cuda", ".cu"),
+            ("ascend", "output_ascend", ".cpp"),
+        ]
+        codes = self._generate_pairs([(program, b) for b, _, _ in backends], jobs)
+        
         results = {}
+        for (backend, dir_name, ext), code in zip(backends, codes):
+            out_dir = os.path.join(output_base_dir, dir_name)
+            os.makedirs(out_dir, exist_ok=True)
+            out_path = os.path.join(out_dir, f"{output_prefix}{ext}")
+            with open(out_path, 'w') as f:
+                f.write(code)
+            results[backend] = out_path
+        
+        return results
+    
+    def generate_module(self, module: Optional[PTOModule] = None,
+                        backends: Tuple[str, ...] = ("arm64",),
+                        jobs: Optional[int] = None) -> Dict[str, Dict[str, str]]:
+        """
+        Generate code for every function of a module on the given backends.
+        
+        Independent (function, backend) pairs are fanned out to a process pool when
+        `jobs` is not None/1 and the module is large enough to amortize the pool
+        start-up (see PARALLEL_MIN_INSTRUCTIONS). Results are merged in module function order, then in
+        `backends` order, so the output does not depend on worker scheduling.
+        
+        Tile buffer analysis for all InCore functions is recorded on the module
+        before any code is generated, so orchestration functions see the same
+        callee buffer sizes in serial and parallel mode. The analysis is checked
+        against the smallest on-chip buffer among the requested backends (see
+        BufferCapacityWarning).
         
-        # ARM64
-        arm64_code = self.generate_arm64(program)
-        arm64_dir = os.path.join(output_base_dir, "output_arm64")
-        os.makedirs(arm64_dir, exist_ok=True)
-        arm64_path = os.path.join(arm64_dir, f"{output_prefix}.c")
-        with open(arm64_path, 'w') as f:
-            f.write(arm64_code)
-        results["arm64"] = arm64_path
-        
-        # CUDA
-        cuda_code = self.generate_cuda(program)
-        cuda_dir = os.path.join(output_base_dir, "output_cuda")
-        os.makedirs(cuda_dir, exist_ok=True)
-        cuda_path = os.path.join(cuda_dir, f"{output_prefix}.cu")
-        with open(cuda_path, 'w') as f:
-            f.write(cuda_code)
-        results["cuda"] = cuda_path
-        
-        # Ascend
-        ascend_code = self.generate_ascend(program)
-        ascend_dir = os.path.join(output_base_dir, "output_ascend")
-        os.makedirs(ascend_dir, exist_ok=True)
-        ascend_path = os.path.join(ascend_dir, f"{output_prefix}.cpp")
-        with open(ascend_path, 'w') as f:
-            f.write(ascend_code)
-        results["ascend"] = ascend_path
+        Args:
+            module: Module to generate (defaults to self.module)
+            backends: Backend names, see CODEGEN_BACKEND_METHODS
+            jobs: Worker processes (None/1 = serial, 0 = one per CPU)
+            
+        Returns:
+            Dict of function name -> {backend: code}
+        """
+        module = module if module is not None else self.module
+        if module is None:
+            raise ValidationError("generate_module requires a PTOModule")
+        for backend in backends:
+            if backend not in CODEGEN_BACKEND_METHODS:
+                raise ValidationError(f"Unknown backend '{backend}'")
+        
+        if module is not self.module:
+            gen = MultiBackendCodeGenerator(
+                enable_fusion=self.enable_fusion,
+                analyze_buffers=self.analyze_buffers,
+                module=module,
+                cache_dir=self.cache.cache_dir if self.cache else None,
+            )
+            return gen.generate_module(module, backends, jobs)
+        
+        analyses = {}
+        if self.analyze_buffers:
+            target = _buffer_target(backends)
+            for program in module.functions.values():
+                if program.is_in_core:
+                    analyzer = TileBufferAnalyzer(program, target=target)
+                    analyses[program.name] = analyzer.analyze()
+                    module.set_buffer_analysis(program.name, analyses[program.name])
+        
+        pairs = [(program, backend)
+                 for program in module.functions.values()
+                 for backend in backends]
+        codes = self._generate_pairs(pairs, jobs)
         
+        # ARM64 codegen re-records its own (target-less) analysis; keep the
+        # target-checked one on the module
+        for name, analysis in analyses.items():
+            module.set_buffer_analysis(name, analysis)
+        
+        results: Dict[str, Dict[str, str]] = {}
+        for (program, backend), code in zip(pairs, codes):
+            results.setdefault(program.name, {})[backend] = code
         return results
+    
+    def _generate_pairs(self, pairs: List[Tuple[PTOProgram, str]],
+                        jobs: Optional[int] = None) -> List[str]:
+        """
+        Generate code for (program, backend) pairs, preserving input order.
+        
+        In parallel mode the buffer analysis each worker records on its copy
+        of the module is sent back and recorded on self.module, as serial
+        codegen would have done.
+        """
+        jobs = _parallel_jobs(jobs, [program for program, _ in pairs])
+        if jobs <= 1:
+            return [getattr(self, CODEGEN_BACKEND_METHODS[backend])(program)
+                    for program, backend in pairs]
+        
+        from concurrent.futures import ProcessPoolExecutor
+        
+        state = (self.enable_fusion, self.analyze_buffers, self.module,
+                 self.cache.cache_dir if self.cache else None)
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pairs)),
+                                 initializer=_codegen_worker_init,
+                                 initargs=(state,)) as pool:
+            chunksize = max(1, len(pairs) // (jobs * 4))
+            results = list(pool.map(_codegen_worker_run, pairs, chunksize=chunksize))
+        
+        codes = []
+        for (program, _), (code, analysis) in zip(pairs, results):
+            if analysis is not None and self.module is not None:
+                self.module.set_buffer_analysis(program.name, analysis)
+            codes.append(code)
+        return codes
+
+
+# Backend name -> MultiBackendCodeGenerator method
+CODEGEN_BACKEND_METHODS = {
+    "arm64": "generate_arm64",
+    "cuda": "generate_cuda",
+    "ascend": "generate_ascend",
+    "ascend_a2a3": "generate_ascend_a2a3",
+    "ascend_a5": "generate_ascend_a5",
+    "ascend_a2a3_sim": "generate_ascend_a2a3_sim",
+}
+
+# Backend name -> TileBufferAnalyzer target (backends without an on-chip
+# buffer limit are absent)
+CODEGEN_BACKEND_TARGETS = {
+    "ascend": "ascend_a2a3",
+    "ascend_a2a3": "ascend_a2a3",
+    "ascend_a5": "ascend_a5",
+    "ascend_a2a3_sim": "ascend_a2a3_sim",
+}
+
+
+def _buffer_target(backends: Tuple[str, ...]) -> Optional[str]:
+    """Buffer analysis target with the smallest capacity among `backends`."""
+    targets = [CODEGEN_BACKEND_TARGETS[b] for b in backends if b in CODEGEN_BACKEND_TARGETS]
+    if not targets:
+        return None
+    return min(targets, key=lambda t: TileBufferAnalyzer.BUFFER_CAPACITY[t])
+
+
+# Smallest total instruction count worth a process pool: below it, pool
+# start-up and pickling the module cost more than codegen itself.
+PARALLEL_MIN_INSTRUCTIONS = 5000
+
+
+def _parallel_jobs(jobs: Optional[int], programs: List[PTOProgram]) -> int:
+    """Effective worker count for compiling `programs` (1 = serial)."""
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs is None or len(programs) <= 1:
+        return 1
+    if sum(len(program.instructions) for program in programs) < PARALLEL_MIN_INSTRUCTIONS:
+        return 1
+    return jobs
+
+
+# Per-process generator used by pool workers (set by _codegen_worker_init)
+_WORKER_GEN: Optional[MultiBackendCodeGenerator] = None
+
+
+def _codegen_worker_init(state):
+    """Process pool initializer: build one generator per worker process."""
+    global _WORKER_GEN
+    enable_fusion, analyze_buffers, module, cache_dir = state
+    _WORKER_GEN = MultiBackendCodeGenerator(
+        enable_fusion=enable_fusion,
+        analyze_buffers=analyze_buffers,
+        module=module,
+        cache_dir=cache_dir,
+    )
+
+
+def _codegen_worker_run(pair: Tuple[PTOProgram, str]) -> Tuple[str, Optional[Dict]]:
+    """
+    Process pool task: generate one (program, backend) pair.
+    
+    Returns the code and the program's buffer analysis as recorded on the
+    worker's module (None if there is none), for the parent to merge.
+    """
+    program, backend = pair
+    code = getattr(_WORKER_GEN, CODEGEN_BACKEND_METHODS[backend])(program)
+    module = _WORKER_GEN.module
+    analysis = module.get_buffer_analysis(program.name) if module is not None else None
+    return code, analysis
 
 
 # =============================================================================
@@ -954,10 +1235,12 @@ class MultiBackendCodeGenerator:
 
 def generate_all_backends(program: PTOProgram, output_prefix: str,
                           output_base_dir: str = ".",
-                          enable_fusion: bool = True) -> Dict[str, str]:
+                          enable_fusion: bool = True,
+                          cache_dir: Optional[str] = None,
+                          jobs: Optional[int] = None) -> Dict[str, str]:
     """Generate code for all backends."""
-    gen = MultiBackendCodeGenerator(enable_fusion=enable_fusion)
-    return gen.generate_all(program, output_prefix, output_base_dir)
+    gen = MultiBackendCodeGenerator(enable_fusion=enable_fusion, cache_dir=cache_dir)
+    return gen.generate_all(program, output_prefix, output_base_dir, jobs=jobs)
 
 
 def generate_arm64_code(program: PTOProgram, enable_fusion: bool = True) -> str:
@@ -1041,7 +1324,7 @@ if __name__ == "__main__":
 
 __all__ = [
     # Error types
-    'CompilerError', 'ParseError', 'TypeError', 'ValidationError',
+    'CompilerError', 'ParseError', 'TypeError', 'ValidationError', 'BufferCapacityWarning',
     
     # Symbol table
     'Symbol', 'SymbolTable',
@@ -1057,7 +1340,8 @@ __all__ = [
     'MockTileInfo', 'MockInstruction', 'convert_program_to_mock_instructions',
     
     # Buffer analysis
-    'TileBufferInfo', 'TileBufferAnalyzer',
+    'TileBufferInfo', 'TileBufferAnalyzer', 'TileLivenessAnalysis', 'tile_defs_uses',
+    'build_control_flow_graph',
     
     # Type checker and compiler
     'TypeChecker', 'Optimizer', 'CodeGenerator', 'PTOCompiler',
@@ -1069,7 +1353,19 @@ __all__ = [
     'AscendCodeGenerator', 'AscendFusedCodeGenerator',
     
     # Multi-backend
-    'MultiBackendCodeGenerator', 'PTOModuleCompiler', 'BACKENDS',
+    'MultiBackendCodeGenerator', 'PTOModuleCompiler', 'BACKENDS', 'CODEGEN_BACKEND_METHODS',
+    
+    # Compile cache
+    'CompileCache', 'program_fingerprint',
+    
+    # SSA IR
+    'SSAFunction', 'build_ssa', 'lower_ssa',
+    
+    # Memory optimization
+    'eliminate_redundant_memory_ops', 'merge_in_core_calls',
+    
+    # Performance estimation
+    'FunctionEstimate', 'PerformanceEstimator', 'estimate_module', 'estimate_program',
     
     # Convenience functions
     'generate_all_backends', 'generate_arm64_code', 'generate_cuda_code', 'generate_ascend_code',
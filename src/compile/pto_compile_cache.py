@@ -0,0 +1,215 @@
+"""
+PTO Compiler - Content-Addressed Code Generation Cache
+
+This module provides an on-disk cache for generated backend code so that
+unchanged functions of a PTOModule are not regenerated on every run.
+
+Cache Key:
+==========
+Each entry is keyed by a SHA-256 digest over:
+1) The PTOProgram contents (instructions, tile/scalar/memref declarations,
+   intermediate buffers, InCore/cube flags, imports)
+2) The backend name and code generator flags (fusion, buffer analysis, target)
+3) For orchestration functions: the fingerprints and buffer sizes of every
+   InCore callee, since task scheduling code embeds callee metadata
+4) A hash of the compiler sources themselves, so editing a code generator
+   invalidates all existing entries
+
+Layout:
+=======
+    <cache_dir>/<key[:2]>/<key><extension>
+
+Entries are written atomically (temp file + rename), so several processes can
+share one cache directory.
+
+Usage:
+======
+    gen = MultiBackendCodeGenerator(module=module, cache_dir=".pto_cache")
+    for name, prog in module.functions.items():
+        code = gen.generate_arm64(prog)     # served from cache when unchanged
+    print(gen.cache.stats)
+"""
+
+from typing import Any, Dict, Optional
+import hashlib
+import os
+import sys
+import tempfile
+
+# Add parent directories to path for imports
+_current_dir = os.path.dirname(os.path.abspath(__file__))
+_src_dir = os.path.dirname(_current_dir)
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from compile.pto_compile_common import PTOProgram, PTOModule
+
+
+# Environment variable that enables the cache when no explicit directory is given
+CACHE_DIR_ENV = "PTO_COMPILE_CACHE_DIR"
+
+# Bump when the key layout changes
+CACHE_FORMAT_VERSION = 1
+
+
+# =============================================================================
+# Program Fingerprint
+# =============================================================================
+
+def program_fingerprint(program: PTOProgram) -> Optional[str]:
+    """
+    Compute a stable hash of a PTOProgram.
+
+    Instructions, operands and types are dataclasses/enums whose generated
+    repr() is deterministic, so the repr of the program contents is used as
+    the canonical form. Declaration order is preserved because it determines
+    parameter order in generated code.
+
+    Returns None if the program holds an object without a stable repr
+    (default `<... object at 0x...>`), in which case it must not be cached.
+    """
+    payload = repr((
+        program.name,
+        program.tile_declarations,
+        program.scalar_declarations,
+        program.memref_declarations,
+        program.intermediate_buffers,
+        program.instructions,
+        bool(program.is_in_core),
+        bool(program.is_cube),
+        program.imports,
+    ))
+    if " object at 0x" in payload:
+        return None
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+_CODEGEN_VERSION: Optional[str] = None
+
+
+def codegen_version() -> str:
+    """Hash of the compiler and ISA definition sources (invalidates stale entries)."""
+    global _CODEGEN_VERSION
+    if _CODEGEN_VERSION is not None:
+        return _CODEGEN_VERSION
+
+    h = hashlib.sha256(f"format={CACHE_FORMAT_VERSION}".encode())
+    source_dirs = [_current_dir, os.path.join(_src_dir, "isa_definition")]
+    for source_dir in source_dirs:
+        for fname in sorted(os.listdir(source_dir)):
+            if not fname.endswith(".py"):
+                continue
+            h.update(fname.encode())
+            with open(os.path.join(source_dir, fname), "rb") as f:
+                h.update(f.read())
+    _CODEGEN_VERSION = h.hexdigest()
+    return _CODEGEN_VERSION
+
+
+def _callee_names(program: PTOProgram):
+    """Names of functions called by a program, in first-call order."""
+    seen = []
+    for instr in program.instructions:
+        if getattr(instr, "opcode", "") == "CALL" and instr.callee not in seen:
+            seen.append(instr.callee)
+    return seen
+
+
+# =============================================================================
+# Compile Cache
+# =============================================================================
+
+class CompileCache:
+    """
+    Content-addressed on-disk cache for generated backend code.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = os.path.abspath(cache_dir)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'writes': 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> Optional["CompileCache"]:
+        """Create a cache from PTO_COMPILE_CACHE_DIR, or None if it is unset."""
+        cache_dir = os.environ.get(CACHE_DIR_ENV, "").strip()
+        return cls(cache_dir) if cache_dir else None
+
+    def make_key(self, program: PTOProgram, backend: str,
+                 flags: Optional[Dict[str, Any]] = None,
+                 module: Optional[PTOModule] = None) -> Optional[str]:
+        """
+        Build the cache key for generating `program` with `backend`.
+
+        Orchestration code embeds per-callee metadata (buffer sizes, cube flag,
+        parameter shapes), so callee fingerprints are folded into the key.
+        Returns None if the program cannot be fingerprinted.
+        """
+        fingerprint = program_fingerprint(program)
+        if fingerprint is None:
+            return None
+
+        h = hashlib.sha256()
+        h.update(codegen_version().encode())
+        h.update(backend.encode())
+        h.update(repr(sorted((flags or {}).items())).encode())
+        h.update(fingerprint.encode())
+
+        if module is not None and not program.is_in_core:
+            for callee in _callee_names(program):
+                callee_prog = module.get_function(callee)
+                h.update(callee.encode())
+                if callee_prog is not None:
+                    callee_fingerprint = program_fingerprint(callee_prog)
+                    if callee_fingerprint is None:
+                        return None
+                    h.update(callee_fingerprint.encode())
+                h.update(repr(module.get_buffer_size(callee)).encode())
+
+        return h.hexdigest()
+
+    def _path(self, key: str, extension: str = ".txt") -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}{extension}")
+
+    def get(self, key: str, extension: str = ".txt") -> Optional[str]:
+        """Return cached code for `key`, or None on a miss."""
+        path = self._path(key, extension)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                code = f.read()
+        except OSError:
+            self.stats['misses'] += 1
+            return None
+        self.stats['hits'] += 1
+        return code
+
+    def put(self, key: str, code: str, extension: str = ".txt"):
+        """Store generated code under `key` (atomic rename)."""
+        path = self._path(key, extension)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(code)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self.stats['writes'] += 1
+
+    def clear(self):
+        """Remove all cached entries."""
+        import shutil
+
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+
+__all__ = [
+    'CompileCache', 'program_fingerprint', 'codegen_version', 'CACHE_DIR_ENV',
+]
@@ -24,6 +24,7 @@ from enum import Enum
 import re
 import os
 import sys
+import warnings
 
 # Add parent directories to path for imports
 _current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -95,6 +96,11 @@ class TypeError(CompilerError):
         super().__init__(f"Type error: {message}")
 
 
+class BufferCapacityWarning(UserWarning):
+    """Tile buffers of an InCore function exceed the target's on-chip buffer."""
+    pass
+
+
 class ValidationError(CompilerError):
     """Validation error."""
     pass
@@ -345,7 +351,7 @@ BROADCAST_OPS = {
     "TCOLEXPANDSUB", "TCOLEXPANDDIV", "TCOLEXPANDMUL",
 }
 
-MATMUL_OPS = {"TMATMUL", "TMATMULACC"}
+MATMUL_OPS = {"TMATMUL", "TMATMUL_ACC", "TMATMULACC"}
 
 MEMORY_OPS = {"TLOAD", "TSTORE"}
 
@@ -554,6 +560,173 @@ def convert_program_to_mock_instructions(program: PTOProgram) -> Tuple[Dict[str,
     return tile_info, mock_instructions
 
 
+# =============================================================================
+# Control-Flow-Aware Tile Liveness
+# =============================================================================
+
+# Instruction fields that name the tile written by an instruction; every
+# other TileOperand field (src, mask, indices, bias, scales, ...) is a read.
+TILE_DEF_FIELDS = ('dst',)
+
+# Structured loop delimiters
+LOOP_HEADER_OPS = ('FOR', 'WHILE')
+LOOP_END_OPS = ('ENDFOR', 'ENDWHILE')
+
+
+def tile_defs_uses(instr) -> Tuple[set, set]:
+    """Tile names written and read by a PTO instruction."""
+    defs, uses = set(), set()
+    for name, value in vars(instr).items():
+        if not isinstance(value, TileOperand):
+            continue
+        if name in TILE_DEF_FIELDS:
+            defs.add(value.name)
+        else:
+            uses.add(value.name)
+    return defs, uses
+
+
+def build_control_flow_graph(instructions: List[Any]) -> Tuple[List[List[int]], List[Tuple[int, int]]]:
+    """
+    Build the instruction-level control-flow graph of a structured program.
+
+    Returns (successors, loops): the successor indices of every instruction,
+    and the (header, end) instruction indices of every FOR/WHILE loop.
+    See TileLivenessAnalysis for the edges added by each construct.
+    """
+    n = len(instructions)
+    succs = [[i + 1] if i + 1 < n else [] for i in range(n)]
+    loop_stack: List[List[int]] = []   # [header, do_idx, [break/continue idxs]]
+    if_stack: List[List[int]] = []     # [if_idx, else_idx]
+    loops: List[Tuple[int, int]] = []
+
+    for i, instr in enumerate(instructions):
+        opcode = getattr(instr, 'opcode', '')
+        if opcode in LOOP_HEADER_OPS:
+            loop_stack.append([i, -1, []])
+        elif opcode == 'DO' and loop_stack:
+            loop_stack[-1][1] = i
+        elif opcode in ('BREAK', 'CONTINUE') and loop_stack:
+            loop_stack[-1][2].append(i)
+        elif opcode in LOOP_END_OPS and loop_stack:
+            header, do_idx, jumps = loop_stack.pop()
+            exit_idx = i + 1
+            succs[i] = [header] + ([exit_idx] if exit_idx < n else [])
+            # Zero-trip: the loop condition may exit before the body
+            cond_idx = header if instructions[header].opcode == 'FOR' else do_idx
+            if cond_idx >= 0 and exit_idx < n:
+                succs[cond_idx].append(exit_idx)
+            for j in jumps:
+                if instructions[j].opcode == 'BREAK':
+                    succs[j] = [exit_idx] if exit_idx < n else []
+                else:
+                    succs[j] = [header]
+            loops.append((header, i))
+        elif opcode == 'IF':
+            if_stack.append([i, -1])
+        elif opcode == 'ELSE' and if_stack:
+            if_stack[-1][1] = i
+        elif opcode == 'ENDIF' and if_stack:
+            if_idx, else_idx = if_stack.pop()
+            if else_idx >= 0:
+                succs[if_idx].append(else_idx + 1)
+                succs[else_idx] = [i]
+            else:
+                succs[if_idx].append(i)
+        elif opcode == 'RETURN':
+            succs[i] = []
+
+    return [sorted(set(s)) for s in succs], loops
+
+
+class TileLivenessAnalysis:
+    """
+    Backward liveness of tiles over the structured control flow of a program.
+
+    The control-flow graph has one node per instruction. Structured regions
+    add the non-sequential edges:
+      FOR ... ENDFOR            ENDFOR -> FOR (back-edge), FOR -> after ENDFOR
+      WHILE ... DO ... ENDWHILE ENDWHILE -> WHILE (back-edge), DO -> after ENDWHILE
+      IF ... [ELSE ...] ENDIF   IF -> else-region (or ENDIF), ELSE -> ENDIF
+      BREAK / CONTINUE          loop exit / loop header
+      RETURN                    no successor
+
+    A tile read in a loop before it is written in the same iteration is live
+    around the back-edge, so its live range covers the whole loop; a tile
+    live into either branch of an IF is live at the IF. Live intervals are
+    the hull of all instruction indices at which a tile is live or written,
+    so non-overlapping intervals are safe to share storage.
+    """
+
+    def __init__(self, instructions: List[Any], tile_names: Optional[set] = None):
+        self.instructions = instructions
+        self.tile_names = tile_names
+        self.successors: List[List[int]] = []
+        self.live_in: List[set] = []
+        self.live_out: List[set] = []
+        self.loops: List[Tuple[int, int]] = []       # (header idx, end idx)
+
+    def _defs_uses(self, instr) -> Tuple[set, set]:
+        defs, uses = tile_defs_uses(instr)
+        if self.tile_names is not None:
+            defs &= self.tile_names
+            uses &= self.tile_names
+        return defs, uses
+
+    def build_cfg(self) -> List[List[int]]:
+        """Build instruction successor lists from the structured control flow."""
+        self.successors, self.loops = build_control_flow_graph(self.instructions)
+        return self.successors
+
+    def compute(self) -> List[set]:
+        """Solve the liveness equations to a fixed point; returns live-in sets."""
+        if not self.successors and self.instructions:
+            self.build_cfg()
+
+        n = len(self.instructions)
+        defs_uses = [self._defs_uses(instr) for instr in self.instructions]
+        self.live_in = [set() for _ in range(n)]
+        self.live_out = [set() for _ in range(n)]
+
+        changed = True
+        while changed:
+            changed = False
+            for i in range(n - 1, -1, -1):
+                out = set()
+                for s in self.successors[i]:
+                    out |= self.live_in[s]
+                defs, uses = defs_uses[i]
+                new_in = uses | (out - defs)
+                if new_in != self.live_in[i] or out != self.live_out[i]:
+                    self.live_in[i] = new_in
+                    self.live_out[i] = out
+                    changed = True
+        return self.live_in
+
+    def live_intervals(self) -> Dict[str, Tuple[int, int]]:
+        """Live interval (first, last instruction index) of every touched tile."""
+        if len(self.live_in) != len(self.instructions):
+            self.compute()
+
+        intervals: Dict[str, Tuple[int, int]] = {}
+
+        def extend(name: str, idx: int):
+            lo, hi = intervals.get(name, (idx, idx))
+            intervals[name] = (min(lo, idx), max(hi, idx))
+
+        for i, instr in enumerate(self.instructions):
+            defs, _ = self._defs_uses(instr)
+            for name in self.live_in[i] | defs:
+                extend(name, i)
+        return intervals
+
+    def loop_carried(self) -> Dict[Tuple[int, int], set]:
+        """Tiles live around each loop's back-edge, keyed by (header, end)."""
+        if len(self.live_in) != len(self.instructions):
+            self.compute()
+        return {(h, e): set(self.live_in[h]) & self.live_out[e] for h, e in self.loops}
+
+
 # =============================================================================
 # Tile Buffer Analyzer
 # =============================================================================
@@ -570,29 +743,73 @@ class TileBufferInfo:
     first_write: int
     last_read: int
     can_reuse_from: Optional[str] = None
+    offset: int = -1                  # Byte offset in the on-chip buffer (-1: not allocated)
+    live_start: int = -1              # First instruction index touching the tile
+    live_end: int = -1                # Last instruction index touching the tile
 
 
 class TileBufferAnalyzer:
     """
     Analyzes tile buffer usage in InCore functions.
+    
+    Each live tile is assigned a concrete byte offset in the on-chip buffer by
+    an interval-graph allocator: tiles whose live intervals do not overlap
+    share address ranges, and tiles of different sizes are packed into the
+    gaps left by dead tiles. The peak address is the buffer size reported to
+    the runtime (total_with_reuse_bytes).
+    
+    Live intervals come from TileLivenessAnalysis, so a tile carried around a
+    loop back-edge (e.g. the running max/sum of a flash-attention loop) stays
+    live for the whole loop and is never overlapped by body temporaries.
+    
+    With a target that has a BUFFER_CAPACITY, analyze() emits a
+    BufferCapacityWarning when the packed layout does not fit, unless
+    check_capacity is False (escalate it with warnings.simplefilter("error",
+    BufferCapacityWarning) to fail the build instead).
     """
     
     ELEMENT_SIZES = {
         'f32': 4, 'f16': 2, 'bf16': 2, 'i32': 4, 'i16': 2, 'i8': 1, 'u8': 1
     }
     
-    def __init__(self, program: PTOProgram):
+    # On-chip buffer capacity per target in bytes (None: not checked)
+    BUFFER_CAPACITY = {
+        'ascend_a2a3': 192 * 1024,
+        'ascend_a2a3_sim': 192 * 1024,
+        'ascend_a5': 256 * 1024,
+        'arm64': None,
+        'cuda': None,
+    }
+    
+    # Alignment of tile base addresses in bytes (UB block size)
+    DEFAULT_ALIGNMENT = 32
+    
+    def __init__(self, program: PTOProgram, target: Optional[str] = None,
+                 alignment: int = DEFAULT_ALIGNMENT, check_capacity: bool = True):
         self.program = program
+        self.target = target
+        self.alignment = alignment
+        self.check_capacity = check_capacity
         self.tile_info: Dict[str, TileBufferInfo] = {}
         self.instructions = []
+        self.loop_carried: Dict[Tuple[int, int], set] = {}
         self.analysis_result = {}
     
     def analyze(self) -> Dict:
         """Run complete buffer analysis."""
         self._collect_tiles()
         self._analyze_liveness()
-        self._find_reuse_opportunities()
+        self._allocate_offsets()
         self._compute_totals()
+        
+        r = self.analysis_result
+        if self.check_capacity and not r['fits_capacity']:
+            warnings.warn(
+                f"Tile buffers of '{self.program.name}' need {r['total_with_reuse_bytes']:,} bytes, "
+                f"exceeding the {r['capacity_bytes']:,}-byte on-chip buffer of {self.target}",
+                BufferCapacityWarning,
+                stacklevel=2,
+            )
         return self.analysis_result
     
     def _collect_tiles(self):
@@ -615,53 +832,73 @@ class TileBufferAnalyzer:
             )
     
     def _analyze_liveness(self):
-        """Analyze when each tile is written and last read."""
+        """
+        Analyze when each tile is written and last read, and compute its live
+        interval with control-flow-aware liveness (loop back-edges, IF joins).
+        """
         for idx, instr in enumerate(self.program.instructions):
-            opcode = getattr(instr, 'opcode', '')
-            
-            # Track writes (destination)
-            dst_name = None
-            if hasattr(instr, 'dst') and hasattr(instr.dst, 'name'):
-                dst_name = instr.dst.name
-            
-            if dst_name and dst_name in self.tile_info:
-                if self.tile_info[dst_name].first_write < 0:
-                    self.tile_info[dst_name].first_write = idx
-            
-            # Track reads (sources)
-            read_names = []
-            for attr in ['src', 'src0', 'src1', 'a', 'b', 'acc']:
-                if hasattr(instr, attr):
-                    src = getattr(instr, attr)
-                    if hasattr(src, 'name'):
-                        read_names.append(src.name)
-            
-            for name in read_names:
+            defs, uses = tile_defs_uses(instr)
+
+            for name in defs:
+                if name in self.tile_info and self.tile_info[name].first_write < 0:
+                    self.tile_info[name].first_write = idx
+
+            for name in uses:
                 if name in self.tile_info:
                     self.tile_info[name].last_read = idx
+
+        liveness = TileLivenessAnalysis(self.program.instructions, set(self.tile_info))
+        for name, (start, end) in liveness.live_intervals().items():
+            self.tile_info[name].live_start = start
+            self.tile_info[name].live_end = end
+        self.loop_carried = liveness.loop_carried()
+    
+    def _aligned_size(self, tile: TileBufferInfo) -> int:
+        a = max(1, self.alignment)
+        return (tile.total_bytes + a - 1) // a * a
     
-    def _find_reuse_opportunities(self):
-        """Find tiles that can reuse buffers from dead tiles."""
-        sorted_tiles = sorted(
-            self.tile_info.values(),
-            key=lambda t: t.first_write if t.first_write >= 0 else 9999
+    def _allocate_offsets(self):
+        """
+        Assign byte offsets by greedy interval-graph coloring.
+        
+        Two tiles interfere when their live intervals overlap. Tiles are placed
+        largest first (ties broken by live_start), each at the lowest aligned
+        offset that does not overlap the address range of an already placed,
+        interfering tile. Large tiles thus claim the base of the buffer and
+        small short-lived tiles fill the gaps between them.
+        """
+        live_tiles = sorted(
+            (t for t in self.tile_info.values() if t.live_start >= 0),
+            key=lambda t: (-t.total_bytes, t.live_start, t.name)
         )
         
-        for tile in sorted_tiles:
-            if tile.first_write < 0:
-                continue
+        placed: List[TileBufferInfo] = []
+        for tile in live_tiles:
+            size = self._aligned_size(tile)
+            conflicts = sorted(
+                (t for t in placed
+                 if t.live_start <= tile.live_end and tile.live_start <= t.live_end),
+                key=lambda t: t.offset
+            )
             
-            for candidate in self.tile_info.values():
-                if candidate.name == tile.name:
-                    continue
-                if candidate.can_reuse_from is not None:
-                    continue
-                if candidate.last_read < 0:
+            offset = 0
+            for t in conflicts:
+                if t.offset - offset >= size:
+                    break
+                offset = max(offset, t.offset + self._aligned_size(t))
+            tile.offset = offset
+            placed.append(tile)
+        
+        # Record, for each tile, the dead tile whose storage it takes over
+        by_start = sorted(placed, key=lambda t: (t.live_start, t.name))
+        for tile in by_start:
+            size = self._aligned_size(tile)
+            for prev in reversed(by_start):
+                if prev.live_end >= tile.live_start:
                     continue
-                if candidate.last_read < tile.first_write:
-                    if candidate.total_bytes >= tile.total_bytes:
-                        tile.can_reuse_from = candidate.name
-                        break
+                if prev.offset < tile.offset + size and tile.offset < prev.offset + self._aligned_size(prev):
+                    tile.can_reuse_from = prev.name
+                    break
     
     def _compute_totals(self):
         """Compute total buffer sizes."""
@@ -672,10 +909,13 @@ class TileBufferAnalyzer:
             if tile.can_reuse_from:
                 reuse_map[tile.name] = tile.can_reuse_from
         
+        # Peak address of the packed layout
         total_with_reuse = 0
         for tile in self.tile_info.values():
-            if tile.name not in reuse_map:
-                total_with_reuse += tile.total_bytes
+            if tile.offset >= 0:
+                total_with_reuse = max(total_with_reuse, tile.offset + self._aligned_size(tile))
+        
+        capacity = self.BUFFER_CAPACITY.get(self.target) if self.target else None
         
         self.analysis_result = {
             'total_tiles': len(self.tile_info),
@@ -685,6 +925,10 @@ class TileBufferAnalyzer:
             'reuse_savings_percent': (1 - total_with_reuse / total_without_reuse) * 100 if total_without_reuse > 0 else 0,
             'tiles': self.tile_info,
             'reuse_map': reuse_map,
+            'offsets': {t.name: t.offset for t in self.tile_info.values() if t.offset >= 0},
+            'capacity_bytes': capacity,
+            'fits_capacity': capacity is None or total_with_reuse <= capacity,
+            'loop_carried': self.loop_carried,
         }
     
     def generate_report(self) -> str:
@@ -704,7 +948,17 @@ class TileBufferAnalyzer:
         lines.append(f"//   Total capacity (no reuse): {r['total_without_reuse_bytes']:,} bytes ({r['total_without_reuse_bytes']/1024:.1f} KB)")
         lines.append(f"//   Total capacity (w/ reuse): {r['total_with_reuse_bytes']:,} bytes ({r['total_with_reuse_bytes']/1024:.1f} KB)")
         lines.append(f"//   Reuse savings:            {r['reuse_savings_bytes']:,} bytes ({r['reuse_savings_percent']:.1f}%)")
+        if r['capacity_bytes'] is not None:
+            status = "OK" if r['fits_capacity'] else "EXCEEDED"
+            lines.append(f"//   Buffer capacity:          {r['capacity_bytes']:,} bytes ({status})")
         lines.append("//")
+        if r['offsets']:
+            lines.append("// BUFFER LAYOUT:")
+            for tile in sorted(r['tiles'].values(), key=lambda t: (t.offset, t.live_start)):
+                if tile.offset < 0:
+                    continue
+                lines.append(f"//   {tile.name:<20} offset {tile.offset:>8,}  size {tile.total_bytes:>8,}  live [{tile.live_start}, {tile.live_end}]")
+            lines.append("//")
         lines.append("// " + "=" * 70)
         lines.append("")
         
@@ -715,56 +969,99 @@ class TileBufferAnalyzer:
 # Loop Fusion Optimizer
 # =============================================================================
 
+# Non-fusable opcodes whose MockInstruction dst/operands fully describe what they
+# read and write. Fusable ops may be reordered across these; any other non-fusable
+# op (control flow, calls, ops with operands the mock conversion drops) is a fence.
+REORDERABLE_BARRIER_OPS = (
+    REDUCTION_OPS | BROADCAST_OPS | MEMORY_OPS | SCALAR_OPS | {"LI", "TMATMUL"}
+)
+
+# Pseudo-resources used to keep ordering the def-use names cannot express
+_MEM_RESOURCE = "%mem"        # GM accesses may alias: keep loads/stores in order
+_SCALAR_RESOURCE = "%scalar"  # ops whose scalar operand is dropped by the mock conversion
+
+
 class LoopFusionOptimizer:
     """
-    Fuses consecutive fusable operations into single loops.
+    Fuses fusable operations with the same tile shape into single loops.
+    
+    With reorder=True, each straight-line region (between control flow, calls
+    and other fences) is turned into a def-use DAG, and independent instructions
+    are list-scheduled so that same-shape fusable ops become adjacent. The
+    reordered region is only used when it produces fewer loops than the
+    original order; stats['loop_passes_removed'] counts the loop passes over
+    UB saved this way.
+    
+    Pass the TileBufferAnalyzer result as buffer_analysis when tiles get the
+    offsets it assigned: its live intervals follow source order, so two tiles
+    sharing storage must keep their source order in the schedule as well.
     """
     
-    def __init__(self, tile_info: Dict[str, MockTileInfo]):
+    def __init__(self, tile_info: Dict[str, MockTileInfo], reorder: bool = True,
+                 buffer_analysis: Optional[Dict] = None):
         self.tile_info = tile_info
+        self.reorder = reorder
+        self.storage = self._shared_storage(buffer_analysis)
         self.stats = {
             'fusable_ops': 0,
             'fused_loops': 0,
             'barriers': 0,
             'fusion_savings': 0,
+            'loop_passes_removed': 0,
+            'reordered_instructions': 0,
         }
     
     def optimize(self, instructions: List[MockInstruction]) -> List[Union[FusedLoop, FusionBarrier]]:
-        """Optimize instructions by fusing consecutive fusable operations."""
+        """Optimize instructions by fusing same-shape fusable operations."""
         result = []
-        current_fusable = []
+        region = []
         
         for instr in instructions:
+            if is_fusable(instr.opcode) or instr.opcode in REORDERABLE_BARRIER_OPS:
+                region.append(instr)
+                continue
+            
+            # Fence - nothing is moved across it
+            self._emit_region(region, result)
+            region = []
+            self.stats['barriers'] += 1
+            result.append(FusionBarrier(opcode=instr.opcode, raw_instr=instr))
+        
+        self._emit_region(region, result)
+        return result
+    
+    def _emit_region(self, region: List[MockInstruction],
+                     result: List[Union[FusedLoop, FusionBarrier]]):
+        """Fuse one straight-line region, reordering it if that saves loops."""
+        order = region
+        if self.reorder and len(region) > 2:
+            scheduled = self._schedule_region(region)
+            baseline_loops = self._count_loops(region)
+            scheduled_loops = self._count_loops(scheduled)
+            if scheduled_loops < baseline_loops:
+                order = scheduled
+                self.stats['loop_passes_removed'] += baseline_loops - scheduled_loops
+                self.stats['reordered_instructions'] += sum(
+                    1 for a, b in zip(region, scheduled) if a is not b)
+        
+        current_fusable = []
+        for instr in order:
             if is_fusable(instr.opcode):
                 self.stats['fusable_ops'] += 1
-                
-                dst_info = self.tile_info.get(instr.dst)
-                if dst_info:
-                    shape = FusionTileShape(dst_info.rows, dst_info.cols)
-                    dtype = dst_info.dtype
-                else:
-                    shape = FusionTileShape(8, 8)
-                    dtype = "f32"
-                
-                fusable_op = FusableOp(
-                    opcode=instr.opcode,
-                    dst=instr.dst,
-                    operands=instr.operands,
-                    tile_shape=shape
-                )
+                fusable_op = self._make_fusable_op(instr)
                 
                 # Check if can fuse with current group
-                if current_fusable and current_fusable[0].tile_shape == shape:
+                if current_fusable and current_fusable[0].tile_shape == fusable_op.tile_shape:
                     current_fusable.append(fusable_op)
                 else:
                     # Flush current group and start new one
                     if current_fusable:
-                        result.append(self._create_fused_loop(current_fusable, dtype))
+                        result.append(self._create_fused_loop(current_fusable))
                     current_fusable = [fusable_op]
             else:
                 # Barrier - flush current fusable group
                 if current_fusable:
-                    result.append(self._create_fused_loop(current_fusable, "f32"))
+                    result.append(self._create_fused_loop(current_fusable))
                     current_fusable = []
                 
                 self.stats['barriers'] += 1
@@ -772,20 +1069,166 @@ class LoopFusionOptimizer:
         
         # Flush remaining fusable ops
         if current_fusable:
-            result.append(self._create_fused_loop(current_fusable, "f32"))
+            result.append(self._create_fused_loop(current_fusable))
+    
+    def _shape_of(self, instr: MockInstruction) -> FusionTileShape:
+        """Loop shape of a fusable instruction (shape of its destination tile)."""
+        dst_info = self.tile_info.get(instr.dst)
+        if dst_info:
+            return FusionTileShape(dst_info.rows, dst_info.cols)
+        return FusionTileShape(8, 8)
+    
+    def _make_fusable_op(self, instr: MockInstruction) -> FusableOp:
+        return FusableOp(
+            opcode=instr.opcode,
+            dst=instr.dst,
+            operands=instr.operands,
+            tile_shape=self._shape_of(instr)
+        )
+    
+    def _count_loops(self, instructions: List[MockInstruction]) -> int:
+        """Number of fused loops adjacent-only grouping produces for this order."""
+        loops = 0
+        current_shape = None
+        for instr in instructions:
+            if is_fusable(instr.opcode):
+                shape = self._shape_of(instr)
+                if shape != current_shape:
+                    loops += 1
+                    current_shape = shape
+            else:
+                current_shape = None
+        return loops
+    
+    @staticmethod
+    def _shared_storage(buffer_analysis: Optional[Dict]) -> Dict[str, List[str]]:
+        """
+        Pseudo-resource per pair of tiles whose buffer ranges overlap, by tile.
         
-        return result
+        A tile's reads use and its writes define each of its resources, so
+        the dependency DAG orders every access of the earlier tile of a pair
+        before the write that takes over its storage.
+        """
+        storage: Dict[str, List[str]] = {}
+        if not buffer_analysis:
+            return storage
+        tiles = sorted((t for t in buffer_analysis['tiles'].values() if t.offset >= 0),
+                       key=lambda t: t.name)
+        for i, a in enumerate(tiles):
+            for b in tiles[i + 1:]:
+                if a.offset < b.offset + b.total_bytes and b.offset < a.offset + a.total_bytes:
+                    resource = f"%ub:{a.name}:{b.name}"
+                    storage.setdefault(a.name, []).append(resource)
+                    storage.setdefault(b.name, []).append(resource)
+        return storage
+    
+    def _defs_uses(self, instr: MockInstruction) -> Tuple[set, set]:
+        """Names written and read by an instruction (including pseudo-resources)."""
+        opcode = instr.opcode
+        defs = {instr.dst} if instr.dst else set()
+        uses = {str(op) for op in instr.operands}
+        for name in list(defs):
+            defs.update(self.storage.get(name, ()))
+        for name in list(uses):
+            uses.update(self.storage.get(name, ()))
+        
+        if opcode in MEMORY_OPS:
+            defs.add(_MEM_RESOURCE)
+            uses.add(_MEM_RESOURCE)
+        if opcode in SCALAR_OPS or opcode == "LI":
+            defs.add(_SCALAR_RESOURCE)
+        if is_fusable(opcode) and not instr.operands:
+            # e.g. TEXPANDS: the scalar source is not in the mock operands
+            uses.add(_SCALAR_RESOURCE)
+        return defs, uses
+    
+    def build_dependency_dag(self, instructions: List[MockInstruction]) -> List[List[int]]:
+        """
+        Build the def-use DAG of a straight-line region.
+        
+        Returns the successor list of each instruction index. Edges cover
+        read-after-write, write-after-read and write-after-write hazards.
+        """
+        succs: List[List[int]] = [[] for _ in instructions]
+        last_writer: Dict[str, int] = {}
+        readers: Dict[str, List[int]] = {}
+        
+        for j, instr in enumerate(instructions):
+            defs, uses = self._defs_uses(instr)
+            preds = set()
+            for name in uses:
+                if name in last_writer:
+                    preds.add(last_writer[name])              # RAW
+            for name in defs:
+                if name in last_writer:
+                    preds.add(last_writer[name])              # WAW
+                preds.update(readers.get(name, ()))           # WAR
+            preds.discard(j)
+            for i in preds:
+                succs[i].append(j)
+            
+            for name in uses:
+                readers.setdefault(name, []).append(j)
+            for name in defs:
+                last_writer[name] = j
+                readers[name] = []
+        
+        return succs
     
-    def _create_fused_loop(self, ops: List[FusableOp], dtype: str) -> FusedLoop:
+    def _schedule_region(self, region: List[MockInstruction]) -> List[MockInstruction]:
+        """
+        List-schedule a region to make same-shape fusable ops adjacent.
+        
+        Priority: extend the open fusion group with a ready op of its shape;
+        otherwise emit the earliest ready barrier (it may unlock more members
+        of the next group); otherwise open a group with the earliest ready op.
+        """
+        succs = self.build_dependency_dag(region)
+        num_preds = [0] * len(region)
+        for targets in succs:
+            for j in targets:
+                num_preds[j] += 1
+        
+        ready = [i for i in range(len(region)) if num_preds[i] == 0]
+        scheduled = []
+        group_shape = None
+        
+        while ready:
+            pick = None
+            if group_shape is not None:
+                for i in sorted(ready):
+                    if is_fusable(region[i].opcode) and self._shape_of(region[i]) == group_shape:
+                        pick = i
+                        break
+            if pick is None:
+                barriers = [i for i in ready if not is_fusable(region[i].opcode)]
+                if barriers:
+                    pick = min(barriers)
+                    group_shape = None
+                else:
+                    pick = min(ready)
+                    group_shape = self._shape_of(region[pick])
+            
+            ready.remove(pick)
+            scheduled.append(region[pick])
+            for j in succs[pick]:
+                num_preds[j] -= 1
+                if num_preds[j] == 0:
+                    ready.append(j)
+        
+        return scheduled
+    
+    def _create_fused_loop(self, ops: List[FusableOp]) -> FusedLoop:
         """Create a fused loop from a list of fusable operations."""
         self.stats['fused_loops'] += 1
         if len(ops) > 1:
             self.stats['fusion_savings'] += len(ops) - 1
         
+        dst_info = self.tile_info.get(ops[0].dst)
         return FusedLoop(
             tile_shape=ops[0].tile_shape,
             operations=ops,
-            dtype=dtype
+            dtype=dst_info.dtype if dst_info else "f32"
         )
 
 
@@ -868,26 +1311,146 @@ class CodeGenerator:
 class Optimizer:
     """
     Optimizer for PTO programs.
+    
+    Runs on the SSA form (pto_compile_ssa):
+    - CSE: value numbering merges pure tile ops with identical opcode,
+      operands and attributes (e.g. a repeated TROWMAX of the same tile)
+    - DCE: removes pure tile ops whose results are never read or stored
+    
+    Instruction counts before and after are recorded in self.stats.
     """
     
-    def __init__(self, program: PTOProgram):
+    # Ops without side effects whose destination tile is fully overwritten
+    PURE_TILE_OPS = (FUSABLE_BINARY_OPS | FUSABLE_UNARY_OPS | FUSABLE_SCALAR_OPS |
+                     REDUCTION_OPS | BROADCAST_OPS | {"TMATMUL", "TMATMUL_ACC"})
+    
+    COMMUTATIVE_OPS = {"TADD", "TMUL", "TMAX", "TMIN"}
+    
+    def __init__(self, program: PTOProgram, enable_dce: bool = True, enable_cse: bool = True):
         self.program = program
+        self.enable_dce = enable_dce
+        self.enable_cse = enable_cse
+        self.stats = {
+            'instructions_before': len(program.instructions),
+            'instructions_after': len(program.instructions),
+            'cse_removed': 0,
+            'dce_removed': 0,
+        }
     
     def optimize(self) -> PTOProgram:
         """Run all optimization passes."""
-        self._dead_code_elimination()
+        from compile.pto_compile_ssa import build_ssa, lower_ssa, drop_unreferenced_tiles
+        
+        func = build_ssa(self.program)
+        if self.enable_cse:
+            self._common_subexpression_elimination(func)
+        if self.enable_dce:
+            self._dead_code_elimination(func)
+        
+        if self.stats['cse_removed'] or self.stats['dce_removed']:
+            optimized = lower_ssa(func)
+            drop_unreferenced_tiles(self.program, optimized)
+            self.program = optimized
+        self.stats['instructions_after'] = len(self.program.instructions)
         return self.program
     
-    def _dead_code_elimination(self):
-        """Remove dead code."""
-        # Simple implementation - remove unused tiles
-        used_tiles = set()
-        for instr in self.program.instructions:
-            for attr in ['src', 'src0', 'src1', 'a', 'b', 'acc']:
-                if hasattr(instr, attr):
-                    src = getattr(instr, attr)
-                    if hasattr(src, 'name'):
-                        used_tiles.add(src.name)
+    def report(self) -> str:
+        """One-line summary of the instruction-count delta."""
+        s = self.stats
+        return (f"// Optimizer: {self.program.name}: {s['instructions_before']} -> "
+                f"{s['instructions_after']} instructions "
+                f"(CSE: -{s['cse_removed']}, DCE: -{s['dce_removed']})")
+    
+    def _value_key(self, op) -> Tuple:
+        """Value-numbering key of a pure op."""
+        instr = op.instr
+        operands = [(f, id(v)) for f, v in op.operands]
+        if op.opcode in self.COMMUTATIVE_OPS:
+            operands = sorted(v for _, v in operands)
+        attrs = []
+        for f in instr.__dataclass_fields__:
+            value = getattr(instr, f)
+            if not hasattr(value, 'name'):
+                attrs.append((f, repr(value)))
+        return (op.opcode, tuple(operands), tuple(attrs), repr(instr.dst.tile_type))
+    
+    def _common_subexpression_elimination(self, func):
+        """Merge pure tile ops computing a value that is already available."""
+        from compile.pto_compile_ssa import var_def_counts, can_replace_uses
+        
+        dominators = self._dominators(func)
+        def_counts = var_def_counts(func)
+        table: Dict[Tuple, List] = {}
+        
+        for block in func.blocks:
+            for op in list(block.ops):
+                if op.opcode not in self.PURE_TILE_OPS:
+                    continue
+                key = self._value_key(op)
+                result = op.defined_values()[0]
+                for prev in table.get(key, ()):
+                    if prev.block.id not in dominators[block.id]:
+                        continue
+                    prev_result = prev.defined_values()[0]
+                    if can_replace_uses(result, prev_result, prev, def_counts):
+                        func.replace_all_uses(result, prev_result)
+                        func.remove_op(op)
+                        def_counts[result.var] -= 1
+                        self.stats['cse_removed'] += 1
+                        break
+                else:
+                    table.setdefault(key, []).append(op)
+    
+    @staticmethod
+    def _dominators(func) -> Dict[int, set]:
+        """Dominator sets of the blocks (iterative data-flow)."""
+        all_ids = {b.id for b in func.blocks}
+        dom = {b.id: ({b.id} if not b.preds else set(all_ids)) for b in func.blocks}
+        changed = True
+        while changed:
+            changed = False
+            for block in func.blocks:
+                if not block.preds:
+                    continue
+                new = set.intersection(*(dom[p.id] for p in block.preds)) | {block.id}
+                if new != dom[block.id]:
+                    dom[block.id] = new
+                    changed = True
+        return dom
+    
+    def _dead_code_elimination(self, func):
+        """Remove pure tile ops whose results are never read or stored (mark-sweep)."""
+        from compile.pto_compile_ssa import SSAPhi
+        
+        live = set()
+        worklist = [op for op in func.ops() if op.opcode not in self.PURE_TILE_OPS]
+        seen_phis = set()
+        while worklist:
+            node = worklist.pop()
+            if isinstance(node, SSAPhi):
+                if id(node) in seen_phis:
+                    continue
+                seen_phis.add(id(node))
+                values = node.used_values()
+            else:
+                if id(node) in live:
+                    continue
+                live.add(id(node))
+                values = node.used_values()
+            worklist.extend(v.def_op for v in values if v.def_op is not None)
+        
+        for block in func.blocks:
+            for op in [op for op in block.ops if id(op) not in live]:
+                for value in op.used_values():
+                    value.uses = [u for u in value.uses if u is not op]
+                for value in op.defined_values():
+                    value.uses = []
+                block.ops.remove(op)
+                self.stats['dce_removed'] += 1
+            for phi in [phi for phi in block.phis if id(phi) not in seen_phis]:
+                for value in phi.used_values():
+                    value.uses = [u for u in value.uses if u is not phi]
+                block.phis.remove(phi)
 
 
 # =============================================================================
@@ -902,6 +1465,7 @@ class PTOCompiler:
     def __init__(self, enable_optimization: bool = True, enable_type_check: bool = True):
         self.enable_optimization = enable_optimization
         self.enable_type_check = enable_type_check
+        self.optimization_stats: Dict[str, Dict[str, int]] = {}
     
     def compile(self, program: PTOProgram) -> PTOProgram:
         """Compile a PTO program."""
@@ -915,6 +1479,7 @@ class PTOCompiler:
         if self.enable_optimization:
             optimizer = Optimizer(program)
             program = optimizer.optimize()
+            self.optimization_stats[program.name] = optimizer.stats
         
         return program
 
@@ -1098,7 +1663,7 @@ def apply_loop_replay_optimization(code: str, enable_replay: bool = True) -> str
 
 __all__ = [
     # Error types
-    'CompilerError', 'ParseError', 'TypeError', 'ValidationError',
+    'CompilerError', 'ParseError', 'TypeError', 'ValidationError', 'BufferCapacityWarning',
     
     # Symbol table
     'Symbol', 'SymbolTable',
@@ -1114,7 +1679,8 @@ __all__ = [
     'MockTileInfo', 'MockInstruction', 'convert_program_to_mock_instructions',
     
     # Buffer analysis
-    'TileBufferInfo', 'TileBufferAnalyzer',
+    'TileBufferInfo', 'TileBufferAnalyzer', 'TileLivenessAnalysis', 'tile_defs_uses',
+    'build_control_flow_graph',
     
     # Type checker and optimizer
     'TypeChecker', 'Optimizer', 'CodeGenerator', 'PTOCompiler',
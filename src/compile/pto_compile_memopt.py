@@ -0,0 +1,368 @@
+"""
+PTO Compiler - Redundant Memory Operation Elimination
+
+This module removes GM traffic that the on-chip buffer makes unnecessary:
+
+1) Store-to-load forwarding: a TLOAD that re-reads a GM region last written by
+   a TSTORE reuses the stored tile instead of reloading it
+2) Load reuse: a TLOAD of a region already loaded in the same block (with no
+   store in between) reuses the first tile
+3) Dead-store elimination: a TSTORE overwritten by a later TSTORE of the same
+   region before any read is removed, as are stores to memrefs the caller
+   declares dead (e.g. scratch buffers used only inside a merged kernel)
+
+The passes run on the SSA form (pto_compile_ssa), where a memref's versions
+are memory states, so "the last store to this region" is found by walking the
+memory def chain. Distinct memrefs are assumed not to alias.
+
+Cross-call optimization:
+========================
+merge_in_core_calls() merges each run of consecutive CALLs to InCore
+functions in an orchestration function into a single InCore function, so the
+TSTORE of one callee and the TLOAD of the next end up in one body and are
+forwarded by the passes above.
+
+Usage:
+======
+    program, stats = eliminate_redundant_memory_ops(program)
+    print(stats)   # {'forwarded_loads': 2, 'reused_loads': 1, 'dead_stores': 0}
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import fields, replace
+import os
+import sys
+
+# Add parent directories to path for imports
+_current_dir = os.path.dirname(os.path.abspath(__file__))
+_src_dir = os.path.dirname(_current_dir)
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from compile.pto_compile_common import PTOProgram, PTOModule
+from compile.pto_compile_ssa import (
+    SSAFunction, SSAOp, SSAValue, build_ssa, lower_ssa,
+    var_def_counts, can_replace_uses, drop_unreferenced_tiles,
+)
+from isa_definition.pto_isa_definition import (
+    ImmediateOperand, MemRefOperand, CALL,
+)
+
+
+# =============================================================================
+# Memory Regions
+# =============================================================================
+
+def _operand(op: SSAOp, field_name: str) -> Optional[SSAValue]:
+    for f, value in op.operands:
+        if f == field_name:
+            return value
+    return None
+
+
+def _offset_key(op: SSAOp, field_name: str):
+    """Immediate value or SSA value of a TLOAD/TSTORE offset."""
+    operand = getattr(op.instr, field_name)
+    if isinstance(operand, ImmediateOperand):
+        return ('imm', operand.value)
+    return ('ssa', id(_operand(op, field_name)))
+
+
+def _tile_type(op: SSAOp):
+    return op.instr.dst.tile_type if op.opcode == 'TLOAD' else op.instr.src.tile_type
+
+
+def _same_region(a: SSAOp, b: SSAOp) -> bool:
+    return (_tile_type(a) == _tile_type(b)
+            and _offset_key(a, 'row_offset') == _offset_key(b, 'row_offset')
+            and _offset_key(a, 'col_offset') == _offset_key(b, 'col_offset'))
+
+
+def _disjoint_region(a: SSAOp, b: SSAOp) -> bool:
+    """True if both accesses provably touch different rows of the memref."""
+    rows_a = _tile_type(a).shape.rows
+    rows_b = _tile_type(b).shape.rows
+    ka, kb = _offset_key(a, 'row_offset'), _offset_key(b, 'row_offset')
+    if rows_a != rows_b or ka[0] != 'imm' or kb[0] != 'imm':
+        return False
+    return ka[1] != kb[1]
+
+
+# =============================================================================
+# Passes
+# =============================================================================
+
+class MemoryOpEliminator:
+    """
+    Store-to-load forwarding, load reuse and dead-store elimination on SSA.
+    """
+
+    def __init__(self, func: SSAFunction, dead_memrefs: Optional[Set[str]] = None):
+        self.func = func
+        self.dead_memrefs = set(dead_memrefs or ())
+        self.stats = {
+            'forwarded_loads': 0,
+            'reused_loads': 0,
+            'dead_stores': 0,
+        }
+        self.def_counts = var_def_counts(func)
+
+    def run(self) -> Dict[str, int]:
+        for block in self.func.blocks:
+            for op in list(block.ops):
+                if op.opcode == 'TLOAD':
+                    self._eliminate_load(op)
+        self._eliminate_overwritten_stores()
+        self._eliminate_dead_memref_stores()
+        return self.stats
+
+    # -- Loads -----------------------------------------------------------------
+
+    def _eliminate_load(self, load: SSAOp):
+        result = load.defined_values()[0]
+        mem = _operand(load, 'src_mem')
+        source, kind = self._forwarding_source(load, result, mem)
+        if source is None:
+            return
+        self.func.replace_all_uses(result, source)
+        self.func.remove_op(load)
+        self.stats[kind] += 1
+
+    def _forwarding_source(self, load: SSAOp, result: SSAValue,
+                           mem: SSAValue) -> Tuple[Optional[SSAValue], str]:
+        # Earlier load of the same memory state in this block
+        for user in mem.uses:
+            if (isinstance(user, SSAOp) and user is not load and user.opcode == 'TLOAD'
+                    and user.block is load.block and user.index < load.index
+                    and _same_region(user, load)):
+                tile = user.defined_values()[0]
+                if can_replace_uses(result, tile, user, self.def_counts):
+                    return tile, 'reused_loads'
+
+        # Last store to the region along the memory def chain
+        state = mem
+        while isinstance(state.def_op, SSAOp) and state.def_op.opcode == 'TSTORE':
+            store = state.def_op
+            if _same_region(store, load):
+                tile = _operand(store, 'src')
+                if self._layout_matches(store) and can_replace_uses(result, tile, store, self.def_counts):
+                    return tile, 'forwarded_loads'
+                break
+            if not _disjoint_region(store, load):
+                break
+            state = _operand(store, 'dst_mem')
+        return None, ''
+
+    def _layout_matches(self, store: SSAOp) -> bool:
+        """TSTORE uses the memref's row stride, TLOAD the tile's; they must agree."""
+        memref_type = self.func.program.memref_declarations.get(store.instr.dst_mem.name)
+        shape = memref_type.shape if memref_type is not None else None
+        return shape is None or shape.cols == store.instr.src.tile_type.shape.cols
+
+    # -- Stores ----------------------------------------------------------------
+
+    def _remove_store(self, store: SSAOp):
+        self.func.replace_all_uses(store.defined_values()[0], _operand(store, 'dst_mem'))
+        self.func.remove_op(store)
+        self.stats['dead_stores'] += 1
+
+    def _eliminate_overwritten_stores(self):
+        for op in [op for op in self.func.ops() if op.opcode == 'TSTORE']:
+            users = op.defined_values()[0].uses
+            if (len(users) == 1 and isinstance(users[0], SSAOp)
+                    and users[0].opcode == 'TSTORE'
+                    and _operand(users[0], 'dst_mem') is op.defined_values()[0]
+                    and _same_region(op, users[0])):
+                self._remove_store(op)
+
+    def _eliminate_dead_memref_stores(self):
+        for var in self.dead_memrefs:
+            accesses = [op for op in self.func.ops()
+                        if any(v.var == var for v in op.used_values())]
+            if not accesses or any(op.opcode != 'TSTORE' for op in accesses):
+                continue
+            for op in reversed(accesses):
+                self._remove_store(op)
+
+
+def eliminate_redundant_memory_ops(program: PTOProgram,
+                                   dead_memrefs: Optional[Set[str]] = None
+                                   ) -> Tuple[PTOProgram, Dict[str, int]]:
+    """
+    Remove redundant TLOAD/TSTORE instructions from a function.
+
+    Args:
+        program: Function to optimize (not modified)
+        dead_memrefs: Memrefs whose contents are not read after the function
+
+    Returns:
+        (optimized program, stats)
+    """
+    func = build_ssa(program)
+    stats = MemoryOpEliminator(func, dead_memrefs).run()
+    if not any(stats.values()):
+        return program, stats
+
+    optimized = lower_ssa(func)
+    drop_unreferenced_tiles(program, optimized)
+    return optimized, stats
+
+
+# =============================================================================
+# Merging InCore Calls
+# =============================================================================
+
+def _rename_fields(instr, tile_prefix: str, memref_map: Dict[str, str]):
+    """Copy of `instr` with local names prefixed and memrefs renamed."""
+    changes = {}
+    for f in fields(instr):
+        operand = getattr(instr, f.name)
+        if isinstance(operand, MemRefOperand):
+            changes[f.name] = replace(operand, name=memref_map[operand.name])
+        elif hasattr(operand, 'name') and isinstance(operand.name, str):
+            changes[f.name] = replace(operand, name=tile_prefix + operand.name)
+    return replace(instr, **changes) if changes else instr
+
+
+def _arg_base(arg) -> str:
+    return arg[0] if isinstance(arg, tuple) else str(arg)
+
+
+def _binding_keys(callee: PTOProgram, call: CALL) -> Dict[str, Set[Tuple[str, str]]]:
+    """Caller tensor -> (argument, memref type) keys the call binds it under."""
+    keys: Dict[str, Set[Tuple[str, str]]] = {}
+    for param, arg in call.args.items():
+        key = (repr(arg), repr(callee.memref_declarations[param]))
+        keys.setdefault(_arg_base(arg), set()).add(key)
+    return keys
+
+
+def _can_merge(callee: Optional[PTOProgram], call: CALL) -> bool:
+    if callee is None or not callee.is_in_core:
+        return False
+    if set(call.args) != set(callee.memref_declarations):
+        return False
+    # A tensor bound at two offsets (or layouts) would become two aliasing
+    # parameters of the merged function
+    if any(len(k) > 1 for k in _binding_keys(callee, call).values()):
+        return False
+    body = callee.instructions
+    if body and body[-1].opcode == 'RETURN':
+        body = body[:-1]
+    return not any(instr.opcode in ('CALL', 'RETURN') for instr in body)
+
+
+def _merge_run(module: PTOModule, calls: List[CALL], name: str) -> Tuple[PTOProgram, CALL]:
+    callees = [module.get_function(call.callee) for call in calls]
+    merged = PTOProgram(name=name, is_in_core=True, is_cube=callees[0].is_cube)
+    args: Dict[str, object] = {}
+    param_of: Dict[Tuple[str, str], str] = {}
+
+    for k, (call, callee) in enumerate(zip(calls, callees)):
+        prefix = f"c{k}_"
+        memref_map = {}
+        for param, arg in call.args.items():
+            memref_type = callee.memref_declarations[param]
+            key = (repr(arg), repr(memref_type))
+            if key not in param_of:
+                base = _arg_base(arg)
+                pname = base if base not in merged.memref_declarations else f"{base}_{len(args)}"
+                param_of[key] = pname
+                merged.memref_declarations[pname] = memref_type
+                args[pname] = arg
+            memref_map[param] = param_of[key]
+
+        for tname, ttype in callee.tile_declarations.items():
+            merged.tile_declarations[prefix + tname] = ttype
+        for sname, stype in callee.scalar_declarations.items():
+            merged.scalar_declarations[prefix + sname] = stype
+        for instr in callee.instructions:
+            if instr.opcode != 'RETURN':
+                merged.instructions.append(_rename_fields(instr, prefix, memref_map))
+
+    return merged, CALL(callee=name, args=args)
+
+
+def merge_in_core_calls(module: PTOModule, program: PTOProgram
+                        ) -> Tuple[PTOProgram, List[PTOProgram]]:
+    """
+    Merge runs of consecutive InCore CALLs of an orchestration function.
+
+    Each run of two or more adjacent CALLs to InCore functions with the same
+    cube/vector placement becomes one InCore function. Caller memrefs bound
+    by several calls of the run become one parameter of the merged function.
+
+    A run never binds one caller tensor under two different offsets or
+    layouts: those views may overlap, and the memory passes assume distinct
+    memrefs do not alias, so such a call starts a new run instead.
+
+    Returns:
+        (rewritten orchestration program, list of new InCore functions)
+    """
+    if program.is_in_core:
+        return program, []
+
+    instructions: List = []
+    merged_funcs: List[PTOProgram] = []
+    run: List[CALL] = []
+    run_keys: Dict[str, Set[Tuple[str, str]]] = {}
+
+    def flush():
+        if len(run) >= 2:
+            name = f"{program.name}_merged_{len(merged_funcs)}"
+            merged, call = _merge_run(module, run, name)
+            merged_funcs.append(merged)
+            instructions.append(call)
+        else:
+            instructions.extend(run)
+        run.clear()
+        run_keys.clear()
+
+    for instr in program.instructions:
+        callee = module.get_function(instr.callee) if instr.opcode == 'CALL' else None
+        if callee is not None and _can_merge(callee, instr):
+            first = module.get_function(run[0].callee) if run else None
+            keys = _binding_keys(callee, instr)
+            if first is not None and first.is_cube != callee.is_cube:
+                flush()
+            elif any(base in run_keys and run_keys[base] != k for base, k in keys.items()):
+                flush()
+            run.append(instr)
+            for base, k in keys.items():
+                run_keys[base] = k
+            continue
+        flush()
+        instructions.append(instr)
+    flush()
+
+    if not merged_funcs:
+        return program, []
+    return replace(program, instructions=instructions), merged_funcs
+
+
+def scratch_memrefs(orchestration: PTOProgram, callee: str) -> Set[str]:
+    """
+    Parameters of `callee` whose contents are dead after the call: they are
+    bound to scope-local intermediate buffers of the orchestration function
+    that no other CALL touches.
+    """
+    calls = [i for i in orchestration.instructions if i.opcode == 'CALL']
+    own = [c for c in calls if c.callee == callee]
+    if len(own) != 1:
+        return set()
+
+    dead = set()
+    for param, arg in own[0].args.items():
+        info = orchestration.intermediate_buffers.get(_arg_base(arg))
+        if info is None or not info.scope_local:
+            continue
+        if not any(_arg_base(a) == _arg_base(arg) for c in calls if c is not own[0]
+                   for a in c.args.values()):
+            dead.add(param)
+    return dead
+
+
+__all__ = [
+    'MemoryOpEliminator', 'eliminate_redundant_memory_ops', 'merge_in_core_calls',
+    'scratch_memrefs',
+]
@@ -0,0 +1,341 @@
+"""
+PTO Compiler - Static Performance Estimator
+
+Estimates execution cycles of PTO programs from the Ascend A2/A3 cycle-cost
+table (ASCEND_A2A3_CYCLE_COSTS / get_cycle_cost) that the a2a3 simulator
+backend uses for its cycle hooks, without generating or running any code.
+
+Model:
+======
+- Each tile instruction costs get_cycle_cost(opcode, rows, cols) for the
+  tile it produces (TSTORE: the tile it stores)
+- FOR loops multiply their body by the trip count: immediate bounds are
+  evaluated, symbolic bounds are resolved from `bindings` (scalar name ->
+  value) or fall back to `default_trip_count` and are listed as assumptions
+- IF/ELSE costs the more expensive branch (upper bound)
+- An InCore function runs as one task on a single engine: cube if it is
+  marked is_cube or contains a matmul, vector otherwise
+- An orchestration CALL adds the callee's engine time; the orchestration's
+  own control and scalar work is counted as scalar time
+
+total_cycles is the serial sum; overlapped_cycles assumes the cube and
+vector queues run fully in parallel (max of the two, plus scalar time).
+Real times also depend on dependencies and core counts, so the numbers are
+meant for ranking variants (e.g. tiling choices), not absolute prediction.
+
+Usage:
+======
+    estimator = PerformanceEstimator(module, bindings={"num_tiles": 64})
+    estimates = estimator.estimate_module()
+    print(estimator.report(estimates))
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import math
+import os
+import sys
+
+# Add parent directories to path for imports
+_current_dir = os.path.dirname(os.path.abspath(__file__))
+_src_dir = os.path.dirname(_current_dir)
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from compile.pto_compile_common import (
+    PTOProgram, PTOModule, MEMORY_OPS, MATMUL_OPS,
+)
+from compile.pto_codegen_ascend_a2a3_sim import (
+    ASCEND_A2A3_CYCLE_COSTS, get_cycle_cost,
+)
+from isa_definition.pto_isa_definition import ImmediateOperand, ScalarInstruction
+
+
+# =============================================================================
+# Estimates
+# =============================================================================
+
+@dataclass
+class FunctionEstimate:
+    """Estimated cycles of one function (loops and calls expanded)."""
+    name: str
+    is_in_core: bool
+    engine: str                                   # cube, vector, or orchestration
+    cube_cycles: float = 0.0
+    vector_cycles: float = 0.0
+    scalar_cycles: float = 0.0                    # Orchestration control/scalar work
+    memory_cycles: float = 0.0                    # TLOAD/TSTORE share of engine time
+    op_cycles: Dict[str, float] = field(default_factory=dict)
+    op_counts: Dict[str, float] = field(default_factory=dict)
+    call_counts: Dict[str, float] = field(default_factory=dict)
+    assumptions: List[str] = field(default_factory=list)
+
+    @property
+    def total_cycles(self) -> float:
+        return self.cube_cycles + self.vector_cycles + self.scalar_cycles
+
+    @property
+    def overlapped_cycles(self) -> float:
+        return max(self.cube_cycles, self.vector_cycles) + self.scalar_cycles
+
+    @property
+    def bottleneck(self) -> str:
+        """Dominant cost: memory, cube, vector or scalar."""
+        engine_cycles = self.cube_cycles + self.vector_cycles
+        if engine_cycles == 0:
+            return "scalar"
+        if self.memory_cycles * 2 >= engine_cycles:
+            return "memory"
+        if self.scalar_cycles > max(self.cube_cycles, self.vector_cycles):
+            return "scalar"
+        return "cube" if self.cube_cycles >= self.vector_cycles else "vector"
+
+
+class _Costs:
+    """Cycle accumulator for a region of instructions."""
+
+    def __init__(self):
+        self.engine = 0.0      # InCore instruction cycles
+        self.memory = 0.0
+        self.cube = 0.0        # Callee cycles (orchestration)
+        self.vector = 0.0
+        self.scalar = 0.0
+        self.op_cycles: Dict[str, float] = {}
+        self.op_counts: Dict[str, float] = {}
+        self.calls: Dict[str, float] = {}
+
+    @property
+    def total(self) -> float:
+        return self.engine + self.cube + self.vector + self.scalar
+
+    def add(self, other: "_Costs", times: float = 1.0):
+        self.engine += other.engine * times
+        self.memory += other.memory * times
+        self.cube += other.cube * times
+        self.vector += other.vector * times
+        self.scalar += other.scalar * times
+        for table, src in ((self.op_cycles, other.op_cycles),
+                           (self.op_counts, other.op_counts),
+                           (self.calls, other.calls)):
+            for key, value in src.items():
+                table[key] = table.get(key, 0.0) + value * times
+
+    def count_op(self, opcode: str, cycles: float):
+        self.op_cycles[opcode] = self.op_cycles.get(opcode, 0.0) + cycles
+        self.op_counts[opcode] = self.op_counts.get(opcode, 0.0) + 1
+
+
+# =============================================================================
+# Estimator
+# =============================================================================
+
+class PerformanceEstimator:
+    """
+    Static cycle estimator for PTO programs and modules.
+    """
+
+    def __init__(self, module: Optional[PTOModule] = None,
+                 bindings: Optional[Dict[str, int]] = None,
+                 default_trip_count: int = 1):
+        """
+        Args:
+            module: Module used to resolve CALL targets
+            bindings: Values of scalars used as symbolic loop bounds
+            default_trip_count: Trip count assumed for unresolved loops
+        """
+        self.module = module
+        self.bindings = dict(bindings or {})
+        self.default_trip_count = default_trip_count
+        self._cache: Dict[str, FunctionEstimate] = {}
+        self._active: set = set()
+
+    # -- Public API ------------------------------------------------------------
+
+    def estimate(self, program: PTOProgram) -> FunctionEstimate:
+        """Estimate one function (callees are resolved through the module)."""
+        if program.name in self._cache:
+            return self._cache[program.name]
+        self._active.add(program.name)
+        try:
+            assumptions: List[str] = []
+            costs, _ = self._walk(program, 0, assumptions)
+        finally:
+            self._active.discard(program.name)
+
+        if program.is_in_core:
+            uses_cube = program.is_cube or any(op in MATMUL_OPS for op in costs.op_counts)
+            engine = "cube" if uses_cube else "vector"
+        else:
+            engine = "orchestration"
+
+        estimate = FunctionEstimate(
+            name=program.name,
+            is_in_core=program.is_in_core,
+            engine=engine,
+            cube_cycles=costs.cube + (costs.engine if engine == "cube" else 0.0),
+            vector_cycles=costs.vector + (costs.engine if engine == "vector" else 0.0),
+            scalar_cycles=costs.scalar,
+            memory_cycles=costs.memory,
+            op_cycles=costs.op_cycles,
+            op_counts=costs.op_counts,
+            call_counts=costs.calls,
+            assumptions=list(dict.fromkeys(assumptions)),
+        )
+        self._cache[program.name] = estimate
+        return estimate
+
+    def estimate_module(self, module: Optional[PTOModule] = None) -> Dict[str, FunctionEstimate]:
+        """Estimate every function of a module, in module order."""
+        if module is not None and module is not self.module:
+            self.module = module
+            self._cache.clear()
+        if self.module is None:
+            return {}
+        return {name: self.estimate(prog) for name, prog in self.module.functions.items()}
+
+    # -- Walking ---------------------------------------------------------------
+
+    def _tile_shape(self, program: PTOProgram, instr) -> Tuple[int, int]:
+        operand = instr.src if instr.opcode == "TSTORE" else getattr(instr, "dst", None)
+        tile_type = getattr(operand, "tile_type", None)
+        if tile_type is None:
+            return 32, 128
+        return tile_type.shape.rows, tile_type.shape.cols
+
+    def _instr_cost(self, program: PTOProgram, instr) -> Tuple[str, float]:
+        opcode = instr.opcode
+        if isinstance(instr, ScalarInstruction):
+            key = type(instr).__name__
+            return key, float(ASCEND_A2A3_CYCLE_COSTS.get(key, 1))
+        rows, cols = self._tile_shape(program, instr)
+        return opcode, float(get_cycle_cost(opcode, rows, cols))
+
+    def _trip_count(self, instr, assumptions: List[str]) -> float:
+        def resolve(operand):
+            if isinstance(operand, ImmediateOperand):
+                return operand.value
+            return self.bindings.get(getattr(operand, "name", None))
+
+        lb, ub, step = resolve(instr.lb), resolve(instr.ub), resolve(instr.step)
+        if lb is None or ub is None or not step:
+            assumptions.append(
+                f"loop {instr.iv.name}: trip count {self.default_trip_count} assumed")
+            return float(self.default_trip_count)
+        return float(max(0, math.ceil((ub - lb) / step)))
+
+    def _walk(self, program: PTOProgram, i: int, assumptions: List[str],
+              stop: Tuple[str, ...] = ()) -> Tuple[_Costs, int]:
+        """Cost of instructions from `i` up to (not including) an opcode in `stop`."""
+        instrs = program.instructions
+        costs = _Costs()
+        while i < len(instrs):
+            instr = instrs[i]
+            opcode = instr.opcode
+            if opcode in stop:
+                return costs, i
+
+            if opcode in ("FOR", "WHILE"):
+                body, i = self._walk(program, i + 1, assumptions, ("ENDFOR", "ENDWHILE"))
+                trips = (self._trip_count(instr, assumptions) if opcode == "FOR"
+                         else float(self.default_trip_count))
+                if opcode == "WHILE":
+                    assumptions.append(f"while loop: trip count {self.default_trip_count} assumed")
+                body.scalar += 2 * ASCEND_A2A3_CYCLE_COSTS["FOR"]   # FOR + ENDFOR per trip
+                costs.add(body, trips)
+            elif opcode == "IF":
+                then_costs, i = self._walk(program, i + 1, assumptions, ("ELSE", "ENDIF"))
+                else_costs = _Costs()
+                if i < len(instrs) and instrs[i].opcode == "ELSE":
+                    else_costs, i = self._walk(program, i + 1, assumptions, ("ENDIF",))
+                costs.add(then_costs if then_costs.total >= else_costs.total else else_costs)
+                costs.scalar += ASCEND_A2A3_CYCLE_COSTS["IF"]
+            elif opcode == "CALL":
+                self._add_call(instr, costs, assumptions)
+            elif opcode in ("RETURN", "DO", "BREAK", "CONTINUE"):
+                costs.scalar += ASCEND_A2A3_CYCLE_COSTS.get(opcode, 1)
+            else:
+                key, cycles = self._instr_cost(program, instr)
+                costs.count_op(key, cycles)
+                if program.is_in_core and not isinstance(instr, ScalarInstruction):
+                    costs.engine += cycles
+                    if opcode in MEMORY_OPS:
+                        costs.memory += cycles
+                else:
+                    costs.scalar += cycles
+            i += 1
+        return costs, i
+
+    def _add_call(self, instr, costs: _Costs, assumptions: List[str]):
+        costs.scalar += ASCEND_A2A3_CYCLE_COSTS["CALL"]
+        costs.calls[instr.callee] = costs.calls.get(instr.callee, 0.0) + 1
+        callee = self.module.get_function(instr.callee) if self.module else None
+        if callee is None or callee.name in self._active:
+            assumptions.append(f"call {instr.callee}: not resolved, callee cost ignored")
+            return
+        est = self.estimate(callee)
+        assumptions.extend(f"{callee.name}: {note}" for note in est.assumptions)
+        callee_costs = _Costs()
+        callee_costs.cube = est.cube_cycles
+        callee_costs.vector = est.vector_cycles
+        callee_costs.scalar = est.scalar_cycles
+        callee_costs.memory = est.memory_cycles
+        callee_costs.op_cycles = dict(est.op_cycles)
+        callee_costs.op_counts = dict(est.op_counts)
+        costs.add(callee_costs)
+
+    # -- Reporting -------------------------------------------------------------
+
+    def report(self, estimates: Dict[str, FunctionEstimate], top_ops: int = 3) -> str:
+        """Human-readable per-function estimate and bottleneck report."""
+        lines = []
+        lines.append("=" * 78)
+        lines.append("STATIC PERFORMANCE ESTIMATE (Ascend A2/A3 cycle model)")
+        lines.append("=" * 78)
+        lines.append(f"{'Function':<32} {'Engine':<13} {'Cube':>9} {'Vector':>10} "
+                     f"{'Total':>10}  Bottleneck")
+        lines.append("-" * 78)
+        for est in sorted(estimates.values(), key=lambda e: -e.total_cycles):
+            lines.append(f"{est.name:<32} {est.engine:<13} {est.cube_cycles:>9.0f} "
+                         f"{est.vector_cycles:>10.0f} {est.total_cycles:>10.0f}  {est.bottleneck}")
+
+        roots = [e for e in estimates.values() if not e.is_in_core]
+        if self.module is not None and self.module.entry_function in estimates:
+            roots = [estimates[self.module.entry_function]]
+        for est in roots:
+            lines.append("")
+            lines.append(f"Entry {est.name}:")
+            lines.append(f"  Serial:     {est.total_cycles:,.0f} cycles")
+            lines.append(f"  Overlapped: {est.overlapped_cycles:,.0f} cycles "
+                         f"(cube {est.cube_cycles:,.0f} | vector {est.vector_cycles:,.0f} "
+                         f"| scalar {est.scalar_cycles:,.0f})")
+            engine_cycles = est.cube_cycles + est.vector_cycles
+            if engine_cycles:
+                lines.append(f"  Memory:     {est.memory_cycles / engine_cycles * 100:.1f}% "
+                             f"of engine time in TLOAD/TSTORE")
+            lines.append(f"  Bottleneck: {est.bottleneck}")
+            hot = sorted(est.op_cycles.items(), key=lambda kv: -kv[1])[:top_ops]
+            if hot:
+                lines.append("  Hottest ops: " + ", ".join(
+                    f"{op} {cycles:,.0f}" for op, cycles in hot))
+            for note in est.assumptions:
+                lines.append(f"  Assumed: {note}")
+        lines.append("=" * 78)
+        return "\n".join(lines)
+
+
+def estimate_program(program: PTOProgram, module: Optional[PTOModule] = None,
+                     bindings: Optional[Dict[str, int]] = None,
+                     default_trip_count: int = 1) -> FunctionEstimate:
+    """Estimate the cycles of a single function."""
+    return PerformanceEstimator(module, bindings, default_trip_count).estimate(program)
+
+
+def estimate_module(module: PTOModule, bindings: Optional[Dict[str, int]] = None,
+                    default_trip_count: int = 1) -> Dict[str, FunctionEstimate]:
+    """Estimate the cycles of every function in a module."""
+    return PerformanceEstimator(module, bindings, default_trip_count).estimate_module()
+
+
+__all__ = [
+    'FunctionEstimate', 'PerformanceEstimator', 'estimate_program', 'estimate_module',
+]
@@ -0,0 +1,665 @@
+"""
+PTO Compiler - SSA Intermediate Representation
+
+This module provides an SSA form of a PTOProgram with explicit def-use chains,
+so that optimization passes can walk uses of a value directly instead of
+rescanning flat instruction lists.
+
+Structure:
+==========
+- SSAFunction: basic blocks in program order, function inputs, all values
+- BasicBlock:  straight-line ops plus phi nodes; blocks are split at the
+               structured control flow (FOR/ENDFOR, WHILE/DO/ENDWHILE,
+               IF/ELSE/ENDIF, BREAK/CONTINUE, RETURN)
+- SSAOp:       one PTOInstruction with the SSA values it reads and defines
+- SSAPhi:      merge of a variable at a loop header or IF join
+- SSAValue:    one definition of a variable (tile, scalar, index or memref),
+               with the list of ops and phis that use it
+
+Tiles, scalars and loop indices are variables. A memref is a variable whose
+versions are memory states: TSTORE (and a CALL, for every tensor argument)
+reads the current state and defines a new one, TLOAD reads it.
+
+SSA construction uses the algorithm of Braun et al., "Simple and Efficient
+Construction of Static Single Assignment Form" (CC 2013), which builds pruned
+SSA in a single pass over the blocks and removes trivial phis on the fly.
+
+Lowering:
+=========
+Values keep the name of the variable they define, so lowering drops the phis
+and re-emits the instructions in block order. Operands that a pass redirected
+to another value are renamed; if that value's variable is overwritten before
+the use, its definition is copied (TMOV / SMOV) into a fresh variable.
+
+Usage:
+======
+    func = build_ssa(program)
+    for value in func.values:
+        if value.def_op is not None and not value.uses:
+            ...                             # dead definition
+    program = lower_ssa(func)
+"""
+
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import os
+import sys
+
+# Add parent directories to path for imports
+_current_dir = os.path.dirname(os.path.abspath(__file__))
+_src_dir = os.path.dirname(_current_dir)
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from compile.pto_compile_common import (
+    PTOProgram, ValidationError, build_control_flow_graph,
+    LOOP_HEADER_OPS, LOOP_END_OPS,
+)
+from isa_definition.pto_isa_definition import (
+    TileOperand, ScalarOperand, MemRefOperand, IndexOperand,
+    PTOInstruction, TMOV, SMOV, TMovMode,
+)
+
+
+# Instruction fields that define a variable
+DEF_FIELDS = ('dst', 'iv', 'dst_mem')
+
+# Control-flow ops a copy may be inserted in front of at the end of a block
+_BLOCK_END_OPS = LOOP_END_OPS + ('ELSE', 'BREAK', 'CONTINUE')
+
+_OPERAND_KINDS = (
+    (TileOperand, 'tile'),
+    (ScalarOperand, 'scalar'),
+    (MemRefOperand, 'memref'),
+    (IndexOperand, 'index'),
+)
+
+
+def _operand_kind(operand) -> Optional[str]:
+    for cls, kind in _OPERAND_KINDS:
+        if isinstance(operand, cls):
+            return kind
+    return None
+
+
+# =============================================================================
+# IR Classes
+# =============================================================================
+
+@dataclass(eq=False)
+class SSAValue:
+    """One definition of a variable. def_op is None for function inputs."""
+    var: str
+    version: int
+    kind: str                                        # tile, scalar, index, memref
+    def_op: Optional[Union['SSAOp', 'SSAPhi']] = None
+    uses: List[Union['SSAOp', 'SSAPhi']] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return f"{self.var}.{self.version}"
+
+    def __repr__(self) -> str:
+        return f"%{self.name}"
+
+
+@dataclass(eq=False)
+class SSAOp:
+    """An instruction in SSA form."""
+    instr: PTOInstruction
+    block: 'BasicBlock'
+    index: int                                       # Index in the source program
+    operands: List[Tuple[str, SSAValue]] = field(default_factory=list)   # (field, value)
+    results: List[Tuple[str, SSAValue]] = field(default_factory=list)
+
+    @property
+    def opcode(self) -> str:
+        return self.instr.opcode
+
+    def used_values(self) -> List[SSAValue]:
+        return [v for _, v in self.operands]
+
+    def defined_values(self) -> List[SSAValue]:
+        return [v for _, v in self.results]
+
+    def __repr__(self) -> str:
+        lhs = ", ".join(repr(v) for v in self.defined_values())
+        rhs = ", ".join(repr(v) for v in self.used_values())
+        return f"{lhs + ' = ' if lhs else ''}{self.opcode} {rhs}".rstrip()
+
+
+@dataclass(eq=False)
+class SSAPhi:
+    """Merge of a variable's values on entry to a block."""
+    var: str
+    block: 'BasicBlock'
+    result: Optional[SSAValue] = None
+    incoming: List[Tuple['BasicBlock', SSAValue]] = field(default_factory=list)
+
+    def used_values(self) -> List[SSAValue]:
+        return [v for _, v in self.incoming]
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"[bb{b.id}: {v!r}]" for b, v in self.incoming)
+        return f"{self.result!r} = phi {args}"
+
+
+@dataclass(eq=False)
+class BasicBlock:
+    """A straight-line sequence of ops with phis at its entry."""
+    id: int
+    kind: str                                        # entry, loop_header, loop_body, ...
+    start: int                                       # Index of the first instruction
+    ops: List[SSAOp] = field(default_factory=list)
+    phis: List[SSAPhi] = field(default_factory=list)
+    preds: List['BasicBlock'] = field(default_factory=list)
+    succs: List['BasicBlock'] = field(default_factory=list)
+
+    def __repr__(self) -> str:
+        return f"bb{self.id}"
+
+
+class SSAFunction:
+    """A PTOProgram in SSA form."""
+
+    def __init__(self, program: PTOProgram):
+        self.program = program
+        self.blocks: List[BasicBlock] = []
+        self.inputs: Dict[str, SSAValue] = {}
+        self.values: List[SSAValue] = []
+
+    @property
+    def name(self) -> str:
+        return self.program.name
+
+    def ops(self) -> Iterator[SSAOp]:
+        """All ops in program order."""
+        for block in self.blocks:
+            yield from block.ops
+
+    def replace_all_uses(self, old: SSAValue, new: SSAValue):
+        """Redirect every use of `old` to `new`."""
+        if old is new:
+            return
+        for user in old.uses:
+            if isinstance(user, SSAPhi):
+                user.incoming = [(b, new if v is old else v) for b, v in user.incoming]
+            else:
+                user.operands = [(f, new if v is old else v) for f, v in user.operands]
+            new.uses.append(user)
+        old.uses = []
+
+    def remove_op(self, op: SSAOp):
+        """Delete an op whose results are unused."""
+        for value in op.defined_values():
+            if value.uses:
+                raise ValidationError(f"Cannot remove {op!r}: {value!r} is still used")
+        for value in op.used_values():
+            value.uses = [u for u in value.uses if u is not op]
+        op.block.ops.remove(op)
+        dead = set(map(id, op.defined_values()))
+        self.values = [v for v in self.values if id(v) not in dead]
+
+    def dump(self) -> str:
+        """Human-readable listing of the SSA form."""
+        lines = [f"ssa @{self.name}"]
+        if self.inputs:
+            lines.append("  inputs: " + ", ".join(repr(v) for v in self.inputs.values()))
+        for block in self.blocks:
+            preds = ", ".join(repr(p) for p in block.preds)
+            lines.append(f"{block!r} ({block.kind}){'  preds: ' + preds if preds else ''}:")
+            for phi in block.phis:
+                lines.append(f"  {phi!r}")
+            for op in block.ops:
+                lines.append(f"  {op!r}")
+        return "\n".join(lines)
+
+    def to_program(self) -> PTOProgram:
+        return lower_ssa(self)
+
+
+# =============================================================================
+# Instruction Operands
+# =============================================================================
+
+def _call_arg_names(arg) -> List[str]:
+    """Variable names referenced by one CALL argument (tensor and offsets)."""
+    items = arg if isinstance(arg, tuple) else (arg,)
+    return [item for item in items if isinstance(item, str) and item.isidentifier()]
+
+
+def instruction_operands(instr, program: PTOProgram) -> Tuple[List[Tuple[str, str, str]],
+                                                              List[Tuple[str, str, str]]]:
+    """
+    Variables read and written by an instruction as (field, name, kind) tuples.
+
+    Stores and calls update memory in place, so a written memref is also read.
+    """
+    uses: List[Tuple[str, str, str]] = []
+    defs: List[Tuple[str, str, str]] = []
+
+    if getattr(instr, 'opcode', '') == 'CALL':
+        for param, arg in instr.args.items():
+            for pos, name in enumerate(_call_arg_names(arg)):
+                if name in program.memref_declarations:
+                    uses.append((f"args.{param}", name, 'memref'))
+                    if pos == 0:
+                        defs.append((f"args.{param}", name, 'memref'))
+                elif name in program.scalar_declarations:
+                    uses.append((f"args.{param}", name, 'scalar'))
+        return uses, defs
+
+    if not hasattr(instr, '__dataclass_fields__'):
+        return uses, defs
+
+    for f in fields(instr):
+        kind = _operand_kind(getattr(instr, f.name))
+        if kind is None:
+            continue
+        name = getattr(instr, f.name).name
+        if f.name in DEF_FIELDS:
+            if kind == 'memref':
+                uses.append((f.name, name, kind))
+            defs.append((f.name, name, kind))
+        else:
+            uses.append((f.name, name, kind))
+    return uses, defs
+
+
+def _rename_operand(instr, field_name: str, old: str, new: str):
+    """Return a copy of `instr` whose operand in `field_name` refers to `new`."""
+    if field_name.startswith("args."):
+        param = field_name[len("args."):]
+        arg = instr.args[param]
+        if isinstance(arg, tuple):
+            arg = tuple(new if item == old else item for item in arg)
+        else:
+            arg = new if arg == old else arg
+        return replace(instr, args={**instr.args, param: arg})
+    return replace(instr, **{field_name: replace(getattr(instr, field_name), name=new)})
+
+
+# =============================================================================
+# SSA Construction
+# =============================================================================
+
+def _block_kind(instructions, start: int) -> str:
+    opcode = instructions[start].opcode
+    prev = instructions[start - 1].opcode if start > 0 else None
+    if start == 0:
+        return 'entry'
+    if opcode in LOOP_HEADER_OPS:
+        return 'loop_header'
+    if opcode in LOOP_END_OPS:
+        return 'loop_latch'
+    if opcode == 'ENDIF':
+        return 'join'
+    if prev in LOOP_HEADER_OPS or prev == 'DO':
+        return 'loop_body'
+    if prev in LOOP_END_OPS:
+        return 'loop_exit'
+    if prev == 'IF':
+        return 'then'
+    if prev == 'ELSE':
+        return 'else'
+    return 'block'
+
+
+class _SSABuilder:
+    """Single-pass SSA construction (Braun et al.)."""
+
+    def __init__(self, program: PTOProgram):
+        self.program = program
+        self.func = SSAFunction(program)
+        self.current_def: Dict[str, Dict[int, SSAValue]] = {}
+        self.incomplete: Dict[int, Dict[str, SSAPhi]] = {}
+        self.sealed: set = set()
+        self.filled: set = set()
+        self.versions: Dict[str, int] = {}
+        self.kinds: Dict[str, str] = {}
+        self.block_ends: List[int] = []
+
+    def build(self) -> SSAFunction:
+        self._build_blocks()
+        for block in self.func.blocks:
+            if not block.preds:
+                self._seal(block)
+        for block in self.func.blocks:
+            self._fill(block)
+            self.filled.add(block.id)
+            for succ in block.succs:
+                if succ.id not in self.sealed and all(p.id in self.filled for p in succ.preds):
+                    self._seal(succ)
+        return self.func
+
+    def _build_blocks(self):
+        instructions = self.program.instructions
+        n = len(instructions)
+        if n == 0:
+            return
+        succs, _ = build_control_flow_graph(instructions)
+
+        leaders = {0}
+        for i, targets in enumerate(succs):
+            if targets != [i + 1]:
+                leaders.update(t for t in targets)
+                if i + 1 < n:
+                    leaders.add(i + 1)
+            opcode = instructions[i].opcode
+            if opcode in LOOP_HEADER_OPS or opcode in LOOP_END_OPS or opcode == 'ENDIF':
+                leaders.add(i)
+
+        starts = sorted(leaders)
+        block_of = [0] * n
+        self.block_ends = starts[1:] + [n]
+        for b, start in enumerate(starts):
+            self.func.blocks.append(BasicBlock(id=b, kind=_block_kind(instructions, start), start=start))
+            for i in range(start, self.block_ends[b]):
+                block_of[i] = b
+
+        for b, block in enumerate(self.func.blocks):
+            for t in succs[self.block_ends[b] - 1]:
+                succ = self.func.blocks[block_of[t]]
+                if succ not in block.succs:
+                    block.succs.append(succ)
+                    succ.preds.append(block)
+
+    # -- Variables -------------------------------------------------------------
+
+    def _new_value(self, var: str, kind: str, def_op=None) -> SSAValue:
+        self.kinds.setdefault(var, kind)
+        self.versions[var] = self.versions.get(var, 0) + 1
+        value = SSAValue(var=var, version=self.versions[var], kind=self.kinds[var], def_op=def_op)
+        self.func.values.append(value)
+        return value
+
+    def _input(self, var: str) -> SSAValue:
+        if var not in self.func.inputs:
+            value = SSAValue(var=var, version=0, kind=self.kinds.get(var, 'tile'))
+            self.func.inputs[var] = value
+            self.func.values.append(value)
+        return self.func.inputs[var]
+
+    def _write(self, var: str, block: BasicBlock, value: SSAValue):
+        self.current_def.setdefault(var, {})[block.id] = value
+
+    def _read(self, var: str, block: BasicBlock) -> SSAValue:
+        value = self.current_def.get(var, {}).get(block.id)
+        if value is not None:
+            return value
+        return self._read_recursive(var, block)
+
+    def _read_recursive(self, var: str, block: BasicBlock) -> SSAValue:
+        if block.id not in self.sealed:
+            phi = self._new_phi(var, block)
+            self.incomplete.setdefault(block.id, {})[var] = phi
+            value = phi.result
+        elif not block.preds:
+            value = self._input(var)
+        elif len(block.preds) == 1:
+            value = self._read(var, block.preds[0])
+        else:
+            phi = self._new_phi(var, block)
+            self._write(var, block, phi.result)
+            value = self._add_phi_operands(phi)
+        self._write(var, block, value)
+        return value
+
+    def _new_phi(self, var: str, block: BasicBlock) -> SSAPhi:
+        phi = SSAPhi(var=var, block=block)
+        phi.result = self._new_value(var, self.kinds.get(var, 'tile'), def_op=phi)
+        block.phis.append(phi)
+        return phi
+
+    def _add_phi_operands(self, phi: SSAPhi) -> SSAValue:
+        for pred in phi.block.preds:
+            value = self._read(phi.var, pred)
+            phi.incoming.append((pred, value))
+            value.uses.append(phi)
+        return self._try_remove_trivial_phi(phi)
+
+    def _try_remove_trivial_phi(self, phi: SSAPhi) -> SSAValue:
+        same = None
+        for _, value in phi.incoming:
+            if value is same or value is phi.result:
+                continue
+            if same is not None:
+                return phi.result
+            same = value
+        if same is None:
+            same = self._input(phi.var)
+
+        users = [u for u in phi.result.uses if u is not phi]
+        for _, value in phi.incoming:
+            while phi in value.uses:
+                value.uses.remove(phi)
+        phi.result.uses = users
+        self.func.replace_all_uses(phi.result, same)
+        for block_id, value in self.current_def.get(phi.var, {}).items():
+            if value is phi.result:
+                self.current_def[phi.var][block_id] = same
+        phi.block.phis.remove(phi)
+        self.func.values.remove(phi.result)
+
+        for user in users:
+            if isinstance(user, SSAPhi) and user in user.block.phis:
+                self._try_remove_trivial_phi(user)
+        return same
+
+    def _seal(self, block: BasicBlock):
+        for phi in list(self.incomplete.pop(block.id, {}).values()):
+            self._add_phi_operands(phi)
+        self.sealed.add(block.id)
+
+    # -- Instructions ----------------------------------------------------------
+
+    def _fill(self, block: BasicBlock):
+        instructions = self.program.instructions
+        for idx in range(block.start, self.block_ends[block.id]):
+            instr = instructions[idx]
+            op = SSAOp(instr=instr, block=block, index=idx)
+            uses, defs = instruction_operands(instr, self.program)
+            for field_name, var, kind in uses:
+                self.kinds.setdefault(var, kind)
+                value = self._read(var, block)
+                op.operands.append((field_name, value))
+                value.uses.append(op)
+            for field_name, var, kind in defs:
+                value = self._new_value(var, kind, def_op=op)
+                op.results.append((field_name, value))
+                self._write(var, block, value)
+            block.ops.append(op)
+
+
+def build_ssa(program: PTOProgram) -> SSAFunction:
+    """Convert a PTOProgram to SSA form."""
+    return _SSABuilder(program).build()
+
+
+# =============================================================================
+# Pass Utilities
+# =============================================================================
+
+def var_def_counts(func: SSAFunction) -> Dict[str, int]:
+    """Number of ops defining each variable."""
+    counts: Dict[str, int] = {}
+    for op in func.ops():
+        for value in op.defined_values():
+            counts[value.var] = counts.get(value.var, 0) + 1
+    return counts
+
+
+def value_intact(value: SSAValue, after: SSAOp, at: SSAOp, def_counts: Dict[str, int]) -> bool:
+    """
+    True if `value` still occupies its variable when `at` executes, given
+    that it does at `after` (which must execute before `at`).
+
+    Holds when the variable has no other definition, or when `after` and
+    `at` are in the same block with no definition of the variable between.
+    """
+    own_defs = 1 if isinstance(value.def_op, SSAOp) else 0
+    if def_counts.get(value.var, 0) <= own_defs:
+        return True
+    if after.block is not at.block:
+        return False
+    ops = at.block.ops
+    start, end = ops.index(after), ops.index(at)
+    return start < end and not any(
+        v.var == value.var for op in ops[start + 1:end] for v in op.defined_values())
+
+
+def can_replace_uses(old: SSAValue, new: SSAValue, after: SSAOp,
+                     def_counts: Dict[str, int]) -> bool:
+    """True if every use of `old` can read `new` instead without a copy."""
+    return all(isinstance(user, SSAOp) and value_intact(new, after, user, def_counts)
+               for user in old.uses)
+
+
+def drop_unreferenced_tiles(original: PTOProgram, optimized: PTOProgram):
+    """Remove declarations of tiles an optimization no longer references."""
+    def referenced(program):
+        names = set()
+        for instr in program.instructions:
+            for _, name, kind in sum(instruction_operands(instr, program), []):
+                if kind == 'tile':
+                    names.add(name)
+        return names
+
+    for name in referenced(original) - referenced(optimized):
+        optimized.tile_declarations.pop(name, None)
+
+
+# =============================================================================
+# Lowering (out of SSA)
+# =============================================================================
+
+def _declare_copy(program: PTOProgram, value: SSAValue) -> str:
+    """Declare a fresh variable holding a copy of `value`."""
+    name = f"{value.var}_ssa{value.version}"
+    if value.kind == 'tile':
+        program.tile_declarations[name] = program.tile_declarations[value.var]
+    elif value.kind in ('scalar', 'index') and value.var in program.scalar_declarations:
+        program.scalar_declarations[name] = program.scalar_declarations[value.var]
+    elif value.kind == 'memref':
+        raise ValidationError(f"Cannot copy memory state {value!r}")
+    return name
+
+
+def _copy_instr(program: PTOProgram, dst: str, src: str, kind: str) -> PTOInstruction:
+    if kind == 'tile':
+        tile_type = program.tile_declarations[src]
+        return TMOV(dst=TileOperand(dst, tile_type), src=TileOperand(src, tile_type),
+                    mode=TMovMode.V2V)
+    if kind == 'memref':
+        raise ValidationError(f"Cannot copy memory state of {src}")
+    dtype = program.scalar_declarations.get(src)
+    return SMOV(dst=ScalarOperand(dst, dtype), src=ScalarOperand(src, dtype))
+
+
+def _entry_states(func: SSAFunction, exit_states: Dict[int, Dict[str, SSAValue]],
+                  block: BasicBlock) -> Dict[str, SSAValue]:
+    """Variable -> value on entry to `block`, from its forward predecessors."""
+    for pred in block.preds:
+        if pred.start < block.start and pred.id in exit_states:
+            state = dict(exit_states[pred.id])
+            break
+    else:
+        state = {}
+    for phi in block.phis:
+        state[phi.var] = phi.result
+    return state
+
+
+def _current(state: Dict[str, SSAValue], func: SSAFunction, var: str) -> Optional[SSAValue]:
+    return state.get(var, func.inputs.get(var))
+
+
+def lower_ssa(func: SSAFunction) -> PTOProgram:
+    """
+    Convert an SSA function back to a PTOProgram.
+
+    Phis are dropped (all incoming values share the phi's variable unless a
+    pass redirected them, in which case a copy is placed at the end of the
+    predecessor). Operands redirected to a value whose variable has since
+    been overwritten read a copy taken right after the value's definition.
+    """
+    src = func.program
+    program = replace(
+        src,
+        tile_declarations=dict(src.tile_declarations),
+        scalar_declarations=dict(src.scalar_declarations),
+        memref_declarations=dict(src.memref_declarations),
+        intermediate_buffers=dict(src.intermediate_buffers),
+        metadata=dict(src.metadata),
+        imports=list(src.imports),
+        instructions=[],
+    )
+
+    # Pass 1: find redirected operands whose variable is clobbered at the use
+    need_copy: Dict[int, SSAValue] = {}
+    exit_states: Dict[int, Dict[str, SSAValue]] = {}
+    for block in func.blocks:
+        state = _entry_states(func, exit_states, block)
+        for op in block.ops:
+            for _, value in op.operands:
+                if _current(state, func, value.var) is not value:
+                    need_copy[id(value)] = value
+            for _, value in op.results:
+                state[value.var] = value
+        exit_states[block.id] = state
+
+    copy_names = {vid: _declare_copy(program, v) for vid, v in need_copy.items()}
+
+    # Phi inputs redirected to another variable: copy at the end of the predecessor
+    pred_copies: Dict[int, List[Tuple[str, SSAValue]]] = {}
+    for block in func.blocks:
+        for phi in block.phis:
+            for pred, value in phi.incoming:
+                current = _current(exit_states.get(pred.id, {}), func, phi.var)
+                if value.var == phi.var and current is value:
+                    continue
+                if pred.ops and pred.ops[-1].opcode in LOOP_HEADER_OPS + ('IF', 'DO'):
+                    raise ValidationError(
+                        f"Cannot place copy for {phi!r} on the edge {pred!r} -> {block!r}")
+                pred_copies.setdefault(pred.id, []).append((phi.var, value))
+
+    def emit_copies_of(values):
+        for value in values:
+            if id(value) in copy_names:
+                program.instructions.append(
+                    _copy_instr(program, copy_names[id(value)], value.var, value.kind))
+
+    # Pass 2: emit
+    emit_copies_of(func.inputs.values())
+    for block in func.blocks:
+        emit_copies_of([phi.result for phi in block.phis])
+        for pos, op in enumerate(block.ops):
+            is_last = pos == len(block.ops) - 1
+            if is_last and op.opcode in _BLOCK_END_OPS:
+                _emit_phi_copies(program, pred_copies.get(block.id, []), copy_names)
+            instr = op.instr
+            original = instruction_operands(op.instr, func.program)[0]
+            for (field_name, value), (_, old_name, _) in zip(op.operands, original):
+                new_name = copy_names.get(id(value), value.var)
+                if new_name != old_name:
+                    instr = _rename_operand(instr, field_name, old_name, new_name)
+            program.instructions.append(instr)
+            emit_copies_of(op.defined_values())
+            if is_last and op.opcode not in _BLOCK_END_OPS:
+                _emit_phi_copies(program, pred_copies.get(block.id, []), copy_names)
+
+    return program
+
+
+def _emit_phi_copies(program: PTOProgram, copies: List[Tuple[str, SSAValue]],
+                     copy_names: Dict[int, str]):
+    for var, value in copies:
+        src_name = copy_names.get(id(value), value.var)
+        program.instructions.append(_copy_instr(program, var, src_name, value.kind))
+
+
+__all__ = [
+    'SSAValue', 'SSAOp', 'SSAPhi', 'BasicBlock', 'SSAFunction',
+    'build_ssa', 'lower_ssa', 'instruction_operands',
+    'var_def_counts', 'value_intact', 'can_replace_uses', 'drop_unreferenced_tiles',
+]
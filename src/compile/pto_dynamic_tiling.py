@@ -8,13 +8,21 @@ Tile Shape Computation Rules:
 2) row should be multiple of PHYSICAL_ROW_SIZE
 3) byte size of the TILE should be no greater than 16KB
 
+Shapes found by the auto-tuner (pto_tiling_autotune.py) are stored in a
+persistent tuning database. compute_tile_shape() consults it only when asked
+to (use_tuning_db=True) or when $PTO_TUNING_DB names a database, so codegen
+output never depends on a machine-local cache file by default.
+
 The module provides:
 - compute_tile_shape(): Calculate optimal tile shape for given dtype and ISA
+- TileTuningDatabase: Persistent (op, dtype, target) -> tile shape store
 - DynamicTiledProgram: Helper class to build programs with dynamic tiling
 """
 
+import json
 import os
 import sys
+import tempfile
 
 # Ensure src directory is in path for relative imports
 _current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -33,6 +41,7 @@ from isa_definition.pto_isa_definition import (
 # Re-export ISA constants for convenience
 __all__ = [
     'compute_tile_shape', 'get_tile_info', 'DynamicTiledProgram',
+    'TileTuningDatabase', 'get_tuning_database', 'TUNING_DB_ENV',
     'build_unary_op', 'build_binary_op', 'build_scalar_op',
     'print_tile_shapes',
     'MAX_TILE_BYTES', 'ELEMENT_BYTES', 'DEFAULT_DTYPE',
@@ -64,16 +73,100 @@ ELEMENT_BYTES = {
 # Default data type
 DEFAULT_DTYPE = ElementType.F32
 
+# Environment variable overriding the tuning database location
+TUNING_DB_ENV = "PTO_TUNING_DB"
+
+# Default tuning database location
+DEFAULT_TUNING_DB = os.path.join(os.path.expanduser("~"), ".cache", "pto", "tile_tuning.json")
+
+
+# =============================================================================
+# Tuning Database
+# =============================================================================
+
+class TileTuningDatabase:
+    """
+    Persistent store of tuned tile shapes keyed by (op, dtype, target).
+    
+    The file is JSON:
+        {"version": 1, "entries": {"relu|f32|arm64": {"rows": 8, "cols": 1024, ...}}}
+    Writes are atomic (temp file + rename).
+    """
+    
+    FORMAT_VERSION = 1
+    
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.entries = {}
+        self._load()
+    
+    @staticmethod
+    def key(op: str, dtype: ElementType, target_isa: str) -> str:
+        return f"{op}|{dtype.value}|{target_isa}"
+    
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == self.FORMAT_VERSION:
+            self.entries = data.get("entries", {})
+    
+    def lookup(self, op: str, dtype: ElementType, target_isa: str):
+        """Tuned (rows, cols), or None."""
+        entry = self.entries.get(self.key(op, dtype, target_isa))
+        if entry is None:
+            return None
+        return entry["rows"], entry["cols"]
+    
+    def record(self, op: str, dtype: ElementType, target_isa: str,
+               rows: int, cols: int, **details):
+        """Store the tuned shape and save the database."""
+        self.entries[self.key(op, dtype, target_isa)] = dict(rows=rows, cols=cols, **details)
+        self.save()
+    
+    def save(self):
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": self.FORMAT_VERSION, "entries": self.entries},
+                          f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+_TUNING_DBS = {}
+
+
+def get_tuning_database(path: str = None) -> TileTuningDatabase:
+    """Tuning database at `path`, $PTO_TUNING_DB, or the default location."""
+    path = os.path.abspath(path or os.environ.get(TUNING_DB_ENV) or DEFAULT_TUNING_DB)
+    if path not in _TUNING_DBS:
+        _TUNING_DBS[path] = TileTuningDatabase(path)
+    return _TUNING_DBS[path]
+
 
 # =============================================================================
 # Tile Shape Computation
 # =============================================================================
 
 def compute_tile_shape(dtype: ElementType = ElementType.F32, 
-                       target_isa: str = "arm64") -> tuple:
+                       target_isa: str = "arm64",
+                       op: str = None,
+                       use_tuning_db: bool = None) -> tuple:
     """
     Compute optimal tile shape based on data type and target ISA.
     
+    When the tuning database is enabled, a shape tuned for (op, dtype,
+    target_isa) takes precedence (op None looks up the generic "*" entry).
+    Otherwise:
+    
     Rules:
     1) col should be multiples of VECTOR_LANES
     2) row should be multiple of PHYSICAL_ROW_SIZE
@@ -82,27 +175,22 @@ def compute_tile_shape(dtype: ElementType = ElementType.F32,
     Args:
         dtype: Element data type
         target_isa: Target ISA ("arm64", "cuda", "ascend_a2a3", "ascend_a5")
+        op: Operation the tile is used for (tuning database key)
+        use_tuning_db: Consult the tuning database. None (default) consults it
+                       only when $PTO_TUNING_DB is set; False always applies
+                       the fixed rules
     
     Returns:
         (rows, cols) tuple
     """
-    dtype_str = dtype.value
-    
-    # Get ISA-specific parameters
-    if target_isa == "arm64":
-        vector_lanes = ARM64_VECTOR_LANES.get(dtype_str, 4)
-        physical_row_size = ARM64_PHYSICAL_ROW_SIZE
-    elif target_isa == "cuda":
-        vector_lanes = CUDA_VECTOR_LANES.get(dtype_str, 4)
-        physical_row_size = CUDA_PHYSICAL_ROW_SIZE
-    elif target_isa in ("ascend_a2a3", "ascend_a5", "ascend910b"):
-        vector_lanes = ASCEND_VECTOR_LANES.get(dtype_str, 8)
-        physical_row_size = ASCEND_PHYSICAL_ROW_SIZE
-    else:
-        # Default to ARM64
-        vector_lanes = ARM64_VECTOR_LANES.get(dtype_str, 4)
-        physical_row_size = ARM64_PHYSICAL_ROW_SIZE
-    
+    if use_tuning_db is None:
+        use_tuning_db = bool(os.environ.get(TUNING_DB_ENV))
+    if use_tuning_db:
+        tuned = get_tuning_database().lookup(op or "*", dtype, target_isa)
+        if tuned is not None:
+            return tuned
+    
+    vector_lanes, physical_row_size = get_isa_tiling_params(dtype, target_isa)
     element_bytes = ELEMENT_BYTES.get(dtype, 4)
     
     # Maximum elements that fit in 16KB
@@ -134,15 +222,37 @@ def compute_tile_shape(dtype: ElementType = ElementType.F32,
     return best_rows, best_cols
 
 
+def get_isa_tiling_params(dtype: ElementType, target_isa: str) -> tuple:
+    """(vector_lanes, physical_row_size) of a target ISA for a data type."""
+    dtype_str = dtype.value
+    
+    # Get ISA-specific parameters
+    if target_isa == "arm64":
+        vector_lanes = ARM64_VECTOR_LANES.get(dtype_str, 4)
+        physical_row_size = ARM64_PHYSICAL_ROW_SIZE
+    elif target_isa == "cuda":
+        vector_lanes = CUDA_VECTOR_LANES.get(dtype_str, 4)
+        physical_row_size = CUDA_PHYSICAL_ROW_SIZE
+    elif target_isa in ("ascend_a2a3", "ascend_a5", "ascend910b"):
+        vector_lanes = ASCEND_VECTOR_LANES.get(dtype_str, 8)
+        physical_row_size = ASCEND_PHYSICAL_ROW_SIZE
+    else:
+        # Default to ARM64
+        vector_lanes = ARM64_VECTOR_LANES.get(dtype_str, 4)
+        physical_row_size = ARM64_PHYSICAL_ROW_SIZE
+    
+    return vector_lanes, physical_row_size
+
+
 def get_tile_info(dtype: ElementType = ElementType.F32,
-                  target_isa: str = "arm64") -> dict:
+                  target_isa: str = "arm64", op: str = None) -> dict:
     """
     Get tile information including shape and element count.
     
     Returns:
         dict with 'rows', 'cols', 'elements', 'bytes'
     """
-    rows, cols = compute_tile_shape(dtype, target_isa)
+    rows, cols = compute_tile_shape(dtype, target_isa, op)
     elements = rows * cols
     bytes_size = elements * ELEMENT_BYTES.get(dtype, 4)
     return {
@@ -166,7 +276,8 @@ class DynamicTiledProgram:
     - Tail tile handling for non-aligned tensor sizes
     
     Example usage:
-        builder = DynamicTiledProgram("my_relu", dtype=ElementType.F32, target_isa="arm64")
+        builder = DynamicTiledProgram("my_relu", dtype=ElementType.F32, target_isa="arm64",
+                                      op="relu")
         builder.add_input("input")
         builder.add_output("output")
         builder.add_tile("x")
@@ -183,11 +294,12 @@ class DynamicTiledProgram:
     """
     
     def __init__(self, name: str, dtype: ElementType = ElementType.F32, 
-                 target_isa: str = "arm64"):
+                 target_isa: str = "arm64", op: str = None):
         self.name = name
         self.dtype = dtype
         self.target_isa = target_isa
-        self.rows, self.cols = compute_tile_shape(dtype, target_isa)
+        self.op = op  # Tuning database key (None: generic shape)
+        self.rows, self.cols = compute_tile_shape(dtype, target_isa, op)
         self.tile_elements = self.rows * self.cols
         
         self.inputs = []  # List of input memref names
@@ -286,7 +398,7 @@ def build_unary_op(name: str, op_method: str, dtype: ElementType = ElementType.F
     Returns:
         PTOProgram
     """
-    rows, cols = compute_tile_shape(dtype, target_isa)
+    rows, cols = compute_tile_shape(dtype, target_isa, op_method)
     tile_elements = rows * cols
     
     builder = (PTOFunctionBuilder(name)
@@ -337,7 +449,7 @@ def build_binary_op(name: str, op_method: str, dtype: ElementType = ElementType.
     Returns:
         PTOProgram
     """
-    rows, cols = compute_tile_shape(dtype, target_isa)
+    rows, cols = compute_tile_shape(dtype, target_isa, op_method)
     tile_elements = rows * cols
     
     builder = (PTOFunctionBuilder(name)
@@ -393,7 +505,7 @@ def build_scalar_op(name: str, op_method: str, scalar_value: float,
     Returns:
         PTOProgram
     """
-    rows, cols = compute_tile_shape(dtype, target_isa)
+    rows, cols = compute_tile_shape(dtype, target_isa, op_method)
     tile_elements = rows * cols
     
     builder = (PTOFunctionBuilder(name)
@@ -0,0 +1,396 @@
+"""
+PTO Dynamic Tiling - Measured Tile Shape Auto-Tuner
+
+compute_tile_shape() picks the largest tile that fits a fixed 16KB budget.
+That is a safe default, but memory-bound ops often run faster with larger
+tiles (fewer loop trips, longer bursts) and some targets prefer other aspect
+ratios. This module searches the legal shapes for a DynamicTiledProgram,
+benchmarks each candidate and records the winner in the tuning database
+(consulted by compute_tile_shape(use_tuning_db=True) or when $PTO_TUNING_DB
+is set).
+
+Legal Shapes:
+=============
+1) cols is a multiple of the ISA's vector lanes
+2) rows is a multiple of the ISA's physical row size
+3) the program's tiles fit the target's on-chip buffer (TileBufferAnalyzer),
+   and a single tile is at most `max_tile_bytes`
+
+Benchmarks:
+===========
+- "arm64":  Generated ARM64 NEON code compiled with the host C compiler and
+            timed in a small harness. Needs an ARM64 host (arm_neon.h).
+- any callable benchmark(program, bindings) -> cost (lower is better),
+  e.g. a wrapper timing the kernel on the device
+- "model":  HEURISTIC, not a measurement: static cycle estimate on the A2/A3
+            simulator cost table (pto_compile_perf). The model charges a fixed
+            cost per loop trip, so it favors the largest legal tile; use it to
+            sanity-check the search, not to pick shapes. Its winners are not
+            recorded unless tune(record=True) is passed explicitly.
+
+Usage:
+======
+    dtp = DynamicTiledProgram("relu_f32", op="relu")
+    dtp.add_input("input").add_output("output").add_tile("x").add_tile("result")
+    result = TileShapeTuner(benchmark="arm64").tune(dtp, compute)
+    print(result.report())
+    # Later: compute_tile_shape(ElementType.F32, "arm64", op="relu", use_tuning_db=True) -> result.best
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# Add parent directories to path for imports
+_current_dir = os.path.dirname(os.path.abspath(__file__))
+_src_dir = os.path.dirname(_current_dir)
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from compile.pto_compile_common import PTOProgram, TileBufferAnalyzer, CompilerError
+from compile.pto_dynamic_tiling import (
+    DynamicTiledProgram, TileTuningDatabase, get_tuning_database,
+    get_isa_tiling_params, compute_tile_shape, ELEMENT_BYTES, MAX_TILE_BYTES,
+)
+from isa_definition.pto_isa_definition import ElementType
+
+
+# Default problem size (elements) the candidates are benchmarked on
+DEFAULT_PROBLEM_ELEMENTS = 1 << 22
+
+
+# =============================================================================
+# Candidate Enumeration
+# =============================================================================
+
+def enumerate_tile_shapes(dtype: ElementType = ElementType.F32,
+                          target_isa: str = "arm64",
+                          max_tile_bytes: int = 4 * MAX_TILE_BYTES) -> List[Tuple[int, int]]:
+    """
+    Enumerate legal (rows, cols) tile shapes for a data type and target ISA.
+
+    Rows are power-of-two multiples of the physical row size and cols are
+    power-of-two multiples of the vector lanes, up to `max_tile_bytes` per tile.
+    """
+    vector_lanes, physical_row_size = get_isa_tiling_params(dtype, target_isa)
+    element_bytes = ELEMENT_BYTES.get(dtype, 4)
+    max_elements = max_tile_bytes // element_bytes
+
+    shapes = []
+    rows = physical_row_size
+    while rows * vector_lanes <= max_elements:
+        cols = vector_lanes
+        while rows * cols <= max_elements:
+            shapes.append((rows, cols))
+            cols *= 2
+        rows *= 2
+    return shapes
+
+
+def fits_target(program: PTOProgram, target_isa: str) -> bool:
+    """True if the program's tiles fit the target's on-chip buffer."""
+    analyzer = TileBufferAnalyzer(program, target=target_isa, check_capacity=False)
+    return analyzer.analyze()['fits_capacity']
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+
+class BenchmarkUnavailable(CompilerError):
+    """Raised when a benchmark cannot run in this environment."""
+    pass
+
+
+def model_benchmark(program: PTOProgram, bindings: Dict[str, int]) -> float:
+    """
+    Estimated cycles on the A2/A3 cost table (engine/scalar overlap).
+
+    A heuristic, not a measurement: it favors the largest legal tile.
+    """
+    from compile.pto_compile_perf import estimate_program
+
+    return estimate_program(program, bindings=bindings).overlapped_cycles
+
+
+# Cost model, not a measurement (see TileShapeTuner.measured)
+model_benchmark.measured = False
+
+
+_ARM64_SIGNATURE = re.compile(r"^void\s+(\w+)\(([^)]*)\)\s*\{", re.MULTILINE)
+
+_ARM64_HARNESS = """
+#include <time.h>
+
+int main(void) {{
+{allocations}
+    struct timespec t0, t1;
+    for (int i = 0; i < {warmup}; i++) {func}({args});
+    clock_gettime(CLOCK_MONOTONIC, &t0);
+    for (int i = 0; i < {repeats}; i++) {func}({args});
+    clock_gettime(CLOCK_MONOTONIC, &t1);
+    double ns = (t1.tv_sec - t0.tv_sec) * 1e9 + (t1.tv_nsec - t0.tv_nsec);
+    printf("%.1f\\n", ns / {repeats});
+    return 0;
+}}
+"""
+
+
+class ARM64Benchmark:
+    """
+    Wall-clock benchmark of generated ARM64 NEON code.
+
+    The generated function is compiled together with a timing harness that
+    allocates its memrefs (one extra tile for the tail path) and binds the
+    tiling scalars; the result is the mean time per call in nanoseconds.
+    """
+
+    measured = True
+
+    def __init__(self, compiler: Optional[str] = None, cflags: Optional[List[str]] = None,
+                 warmup: int = 2, repeats: int = 10, timeout: int = 120):
+        self.compiler = compiler or os.environ.get("CC", "cc")
+        self.cflags = cflags if cflags is not None else ["-O2"]
+        self.warmup = warmup
+        self.repeats = repeats
+        self.timeout = timeout
+
+    def check_available(self):
+        """Raise BenchmarkUnavailable if generated NEON code cannot be built here."""
+        if platform.machine().lower() not in ("arm64", "aarch64"):
+            raise BenchmarkUnavailable(
+                f"ARM64 benchmark requires an ARM64 host (this is {platform.machine()})")
+        if shutil.which(self.compiler) is None:
+            raise BenchmarkUnavailable(f"C compiler not found: {self.compiler}")
+
+    def harness(self, code: str, bindings: Dict[str, int], buffer_elements: int) -> str:
+        """Append a timing main() to generated code."""
+        match = _ARM64_SIGNATURE.search(code)
+        if match is None:
+            raise CompilerError("No function definition found in generated ARM64 code")
+        func = match.group(1)
+
+        allocations, args = [], []
+        for param in [p.strip() for p in match.group(2).split(",") if p.strip()]:
+            ctype, name = param.rsplit(None, 1)
+            if name.startswith("*"):
+                ctype, name = ctype + "*", name.lstrip("*")
+            if ctype.endswith("*"):
+                base = ctype[:-1].strip()
+                allocations.append(
+                    f"    {base}* {name} = ({base}*)calloc({buffer_elements}, sizeof({base}));")
+            else:
+                allocations.append(f"    {ctype} {name} = {int(bindings.get(name, 0))};")
+            args.append(name)
+
+        # Generated control flow may use `true`
+        return "#include <stdbool.h>\n" + code + _ARM64_HARNESS.format(
+            allocations="\n".join(allocations), func=func, args=", ".join(args),
+            warmup=self.warmup, repeats=self.repeats)
+
+    def __call__(self, program: PTOProgram, bindings: Dict[str, int]) -> float:
+        from compile.pto_codegen_arm64 import ARM64CodeGenerator
+
+        self.check_available()
+        code = ARM64CodeGenerator(analyze_buffers=False).generate(program)
+        tile_elements = bindings["tile_size"]
+        buffer_elements = (bindings["num_full_tiles"] + 1) * tile_elements
+        source = self.harness(code, bindings, buffer_elements)
+
+        with tempfile.TemporaryDirectory(prefix="pto_tune_") as work_dir:
+            src_path = os.path.join(work_dir, f"{program.name}.c")
+            exe_path = os.path.join(work_dir, program.name)
+            with open(src_path, "w") as f:
+                f.write(source)
+            build = subprocess.run(
+                [self.compiler, *self.cflags, src_path, "-o", exe_path, "-lm"],
+                capture_output=True, text=True, timeout=self.timeout)
+            if build.returncode != 0:
+                raise CompilerError(f"Failed to compile {program.name}:\n{build.stderr}")
+            run = subprocess.run([exe_path], capture_output=True, text=True,
+                                 timeout=self.timeout)
+            if run.returncode != 0:
+                raise CompilerError(f"Benchmark {program.name} failed:\n{run.stderr}")
+            return float(run.stdout.strip())
+
+
+BENCHMARKS = {
+    'model': model_benchmark,
+    'arm64': ARM64Benchmark,
+}
+
+
+# =============================================================================
+# Tuner
+# =============================================================================
+
+@dataclass
+class TuningResult:
+    """Benchmark results of one tuning run."""
+    op: str
+    dtype: ElementType
+    target_isa: str
+    benchmark: str
+    default: Tuple[int, int]
+    measured: bool = True
+    candidates: Dict[Tuple[int, int], float] = field(default_factory=dict)
+    skipped: Dict[Tuple[int, int], str] = field(default_factory=dict)
+
+    @property
+    def best(self) -> Tuple[int, int]:
+        """Fastest shape; ties go to the smaller tile."""
+        return min(self.candidates, key=lambda s: (self.candidates[s], s[0] * s[1], s))
+
+    @property
+    def speedup(self) -> Optional[float]:
+        """Speedup of the best shape over the default shape, if measured."""
+        base = self.candidates.get(self.default)
+        best = self.candidates[self.best]
+        return base / best if base and best else None
+
+    def report(self, top: int = 10) -> str:
+        ranked = sorted(self.candidates.items(), key=lambda kv: (kv[1], kv[0][0] * kv[0][1], kv[0]))
+        shown = ranked[:top] + [kv for kv in ranked[top:] if kv[0] == self.default]
+        lines = [
+            f"Tile tuning: {self.op} ({self.dtype.value}, {self.target_isa}, "
+            f"benchmark={self.benchmark})",
+        ]
+        if not self.measured:
+            lines.append("  HEURISTIC: costs are model estimates, not measurements")
+        for shape, cost in shown:
+            marks = []
+            if shape == self.best:
+                marks.append("best")
+            if shape == self.default:
+                marks.append("default")
+            suffix = f"  <- {', '.join(marks)}" if marks else ""
+            lines.append(f"  {shape[0]:>4} x {shape[1]:<6} {cost:>14.1f}{suffix}")
+        if len(ranked) > len(shown):
+            lines.append(f"  ... {len(ranked) - len(shown)} more candidates")
+        if self.skipped:
+            lines.append(f"  Skipped {len(self.skipped)} shapes exceeding the on-chip buffer")
+        if self.speedup is not None:
+            lines.append(f"  Speedup over default: {self.speedup:.2f}x")
+        return "\n".join(lines)
+
+
+class TileShapeTuner:
+    """
+    Benchmarks the legal tile shapes of a DynamicTiledProgram and records the
+    winner per (op, dtype, target) in the tuning database.
+    """
+
+    def __init__(self, benchmark: Union[str, Callable],
+                 database: Optional[TileTuningDatabase] = None,
+                 problem_elements: int = DEFAULT_PROBLEM_ELEMENTS,
+                 max_tile_bytes: int = 4 * MAX_TILE_BYTES):
+        """
+        Args:
+            benchmark: "arm64", a benchmark(program, bindings) -> cost, or
+                       "model" (heuristic estimate; see module docstring).
+                       Callables with `measured = False` are treated as
+                       heuristics too.
+            database: Tuning database to update (default: get_tuning_database())
+            problem_elements: Tensor size (elements) the candidates run on
+            max_tile_bytes: Largest single tile considered
+        """
+        if isinstance(benchmark, str):
+            if benchmark not in BENCHMARKS:
+                raise ValueError(f"Unknown benchmark: {benchmark}. "
+                                 f"Available: {list(BENCHMARKS.keys())}")
+            self.benchmark_name = benchmark
+            self.benchmark = BENCHMARKS[benchmark]
+            if isinstance(self.benchmark, type):
+                self.benchmark = self.benchmark()
+        else:
+            self.benchmark_name = getattr(benchmark, "__name__", type(benchmark).__name__)
+            self.benchmark = benchmark
+        self.measured = getattr(self.benchmark, "measured", True)
+        self.database = database
+        self.problem_elements = problem_elements
+        self.max_tile_bytes = max_tile_bytes
+
+    def bindings(self, tile_elements: int) -> Dict[str, int]:
+        """Values of the tiling scalars of a DynamicTiledProgram."""
+        return {
+            'num_full_tiles': self.problem_elements // tile_elements,
+            'tail_elements': self.problem_elements % tile_elements,
+            'zero': 0,
+            'tile_size': tile_elements,
+        }
+
+    def tune(self, dtp: DynamicTiledProgram, compute_fn,
+             op: Optional[str] = None, record: Optional[bool] = None) -> TuningResult:
+        """
+        Benchmark every legal shape of `dtp` and record the fastest.
+
+        Args:
+            dtp: Program template (its rows/cols are restored afterwards)
+            compute_fn: Tile computation, as passed to DynamicTiledProgram.build()
+            op: Tuning database key (default: dtp.op, then dtp.name)
+            record: Store the winner in the tuning database (default: only
+                    for measured benchmarks)
+        """
+        check = getattr(self.benchmark, "check_available", None)
+        if check is not None:
+            check()
+
+        op = op or dtp.op or dtp.name
+        result = TuningResult(
+            op=op, dtype=dtp.dtype, target_isa=dtp.target_isa,
+            benchmark=self.benchmark_name,
+            default=compute_tile_shape(dtp.dtype, dtp.target_isa, use_tuning_db=False),
+            measured=self.measured,
+        )
+
+        saved = (dtp.rows, dtp.cols, dtp.tile_elements)
+        try:
+            for rows, cols in enumerate_tile_shapes(dtp.dtype, dtp.target_isa,
+                                                    self.max_tile_bytes):
+                dtp.rows, dtp.cols, dtp.tile_elements = rows, cols, rows * cols
+                program = dtp.build(compute_fn)
+                if not fits_target(program, dtp.target_isa):
+                    result.skipped[(rows, cols)] = "exceeds on-chip buffer"
+                    continue
+                result.candidates[(rows, cols)] = self.benchmark(
+                    program, self.bindings(rows * cols))
+        finally:
+            dtp.rows, dtp.cols, dtp.tile_elements = saved
+
+        if not result.candidates:
+            raise CompilerError(f"No legal tile shape for {op} on {dtp.target_isa}")
+
+        if record is None:
+            record = self.measured
+        if record:
+            rows, cols = result.best
+            database = self.database or get_tuning_database()
+            database.record(op, dtp.dtype, dtp.target_isa, rows, cols,
+                            cost=result.candidates[result.best],
+                            benchmark=self.benchmark_name,
+                            measured=self.measured,
+                            problem_elements=self.problem_elements)
+        return result
+
+
+def tune_tile_shape(dtp: DynamicTiledProgram, compute_fn,
+                    benchmark: Union[str, Callable],
+                    op: Optional[str] = None,
+                    database: Optional[TileTuningDatabase] = None,
+                    problem_elements: int = DEFAULT_PROBLEM_ELEMENTS) -> TuningResult:
+    """Tune the tile shape of a DynamicTiledProgram (see TileShapeTuner)."""
+    tuner = TileShapeTuner(benchmark, database, problem_elements)
+    return tuner.tune(dtp, compute_fn, op=op)
+
+
+__all__ = [
+    'enumerate_tile_shapes', 'fits_target', 'model_benchmark', 'ARM64Benchmark',
+    'BenchmarkUnavailable', 'BENCHMARKS', 'TuningResult', 'TileShapeTuner',
+    'tune_tile_shape', 'DEFAULT_PROBLEM_ELEMENTS',
+]